@@ -0,0 +1,101 @@
+'''
+Sensor calibration / identity record at the start of flash (request 0x10)
+(dump_eeprom.py calls it eeprom1)
+
+Layout from capture_pcap.py packets 1213-1218, 0x234 bytes
+Fixed size slots, strings are NUL terminated and padded with 0xFF
+    0x000  AA 55 AA 55 magic
+    0x004  width, LE u32 (0x0542 = 1346, readout is 1344 wide)
+    0x008  height, LE u32 (0x073A = 1850)
+    0x00C  serial number                    "2103231663"
+    0x02C  vendor                           "Fairchild Imaging"
+    0x04C  model / part number              "SL2080302-G2"
+    0x08C  revision                         "Rev NR"
+    0x0AC  date                             "7/17/2012"
+    0x0CC  date time                        "7/17/2012 12:44"
+    0x0EC  vendor again (calibrated by?)    "Fairchild Imaging"
+    0x16C  calibration software             "st5_fccmosd r14.9"
+    0x1EC  ?                                "1"
+    0x1F4  pixel pitch x, um                "19.5000"
+    0x1FC  pixel pitch y, um                "19.5000"
+    0x204  ?                                "0.0000"
+    0x20C  ?                                "75"
+    0x215  ?                                "ST"
+'''
+
+import struct
+
+from util import nulls
+
+SIZE = 0x234
+MAGIC = 0x55AA55AA
+
+# (attribute, offset, type)
+FIELDS = (
+        ('magic',       0x000, 'u32'),
+        ('width',       0x004, 'u32'),
+        ('height',      0x008, 'u32'),
+        ('sn',          0x00C, 'str'),
+        ('vendor',      0x02C, 'str'),
+        ('model',       0x04C, 'str'),
+        ('rev',         0x08C, 'str'),
+        ('date',        0x0AC, 'str'),
+        ('datetime',    0x0CC, 'str'),
+        ('cal_vendor',  0x0EC, 'str'),
+        ('cal_sw',      0x16C, 'str'),
+        ('unk_1ec',     0x1EC, 'str'),
+        ('pitch_x',     0x1F4, 'float'),
+        ('pitch_y',     0x1FC, 'float'),
+        ('unk_204',     0x204, 'str'),
+        ('unk_20c',     0x20C, 'str'),
+        ('unk_215',     0x215, 'str'),
+        )
+
+class CalRecord:
+    def __init__(self, **kwargs):
+        for k, _offset, _t in FIELDS:
+            setattr(self, k, kwargs.get(k))
+
+    @staticmethod
+    def parse(buff):
+        '''Parse a flash image starting at 0, missing or garbled fields are None'''
+        kwargs = {}
+        for k, offset, t in FIELDS:
+            if t == 'u32':
+                if offset + 4 > len(buff):
+                    continue
+                kwargs[k] = struct.unpack('<I', buff[offset:offset + 4])[0]
+                continue
+            if offset >= len(buff):
+                continue
+            s = nulls(buff, offset)
+            # Erased
+            if s.startswith('\xFF'):
+                s = ''
+            if t == 'float':
+                try:
+                    kwargs[k] = float(s)
+                except ValueError:
+                    kwargs[k] = None
+            else:
+                kwargs[k] = s
+        return CalRecord(**kwargs)
+
+    def valid(self):
+        return self.magic == MAGIC
+
+    def pitch_um(self, default=19.5):
+        '''(x, y) pixel pitch in um'''
+        return (self.pitch_x or default, self.pitch_y or default)
+
+    def to_dict(self):
+        return dict((k, getattr(self, k)) for k, _offset, _t in FIELDS)
+
+    def show(self):
+        if not self.valid():
+            print 'Calibration record: invalid (magic %s)' % (None if self.magic is None else '0x%08X' % self.magic,)
+            return
+        print 'Calibration record'
+        for k, _offset, _t in FIELDS:
+            if k != 'magic':
+                print '  %-12s %s' % (k, getattr(self, k))
@@ -7,15 +7,25 @@ import argparse
 from util import open_dev
 import os
 import gxs700
+import usb_prof
+import usb_trace
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Replay captured USB packets')
     parser.add_argument('--verbose', '-v', action='store_true', help='verbose')
     parser.add_argument('--number', '-n', type=int, default=1, help='number to take')
+    parser.add_argument('--prof', action='store_true', help='print USB request latency profile at exit')
+    parser.add_argument('--prof-csv', help='write USB request latency profile to CSV file at exit')
+    parser.add_argument('--burst', action='store_true', help='re-arm right after readout, save/decode images in the background')
+    parser.add_argument('--trace', help='record USB traffic to trace file (see usb_trace.py)')
     args = parser.parse_args()
 
     usbcontext = usb1.USBContext()
     dev = open_dev(usbcontext)
+    if args.prof or args.prof_csv:
+        dev = usb_prof.USBProf(dev, report_at_exit=args.prof, csv_fn=args.prof_csv)
+    if args.trace:
+        dev = usb_trace.USBTrace(dev, args.trace)
     gxs = gxs700.GXS700(usbcontext, dev, verbose=args.verbose)
     
     fn = ''
@@ -26,13 +36,14 @@ if __name__ == "__main__":
         imagen += 1
     print 'Taking first image to %s' % ('capture_%03d.bin' % imagen,)
     
-    def cb(imgb):
+    def cb(imgb, frame_meta):
         global taken
         global imagen
         
         fn = 'capture_%03d.bin' % imagen
         print 'Writing %s' % fn
         open(fn, 'w').write(imgb)
+        frame_meta.save('capture_%03d.json' % imagen)
 
         fn = 'capture_%03d.png' % imagen
         print 'Decoding %s' % fn
@@ -43,4 +54,8 @@ if __name__ == "__main__":
         taken += 1
         imagen += 1
     
-    gxs.cap_binv(args.number, cb)
+    gxs.cap_binv(args.number, cb, burst=args.burst, meta=True)
+    
+    if args.verbose:
+        print 'Sensor state timing'
+        gxs.sm.report()
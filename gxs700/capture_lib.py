@@ -34,6 +34,7 @@ import time
 from util import open_dev
 import os
 import gxs700
+from sensor_sm import STATE_IDLE, STATE_READY
 
 def validate_read(expected, actual, msg, ignore_errors=False):
     if expected != actual:
@@ -401,7 +402,7 @@ def replay_449_768(gxs):
     # Generated from packet 761/762
     #buff = dev.controlRead(0xC0, 0xB0, 0x0020, 0x0000, 1)
     #validate_read("\x01", buff, "packet 761/762", True)
-    if gxs.state() != 1:
+    if gxs.state() != STATE_IDLE:
         print 'WARNING: unexpected state'
     
     # Generated from packet 763/764
@@ -429,7 +430,7 @@ def cleanup(gxs):
     # Generated from packet 1179/1180
     #buff = dev.controlRead(0xC0, 0xB0, 0x0020, 0x0000, 1)
     #validate_read("\x01", buff, "packet 1179/1180")
-    if gxs.state() != 1:
+    if gxs.state() != STATE_IDLE:
         raise Exception('Unexpected state')
     
     # Generated from packet 1181/1182
@@ -441,7 +442,7 @@ def cleanup(gxs):
     # Generated from packet 1183/1184
     #buff = dev.controlRead(0xC0, 0xB0, 0x0020, 0x0000, 1)
     #validate_read("\x01", buff, "packet 1183/1184")
-    if gxs.state() != 1:
+    if gxs.state() != STATE_IDLE:
         raise Exception('Unexpected state')
     
     # Generated from packet 1185/1186
@@ -460,7 +461,7 @@ def cleanup(gxs):
     # Generated from packet 1189/1190
     #buff = dev.controlRead(0xC0, 0xB0, 0x0020, 0x0000, 1)
     #validate_read("\x01", buff, "packet 1189/1190")
-    if gxs.state() != 1:
+    if gxs.state() != STATE_IDLE:
         raise Exception('Unexpected state')
     
     # Generated from packet 1191/1192
@@ -484,7 +485,7 @@ def cleanup(gxs):
     # Generated from packet 1199/1200
     #buff = dev.controlRead(0xC0, 0xB0, 0x0020, 0x0000, 1)
     #validate_read("\x01", buff, "packet 1199/1200")
-    if gxs.state() != 1:
+    if gxs.state() != STATE_IDLE:
         raise Exception('Unexpected state')
     
     # Generated from packet 1201/1202
@@ -496,13 +497,13 @@ def cleanup(gxs):
     # Generated from packet 1203/1204
     #buff = dev.controlRead(0xC0, 0xB0, 0x0020, 0x0000, 1)
     #validate_read("\x01", buff, "packet 1203/1204")
-    if gxs.state() != 1:
+    if gxs.state() != STATE_IDLE:
         raise Exception('Unexpected state')
     
     # Generated from packet 1205/1206
     #buff = dev.controlRead(0xC0, 0xB0, 0x0020, 0x0000, 1)
     #validate_read("\x01", buff, "packet 1205/1206")
-    if gxs.state() != 1:
+    if gxs.state() != STATE_IDLE:
         raise Exception('Unexpected state')
     
     # Generated from packet 1207/1208
@@ -530,13 +531,13 @@ def cleanup(gxs):
     # Generated from packet 1223/1224
     #buff = dev.controlRead(0xC0, 0xB0, 0x0020, 0x0000, 1)
     #validate_read("\x01", buff, "packet 1223/1224")
-    if gxs.state() != 1:
+    if gxs.state() != STATE_IDLE:
         raise Exception('Unexpected state')
 
     # Generated from packet 1225/1226
     #buff = dev.controlRead(0xC0, 0xB0, 0x0020, 0x0000, 1)
     #validate_read("\x01", buff, "packet 1225/1226")
-    if gxs.state() != 1:
+    if gxs.state() != STATE_IDLE:
         raise Exception('Unexpected state')
     
     # Generated from packet 1227/1228
@@ -547,7 +548,7 @@ def cleanup(gxs):
     
     # Generated from packet 1229/1230
     #buff = dev.controlRead(0xC0, 0xB0, 0x0020, 0x0000, 1)
-    if gxs.state() != 1:
+    if gxs.state() != STATE_IDLE:
         raise Exception('Unexpected state')
 
 class USBDbg:
@@ -585,10 +586,10 @@ if __name__ == "__main__":
     #state = get_state(dev)
     state = gxs.state()
     print 'Init state: %d' % state
-    if state == 0x08:
+    if state == STATE_READY:
         print 'Flusing stale capture'
         gxs._cap_frame_bulk()
-    elif state != 0x01:
+    elif state != STATE_IDLE:
         print 'Not idle, refusing to setup'
         sys.exit(1)
 
@@ -628,7 +629,7 @@ if __name__ == "__main__":
     # Generated from packet 779/780
     #buff = dev.controlRead(0xC0, 0xB0, 0x0020, 0x0000, 1)
     #validate_read("\x01", buff, "packet 779/780", True)
-    if gxs.state() != 1:
+    if gxs.state() != STATE_IDLE:
         print 'WARNING: unexpected state'
 
     # Generated from packet 781/782
@@ -660,7 +661,7 @@ if __name__ == "__main__":
     # Generated from packet 797/798
     #buff = dev.controlRead(0xC0, 0xB0, 0x0020, 0x0000, 1)
     #validate_read("\x01", buff, "packet 797/798", True)
-    if gxs.state() != 1:
+    if gxs.state() != STATE_IDLE:
         raise Exception('Unexpected state')
     
     # Generated from packet 799/800
@@ -692,7 +693,7 @@ if __name__ == "__main__":
     # Generated from packet 815/816
     #buff = dev.controlRead(0xC0, 0xB0, 0x0020, 0x0000, 1)
     #validate_read("\x01", buff, "packet 815/816", True)
-    if gxs.state() != 1:
+    if gxs.state() != STATE_IDLE:
         raise Exception('Unexpected state')
     
     # Generated from packet 817/818
@@ -710,7 +711,7 @@ if __name__ == "__main__":
     # Generated from packet 823/824
     #buff = dev.controlRead(0xC0, 0xB0, 0x0020, 0x0000, 1)
     #validate_read("\x01", buff, "packet 823/824", True)
-    if gxs.state() != 1:
+    if gxs.state() != STATE_IDLE:
         raise Exception('Unexpected state')
     
     # Generated from packet 825/826
@@ -722,7 +723,7 @@ if __name__ == "__main__":
     # Generated from packet 827/828
     #buff = dev.controlRead(0xC0, 0xB0, 0x0020, 0x0000, 1)
     #validate_read("\x01", buff, "packet 827/828", True)
-    if gxs.state() != 1:
+    if gxs.state() != STATE_IDLE:
         raise Exception('Unexpected state')
     
     
@@ -755,7 +756,7 @@ if __name__ == "__main__":
     # Generated from packet 831/832
     #buff = dev.controlRead(0xC0, 0xB0, 0x0020, 0x0000, 1)
     #validate_read("\x01", buff, "packet 831/832", True)
-    if gxs.state() != 1:
+    if gxs.state() != STATE_IDLE:
         raise Exception('Unexpected state')
     
     # Generated from packet 833/834
@@ -778,7 +779,7 @@ if __name__ == "__main__":
     # Generated from packet 839/840
     #buff = dev.controlRead(0xC0, 0xB0, 0x0020, 0x0000, 1)
     #validate_read("\x01", buff, "packet 839/840", True)
-    if gxs.state() != 1:
+    if gxs.state() != STATE_IDLE:
         raise Exception('Unexpected state')
     
     # Generated from packet 841/842
@@ -816,7 +817,7 @@ if __name__ == "__main__":
     # Generated from packet 859/860
     #buff = dev.controlRead(0xC0, 0xB0, 0x0020, 0x0000, 1)
     #validate_read("\x01", buff, "packet 859/860", True)
-    if gxs.state() != 1:
+    if gxs.state() != STATE_IDLE:
         raise Exception('Unexpected state')
     
     fn = ''
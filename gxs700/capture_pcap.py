@@ -33,6 +33,7 @@ import argparse
 import time
 from util import open_dev
 import os
+from sensor_sm import SensorSM, STATE_IDLE, STATE_READY, state_str
 
 def validate_read(expected, actual, msg, ignore_errors=False):
     if expected != actual:
@@ -589,10 +590,10 @@ if __name__ == "__main__":
 
     state = get_state(dev)
     print 'Init state: %d' % state
-    if state == 0x08:
+    if state == STATE_READY:
         print 'Flusing stale capture'
         capture_frame(dev)
-    elif state != 0x01:
+    elif state != STATE_IDLE:
         print 'Not idle, refusing to setup'
         sys.exit(1)
 
@@ -752,6 +753,7 @@ if __name__ == "__main__":
         imagen += 1
     print 'Taking first image to %s' % ('capture_%03d.bin' % imagen,)
     
+    sm = SensorSM()
     while taken < args.number:
         # these repeat forever, about every 7 ms per loop in the original app
         # 0x0020 seems to have a one hot encoded state machine
@@ -767,18 +769,12 @@ if __name__ == "__main__":
             if args.verbose:
                 print 'r1: %s' % binascii.hexlify(buff)
             state = ord(buff)
-            '''
-            Observed states
-            -0x01: no activity
-            -0x02: short lived
-            -0x04: longer lived than 2
-            -0x08: read right before capture
-            '''
-            if state != 0x01:
-                print 'Non-1 state: 0x%02X' % state
+            sm.update(state)
+            if state != STATE_IDLE:
+                print 'Non-idle state: %s' % state_str(state)
                 if cap_start is None:
                     cap_start = time.time()
-                if state == 0x08:
+                if state == STATE_READY:
                     print 'Go go go'
                     break
             
@@ -834,7 +830,8 @@ if __name__ == "__main__":
             if args.verbose:
                 print 'r1: %s' % binascii.hexlify(buff)
             state = ord(buff)
-            if state == 0x01:
+            sm.update(state)
+            if state == STATE_IDLE:
                 print 'idle found'
                 break
             
@@ -844,4 +841,7 @@ if __name__ == "__main__":
                 print 'r2: %s' % binascii.hexlify(buff)
             validate_read("\x00", buff, "packet 863/864")
         '''
+    
+    print 'Sensor state timing'
+    sm.report()
 
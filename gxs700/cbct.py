@@ -46,6 +46,11 @@ if __name__ == "__main__":
     dev = open_dev(usbcontext)
     gxs = gxs700.GXS700(usbcontext, dev, verbose=args.verbose)
     
+    # Log sensor state transitions, doubles as timing telemetry for the run
+    def state_cb(old, new, t):
+        print 'SENSOR: state %s => 0x%02X' % ('None' if old is None else '0x%02X' % old, new)
+    gxs.mon_start().subscribe(state_cb)
+    
     fn = ''
 
     print 'Warming filament...'
@@ -104,13 +109,14 @@ if __name__ == "__main__":
         
         gxs.wait_trig_cb = fire
         
-        def cap_cb(imgb):
+        def cap_cb(imgb, frame_meta):
             global taken
             global imagen
             
             fn = '%s/ct_%03d.bin' % (fn_d, imagen)
             print 'Writing %s' % fn
             open(fn, 'w').write(imgb)
+            frame_meta.save('%s/ct_%03d.json' % (fn_d, imagen))
 
             fn = '%s/ct_%03d.png' % (fn_d, imagen)
             print 'Decoding %s' % fn
@@ -127,7 +133,7 @@ if __name__ == "__main__":
             print 'TABLE: rotating'
             indexer.step('X', IMG_STEPS)
 
-        gxs.cap_binv(1, cap_cb=cap_cb, loop_cb=loop_cb)
+        gxs.cap_binv(1, cap_cb=cap_cb, loop_cb=loop_cb, meta=True)
     finally:
         # Just in case
         print 'X-RAY: BEAM OFF (on exit)'
@@ -0,0 +1,119 @@
+'''
+Dark frame calibration
+
+Takes N software triggered (no x-ray) frames and accumulates them as they come in
+into a running mean and variance (Welford's method)
+so memory is a couple of float64 frames no matter how many are taken
+instead of keeping every frame around to average later
+
+Results go to the calibration cache, one directory per sensor serial number:
+    ~/.gxs700/cal/<serial>/dark_mean.npy
+    ~/.gxs700/cal/<serial>/dark_var.npy
+    ~/.gxs700/cal/<serial>/dark.json
+'''
+
+# https://github.com/vpelletier/python-libusb1
+# Python-ish (classes, exceptions, ...) wrapper around libusb1.py . See docstrings (pydoc recommended) for usage.
+import usb1
+# Bare ctype wrapper, inspired from library C header file.
+import libusb1
+import argparse
+import json
+import os
+import time
+import numpy as np
+
+from util import open_dev
+import gxs700
+
+CAL_DIR = os.path.join(os.path.expanduser('~'), '.gxs700', 'cal')
+
+def cal_dir(sn, base=None):
+    '''Calibration cache directory for sensor serial number sn'''
+    return os.path.join(base or os.getenv('GXS700_CAL', CAL_DIR), sn)
+
+class DarkAccum:
+    '''Running per pixel mean and variance of raw 16 bit frames'''
+    def __init__(self, npix=gxs700.FRAME_SZ / 2):
+        self.n = 0
+        self.mean = np.zeros(npix, dtype=np.float64)
+        # Sum of squared differences from the mean
+        self.m2 = np.zeros(npix, dtype=np.float64)
+
+    def add(self, imgb):
+        sz = 2 * len(self.mean)
+        if len(imgb) < sz:
+            raise Exception('Expected frame of 0x%X bytes, got 0x%X' % (sz, len(imgb)))
+        # Reads can overshoot, anything past the frame is garbage
+        imgb = imgb[:sz]
+        self.n += 1
+        n = self.n
+        # Only temporary, updated in place to avoid more frame sized copies
+        # delta = x - mean
+        # mean += delta / n
+        # m2 += delta * (x - new mean) = delta**2 * (n - 1) / n
+        d = np.frombuffer(imgb, dtype='<u2').astype(np.float64)
+        d -= self.mean
+        d /= n
+        self.mean += d
+        d *= d
+        d *= n * (n - 1)
+        self.m2 += d
+
+    def var(self):
+        '''Sample variance'''
+        if self.n < 2:
+            return np.zeros_like(self.m2)
+        return self.m2 / (self.n - 1)
+
+    def save(self, d, meta={}):
+        if not os.path.exists(d):
+            os.makedirs(d)
+        np.save(os.path.join(d, 'dark_mean.npy'), self.mean)
+        np.save(os.path.join(d, 'dark_var.npy'), self.var())
+        j = dict(meta)
+        j['n'] = self.n
+        j['t'] = time.time()
+        json.dump(j, open(os.path.join(d, 'dark.json'), 'w'), indent=4, sort_keys=True)
+
+def acquire(gxs, n, timeout=None, cancel=None, verbose=False):
+    '''Take n software triggered frames, return a DarkAccum'''
+    acc = DarkAccum()
+
+    def cb(imgb):
+        acc.add(imgb)
+        if verbose:
+            print 'Dark frame %d / %d' % (acc.n, n)
+
+    wait_trig_cb = gxs.wait_trig_cb
+    exp_ts_policy = gxs.exp_ts_policy
+    # sw_trig frames aren't exposures, don't log them as one
+    gxs.wait_trig_cb = gxs.sw_trig
+    gxs.exp_ts_policy = gxs700.EXP_TS_NEVER
+    try:
+        gxs.cap_binv(n, cb, timeout=timeout, cancel=cancel)
+    finally:
+        gxs.wait_trig_cb = wait_trig_cb
+        gxs.exp_ts_policy = exp_ts_policy
+    return acc
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Build dark frame calibration from software triggered captures')
+    parser.add_argument('--verbose', '-v', action='store_true', help='verbose')
+    parser.add_argument('--number', '-n', type=int, default=32, help='number of frames to average')
+    parser.add_argument('--timeout', type=float, default=30.0, help='seconds allowed per frame')
+    parser.add_argument('--dir', help='output directory (default: calibration cache for the sensor serial number)')
+    args = parser.parse_args()
+
+    usbcontext = usb1.USBContext()
+    dev = open_dev(usbcontext)
+    gxs = gxs700.GXS700(usbcontext, dev, verbose=args.verbose, cache=True)
+    info = gxs.get_info()
+
+    acc = acquire(gxs, args.number, timeout=args.timeout, verbose=True)
+    d = args.dir or cal_dir(info.sn)
+    print 'Writing %s' % d
+    acc.save(d, {'sn': info.sn, 'model': info.model, 'versions': info.versions,
+            'img_wh': info.img_wh, 'pitch_um': info.pitch_um()})
+    print 'Mean %0.1f, mean std dev %0.2f' % (acc.mean.mean(), np.sqrt(acc.var()).mean())
+    print 'Done'
@@ -0,0 +1,62 @@
+'''
+Per-operation deadlines and cancellation
+
+A missed trigger or wedged firmware used to hang forever
+Long running operations (trigger wait, bulk frame read) take a Deadline
+and check it as they go:
+    cancel = CancelToken()
+    # from a watchdog thread: cancel.cancel()
+    gxs.cap_bin(timeout=30, cancel=cancel)
+'''
+
+import threading
+import time
+
+class Timeout(Exception):
+    pass
+
+class Cancelled(Exception):
+    pass
+
+class CancelToken:
+    '''Thread safe flag, set it to abort whatever is using it'''
+    def __init__(self):
+        self.event = threading.Event()
+
+    def cancel(self):
+        self.event.set()
+
+    def cancelled(self):
+        return self.event.is_set()
+
+class Deadline:
+    '''Absolute time limit (None: none) plus an optional CancelToken'''
+    def __init__(self, timeout=None, cancel=None):
+        self.tend = None if timeout is None else time.time() + timeout
+        self.cancel = cancel
+
+    def remaining(self):
+        '''Seconds left, None if no limit'''
+        if self.tend is None:
+            return None
+        return max(0.0, self.tend - time.time())
+
+    def expired(self):
+        return (self.cancel is not None and self.cancel.cancelled()) or (self.tend is not None and time.time() >= self.tend)
+
+    def check(self, what='operation'):
+        '''Raise Cancelled or Timeout if its time to give up'''
+        if self.cancel is not None and self.cancel.cancelled():
+            raise Cancelled('%s cancelled' % what)
+        if self.tend is not None and time.time() >= self.tend:
+            raise Timeout('%s timed out' % what)
+
+    def sleep(self, t):
+        '''Sleep up to t but wake up for cancellation and don't sleep past the deadline'''
+        remaining = self.remaining()
+        if remaining is not None:
+            t = min(t, remaining)
+        if self.cancel is not None:
+            self.cancel.event.wait(t)
+        elif t > 0:
+            time.sleep(t)
@@ -1,44 +1,25 @@
 #!/usr/bin/env 
 import argparse
 import numpy as np
-import struct
 
 import gxs700
 
 # http://www.janeriksolem.net/2009/06/histogram-equalization-with-python-and.html
-def histeq(buff, nbr_bins=256):
-    height = 1850
-    width = 1344
-    depth = 2
+def histeq(buff, nbr_bins=256, wh=None):
+    width, height = wh or (gxs700.IMG_W, gxs700.IMG_H)
     
-    im =  np.zeros(1850 * 1344)
-    i = 0
-    for y in range(height):
-        line0 = buff[y * width * depth:(y + 1) * width * depth]
-        for x in range(width):
-            b0 = ord(line0[2*x + 0])
-            b1 = ord(line0[2*x + 1])
-            
-            # FIXME: 16 bit pixel truncation to fit into png
-            im[i] = (b1 << 8) + b0
-            i += 1
-
+    im = np.frombuffer(buff, dtype='<u2', count=width * height).astype(np.float64)
 
     #get image histogram
-    imhist,bins = np.histogram(im.flatten(),nbr_bins,normed=True)
+    imhist,bins = np.histogram(im,nbr_bins,normed=True)
     cdf = imhist.cumsum() #cumulative distribution function
     cdf = 255 * cdf / cdf[-1] #normalize
     
     #use linear interpolation of cdf to find new pixel values
-    im2 = np.interp(im.flatten(),bins[:-1],cdf)
-    
-    #return im2.reshape(im.shape), cdf
-    rs = im2.reshape(im.shape)
+    im2 = np.interp(im,bins[:-1],cdf)
     
-    ret = bytearray()
-    for i in xrange(len(rs)):
-        ret += struct.pack('>H', int(rs[i]))
-    return str(ret)
+    # Truncate like int() did
+    return im2.astype('>u2').tostring()
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Replay captured USB packets')
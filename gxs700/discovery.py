@@ -0,0 +1,185 @@
+'''
+USB device discovery
+
+Keeps an index of attached devices up to date from libusb hotplug events
+or, if libusb wasn't built with hotplug support, by rescanning with a sleep between scans
+Used to wait for a device to come back after firmware load instead of
+rebuilding a USBContext and walking the device list in a tight loop:
+    disc = discovery.get()
+    after = disc.seq
+    # load firmware...
+    udev = disc.wait_for(0x5328, 0x2030, timeout=3.0, after=after)
+
+Events are only handled while someone is querying or waiting, there is no background thread
+unless the context is shared with one (see multi.py): the hotplug callback then runs on the event thread
+so the index and seq are only touched under cond
+'''
+
+# https://github.com/vpelletier/python-libusb1
+# Python-ish (classes, exceptions, ...) wrapper around libusb1.py . See docstrings (pydoc recommended) for usage.
+import usb1
+# Bare ctype wrapper, inspired from library C header file.
+import libusb1
+import threading
+import time
+from deadline import Timeout
+
+class Entry:
+    def __init__(self, udev, seq):
+        self.udev = udev
+        self.vid = udev.getVendorID()
+        self.pid = udev.getProductID()
+        self.bus = udev.getBusNumber()
+        self.addr = udev.getDeviceAddress()
+        # Arrival order, see Discovery.seq
+        self.seq = seq
+        self._serial = None
+        self._serial_read = False
+
+    def serial(self):
+        '''USB serial number string, None if it doesn't have one or we can't open it'''
+        # Needs a descriptor read so not done from the hotplug callback
+        if not self._serial_read:
+            self._serial_read = True
+            try:
+                self._serial = self.udev.getSerialNumber()
+            except usb1.USBError:
+                self._serial = None
+        return self._serial
+
+    def __str__(self):
+        return 'Bus %03i Device %03i: ID %04x:%04x' % (self.bus, self.addr, self.vid, self.pid)
+
+def has_hotplug():
+    try:
+        return usb1.hasCapability(usb1.CAP_HAS_HOTPLUG)
+    except AttributeError:
+        # python-libusb1 too old to ask
+        return False
+
+class Discovery:
+    def __init__(self, usbcontext=None, hotplug=None, poll=0.05):
+        if usbcontext is None:
+            usbcontext = usb1.USBContext()
+        self.usbcontext = usbcontext
+        if hotplug is None:
+            hotplug = has_hotplug()
+        self.hotplug = hotplug
+        # Seconds between rescans without hotplug
+        self.poll = poll
+        # Guards index and seq, notified on every change
+        self.cond = threading.Condition()
+        # (bus, address) => Entry
+        self.index = {}
+        # Incremented on every arrival
+        self.seq = 0
+        self.handle = None
+        if self.hotplug:
+            # Enumerate flag delivers already attached devices before this returns
+            self.handle = self.usbcontext.hotplugRegisterCallback(self._hotplug_cb,
+                    events=usb1.HOTPLUG_EVENT_DEVICE_ARRIVED | usb1.HOTPLUG_EVENT_DEVICE_LEFT,
+                    flags=usb1.HOTPLUG_ENUMERATE)
+        else:
+            self._scan()
+
+    def close(self):
+        if self.handle is not None:
+            self.usbcontext.hotplugDeregisterCallback(self.handle)
+            self.handle = None
+
+    def _arrived(self, udev):
+        '''Call with cond held'''
+        self.seq += 1
+        e = Entry(udev, self.seq)
+        self.index[(e.bus, e.addr)] = e
+
+    def _hotplug_cb(self, usbcontext, udev, event):
+        k = (udev.getBusNumber(), udev.getDeviceAddress())
+        with self.cond:
+            if event == usb1.HOTPLUG_EVENT_DEVICE_ARRIVED:
+                self._arrived(udev)
+            else:
+                self.index.pop(k, None)
+            self.cond.notify_all()
+        # Stay registered
+        return False
+
+    def _scan(self):
+        udevs = self.usbcontext.getDeviceList(skip_on_error=True)
+        with self.cond:
+            seen = set()
+            for udev in udevs:
+                k = (udev.getBusNumber(), udev.getDeviceAddress())
+                seen.add(k)
+                e = self.index.get(k)
+                # Same bus/address but a different device if it was reused
+                if e is None or (e.vid, e.pid) != (udev.getVendorID(), udev.getProductID()):
+                    self._arrived(udev)
+            for k in set(self.index) - seen:
+                del self.index[k]
+            self.cond.notify_all()
+
+    def refresh(self, tv=0):
+        '''Bring the index up to date, waiting up to tv seconds for something to happen'''
+        if self.hotplug:
+            self.usbcontext.handleEventsTimeout(tv=tv)
+        else:
+            if tv:
+                time.sleep(tv)
+            self._scan()
+
+    def find(self, vidpids=None, serial=None, after=0, exclude=()):
+        '''
+        Return matching entries from the index, oldest first
+        vidpids: only these (vid, pid)
+        serial: only devices with this USB serial number
+        after: only devices that arrived after seq was this value
+        exclude: skip these (bus, address)
+        '''
+        ret = []
+        with self.cond:
+            for k, e in self.index.items():
+                if vidpids is not None and (e.vid, e.pid) not in vidpids:
+                    continue
+                if e.seq <= after or k in exclude:
+                    continue
+                ret.append(e)
+        # Descriptor read, not under cond
+        if serial is not None:
+            ret = [e for e in ret if e.serial() == serial]
+        return sorted(ret, key=lambda e: e.seq)
+
+    def devices(self, vidpids=None, serial=None):
+        '''Currently attached matching USBDevices'''
+        self.refresh()
+        return [e.udev for e in self.find(vidpids, serial)]
+
+    def wait_for_any(self, vidpids, timeout=3.0, serial=None, after=0, exclude=()):
+        '''Return the Entry of the first matching device, raise Timeout after timeout seconds'''
+        tend = time.time() + timeout
+        self.refresh()
+        while True:
+            found = self.find(vidpids, serial, after, exclude)
+            if found:
+                return found[0]
+            remain = tend - time.time()
+            if remain <= 0:
+                raise Timeout('Timed out waiting for %s' % ', '.join('%04x:%04x' % vp for vp in vidpids))
+            self.refresh(min(remain, 0.1 if self.hotplug else self.poll))
+
+    def wait_for(self, vid, pid, timeout=3.0, serial=None, after=0):
+        '''Return the USBDevice of the first vid:pid to show up, raise Timeout after timeout seconds'''
+        return self.wait_for_any([(vid, pid)], timeout=timeout, serial=serial, after=after).udev
+
+# usbcontext => Discovery, None for the one with its own context
+_discovery = {}
+
+def get(usbcontext=None):
+    '''
+    Process wide Discovery, created on first use
+    usbcontext: index devices on this context instead so they can be opened for use with it
+    '''
+    ret = _discovery.get(usbcontext)
+    if ret is None:
+        ret = _discovery[usbcontext] = Discovery(usbcontext)
+    return ret
@@ -12,16 +12,13 @@ import sys
 import argparse
 from util import hexdump
 from util import open_dev
+from util import nulls
+import mem
+import calrec
+import gxs700
 
 verbose = False
 
-def nulls(s, offset):
-    end = s.find('\x00', offset)
-    if end < 0:
-        return s[offset:]
-    else:
-        return s[offset:end]
-
 # At least 0x400 size EEPROM
 # with just over 0x200 used
 # higher addresses read FF, so its hard to tell how big it actually is
@@ -70,12 +67,22 @@ if __name__ == "__main__":
     parser.add_argument('--fn', '-f', help='write bin to filename')
     parser.add_argument('--fn2', '-F', help='write bin to filename')
     parser.add_argument('--all', '-a', action='store_true', help='dump entire EEPROM (2k)')
+    parser.add_argument('--cached', '-c', action='store_true', help='use the on disk snapshot if it still matches the device')
+    parser.add_argument('--parse', '-p', action='store_true', help='decode the flash calibration record instead of hexdumping it')
     parser.add_argument('addr', nargs='?', default='0', help='address')
     parser.add_argument('len', nargs='?', default='0x234', help='length')
     args = parser.parse_args()
 
     usbcontext = usb1.USBContext()
     dev = open_dev(usbcontext)
+    if args.cached:
+        gxs = gxs700.GXS700(usbcontext, dev, init=False, cache=True)
+        flash_r = gxs.flash_r
+        eeprom_r = gxs.eeprom_r
+    else:
+        reader = mem.MemReader(dev, usbcontext)
+        flash_r = lambda addr, n: reader.read('flash', addr, n)
+        eeprom_r = lambda addr, n: reader.read('eeprom', addr, n)
 
     print
     print 'Reading flash'
@@ -84,9 +91,15 @@ if __name__ == "__main__":
         dump_len = 0x800
     else:
         dump_len = int(args.len, 0)
-    bin = dump_loop(dev, 0x0010, EEPROM_RMAX, dump_addr, dump_len, do_hexdump=(not args.fn))
+    bin = flash_r(dump_addr, dump_len)
     if args.fn:
         open(args.fn, 'w').write(bin)
+    elif args.parse:
+        if dump_addr != 0:
+            raise Exception('Calibration record is at flash 0')
+        calrec.CalRecord.parse(bin).show()
+    else:
+        hexdump(bin)
 
 
     '''
@@ -152,7 +165,9 @@ if __name__ == "__main__":
     else:
         dump_len = 0x80
     # wraps around 0x2000
-    buff = dump_loop(dev, 0x0B, 0x80, 0x0000, dump_len, do_hexdump=(not args.fn2))
+    buff = eeprom_r(0x0000, dump_len)
     if args.fn2:
         open(args.fn2, 'w').write(buff)
+    else:
+        hexdump(buff)
 
@@ -14,25 +14,19 @@ import sys
 import argparse
 from util import hexdump
 from util import open_dev
-from util import hexdump
+import fx2
+import ihex
 
 verbose = False
 
-def ram_r(dev, addr, datal):
-    bs = 16
-    offset = 0
-    ret = bytearray()
-    while offset < datal:
-        l = min(bs, datal - offset)
-        #print 'Read 0x%04X: %d' % (addr + offset, l)
-        ret += dev.controlRead(0xC0, 0xA0, addr + offset, 0x0000, l, timeout=1000)
-        offset += bs
-    return str(ret)
+def ram_r(dev, addr, datal, usbcontext=None):
+    return fx2.ram_r(dev, addr, datal, usbcontext)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Replay captured USB packets')
     parser.add_argument('--verbose', '-v', action='store_true', help='verbose')
-    parser.add_argument('fout', nargs='?', default=None, help='File out')
+    parser.add_argument('--scratch', '-s', action='store_true', help='also dump scratch pad RAM (0xE000-0xE1FF)')
+    parser.add_argument('fout', nargs='?', default=None, help='File out, Intel HEX if .hex otherwise binary')
     args = parser.parse_args()
 
     usbcontext = usb1.USBContext()
@@ -48,13 +42,19 @@ if __name__ == "__main__":
     The available RAM spaces are 8 kbytes from
     0x0000-0x1FFF (code/data) and 512 bytes from 0xE000-0xE1FF (scratch pad RAM).
     '''
-    r = ram_r(dev, 0x0000, 0x2000)
-    #r = ram_r(dev, 0xE000, 0x2000)
+    if args.scratch:
+        regions = fx2.RAM
+    else:
+        regions = (fx2.PROG,)
+    segments = fx2.dump(dev, regions, usbcontext)
     if args.fout:
         if args.fout.find('.hex') >= 0:
-            pass
+            ihex.dump(segments, args.fout)
         else:
-            open(args.fout, 'w').write(r)
+            # Scratch pad goes right after program RAM, not at its address
+            open(args.fout, 'w').write(''.join(data for _addr, data in segments))
     else:
-        hexdump(r)
-
+        for addr, data in segments:
+            print
+            print '0x%04X' % addr
+            hexdump(data)
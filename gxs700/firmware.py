@@ -0,0 +1,168 @@
+'''
+Firmware registry and manager
+
+Pre-enumeration VID:PID => firmware bundle (HEX stages, reset register, what it renumerates as)
+Supporting another sensor is an entry in BUNDLES / REGISTRY plus its fw/*.hex files
+Nothing is parsed until a device actually needs that firmware, see fxload.stages()
+
+The manager finds devices that need firmware, loads all of them at once
+and waits for them to renumerate together so bringing up several sensors takes about as long as one
+A device needs firmware if it has a pre-enumeration VID:PID and doesn't answer
+the version request (0x51), which the boot ROM stalls
+'''
+
+# https://github.com/vpelletier/python-libusb1
+# Python-ish (classes, exceptions, ...) wrapper around libusb1.py . See docstrings (pydoc recommended) for usage.
+import usb1
+# Bare ctype wrapper, inspired from library C header file.
+import libusb1
+import time
+
+import discovery
+import fxload
+import usb_batch
+
+class Bundle:
+    def __init__(self, fw, post, cpucs=fxload.CPUCS, max_write=fxload.MAX_WRITE):
+        # fw/<fw>_stage*.hex
+        self.fw = fw
+        # Post enumeration (vid, pid) => name
+        self.post = post
+        # Reset register held around each stage
+        self.cpucs = cpucs
+        self.max_write = max_write
+
+    def stages(self):
+        return fxload.stages(self.fw)
+
+    def load(self, dev):
+        '''Queue the firmware writes on dev'''
+        for segments in self.stages():
+            fxload.load_stage(dev, segments, max_write=self.max_write, cpucs_addr=self.cpucs)
+
+BUNDLES = {
+        # Source data: cap1.cap packets 107 - 286
+        'gxs700': Bundle('gxs700', {
+                (0x5328, 0x2030): 'Gendex GXS700 (post enumeration)',
+                }),
+        # Source data: 2010_early.cap
+        # Renumeration not captured, wait on the same PID as the gendex firmware
+        # 0x2010 has only been seen as '??? auto enum', add it here once it's actually observed
+        '2010': Bundle('2010', {
+                (0x5328, 0x2030): 'Dexis Platinum (post enumeration)',
+                }),
+        }
+
+# Pre-enumeration (vid, pid) => (name, bundle)
+REGISTRY = {
+        # note: loads the gendex firmware
+        (0x5328, 0x2009): ('Dexis Platinum (pre-enumeration)', 'gxs700'),
+        #(0x5328, 0x2010): '??? auto enum',
+        #(0x5328, 0x2010): 'Dexis Platinum (pre-enumeration something)',
+        (0x5328, 0x202F): ('Gendex GXS700 (pre-enumeration)', 'gxs700'),
+        # ooops
+        # Bus 002 Device 043: ID 04b4:8613 Cypress Semiconductor Corp. CY7C68013 EZ-USB FX2 USB 2.0 Development Kit
+        (0x04b4, 0x8613): ('CY7C68013 EZ-USB FX2 USB 2.0 Development Kit', 'gxs700'),
+        }
+
+def pre_pidvid2name():
+    return dict((k, name) for k, (name, _bundle) in REGISTRY.items())
+
+def post_pidvid2name():
+    '''Post enumeration (vid, pid) => name for every bundle something in REGISTRY loads'''
+    ret = {}
+    for bundle in set(bundle for _name, bundle in REGISTRY.values()):
+        ret.update(BUNDLES[bundle].post)
+    return ret
+
+def fw_running(dev, timeout=200):
+    '''True if dev answers the version request, ie our firmware is already running'''
+    try:
+        return len(dev.controlRead(0xC0, 0xB0, 0x51, 0, 0x1C, timeout=timeout)) > 0
+    except usb1.USBError:
+        return False
+
+class FirmwareManager:
+    def __init__(self, disc=None, bundle=None):
+        self.disc = disc or discovery.get()
+        # Bundle name to load regardless of what REGISTRY says
+        self.bundle = bundle
+
+    def bundle_for(self, udev):
+        if self.bundle:
+            return BUNDLES[self.bundle]
+        return BUNDLES[REGISTRY[(udev.getVendorID(), udev.getProductID())][1]]
+
+    def pending(self):
+        '''[(udev, dev, Bundle)] that need firmware, opened'''
+        ret = []
+        for udev in self.disc.devices(REGISTRY.keys()):
+            dev = udev.open()
+            if fw_running(dev):
+                print 'Bus %03i Device %03i: firmware already running' % (
+                    udev.getBusNumber(), udev.getDeviceAddress())
+                dev.close()
+                continue
+            ret.append((udev, dev, self.bundle_for(udev)))
+        return ret
+
+    def load_all(self, wait=False, timeout=3.0):
+        '''
+        Load firmware onto every device that needs it, return the number loaded
+        wait: also wait up to timeout seconds for all of them to renumerate
+        '''
+        print 'Scanning for devices...'
+        todo = self.pending()
+        if not todo:
+            return 0
+        # Anything that shows up after this is a renumerated device
+        # Taken after pending() refreshed the index so devices already attached don't count
+        after = self.disc.seq
+
+        # One batch per device on the shared context, all in flight together
+        # Waiting on any of them handles completions for all of them
+        batches = []
+        try:
+            for udev, dev, bundle in todo:
+                print 'Loading firmware %s: Bus %03i Device %03i: ID %04x:%04x' % (
+                    bundle.fw,
+                    udev.getBusNumber(),
+                    udev.getDeviceAddress(),
+                    udev.getVendorID(),
+                    udev.getProductID())
+                batch = usb_batch.ControlBatch(self.disc.usbcontext, dev)
+                batches.append(batch)
+                bundle.load(batch)
+            for batch in batches:
+                batch.flush()
+        finally:
+            for batch in batches:
+                batch.close()
+            for _udev, dev, _bundle in todo:
+                dev.close()
+        print 'Firmware load OK (%d devices)' % len(todo)
+
+        if wait:
+            post = set()
+            for _udev, _dev, bundle in todo:
+                post.update(bundle.post.keys())
+            self.wait_renum(len(todo), list(post), after, timeout)
+        return len(todo)
+
+    def wait_renum(self, n, pidvids, after, timeout=3.0):
+        '''Wait for n devices in pidvids to arrive after discovery seq after'''
+        print 'Waiting for %d device(s) to come up' % n
+        tstart = time.time()
+        up = set()
+        while len(up) < n:
+            try:
+                e = self.disc.wait_for_any(pidvids, timeout=max(0.0, tstart + timeout - time.time()),
+                        after=after, exclude=up)
+            except discovery.Timeout:
+                raise discovery.Timeout("Renumeration timed out, %d / %d up" % (len(up), n))
+            up.add((e.bus, e.addr))
+        print 'Up after %0.1f sec' % (time.time() - tstart,)
+
+def load_all(wait=False, bundle=None):
+    '''Load firmware onto all devices that need it, return the number loaded'''
+    return FirmwareManager(bundle=bundle).load_all(wait=wait)
@@ -0,0 +1,161 @@
+'''
+Differential flash / EEPROM update
+
+Reads the current contents in one bulk read, compares against the new image page by page
+and only touches pages that differ
+
+Both parts are treated as plain rewrites: a page is written with the new contents, no erase
+Captures only show flash_w() writing over existing contents, never flash_erase()
+whose erase unit isn't known (bigger than a page would also wipe the identity block at 0x0C,
+calibration record at 0x1F4...) and whose payload only holds a one byte address
+If the flash is NOR-like a write can only clear bits, so a flash page that needs a bit to go 0 => 1
+would end up as the AND of old and new.  Those updates are refused unless forced
+The current contents are saved to a backup file before anything is written
+
+There is no known device side checksum command so verification reads back the whole part,
+compares it against the full expected image and rewrites any page that doesn't match
+'''
+
+# https://github.com/vpelletier/python-libusb1
+# Python-ish (classes, exceptions, ...) wrapper around libusb1.py . See docstrings (pydoc recommended) for usage.
+import usb1
+# Bare ctype wrapper, inspired from library C header file.
+import libusb1
+import argparse
+import time
+
+from util import open_dev
+import gxs700
+
+class Target:
+    def __init__(self, name, page, size, clear_only):
+        self.name = name
+        # Rewrite unit, the chunk size the write request takes
+        self.page = page
+        self.size = size
+        # Writes might only be able to clear bits, see module docstring
+        self.clear_only = clear_only
+
+    def read(self, gxs, addr, n):
+        # From the device even if gxs has a snapshot cache, that's what we're verifying
+        return gxs._mem_r(self.name, addr, n)
+
+    def write(self, gxs, addr, buff):
+        if self.name == 'flash':
+            gxs.flash_w(addr, buff)
+        elif addr == 0:
+            # Writes at 0 don't take (see prog_eeprom.py)
+            # Write the first page at 0x10 instead, it wraps around so the halves go in swapped
+            buff = str(buff)
+            gxs._controlWrite_mem(0x0C, 0x80, 0x10, buff[0x10:] + buff[:0x10])
+            if gxs.snapcache:
+                gxs.snapcache.written('eeprom', 0, buff)
+        else:
+            gxs.eeprom_w(addr, buff)
+
+TARGETS = {
+        # flash_w() writes 0x100 at a time
+        'flash':    Target('flash', 0x100, 0x800, True),
+        # eeprom_w() writes 0x80 at a time but the part pages at 0x20 (see prog_eeprom.py)
+        'eeprom':   Target('eeprom', 0x20, 0x2000, False),
+        }
+
+def plan(target, addr, cur, new):
+    '''[page address] for pages that differ'''
+    ret = []
+    for off in xrange(0, len(new), target.page):
+        if cur[off:off + target.page] != new[off:off + target.page]:
+            ret.append(addr + off)
+    return ret
+
+def sets_bits(target, pages, cur, new):
+    '''[page address] of pages where going from cur to new sets a bit'''
+    ret = []
+    for page_addr in pages:
+        c = bytearray(cur[page_addr:page_addr + target.page])
+        n = bytearray(new[page_addr:page_addr + target.page])
+        for cb, nb in zip(c, n):
+            if nb & ~cb & 0xFF:
+                ret.append(page_addr)
+                break
+    return ret
+
+def program(gxs, target, pages, new):
+    '''Rewrite pages [page address] from full image new'''
+    with gxs.batched():
+        for page_addr in pages:
+            target.write(gxs, page_addr, new[page_addr:page_addr + target.page])
+
+def update(gxs, data, addr=0, target='flash', verify=True, dry_run=False, verbose=False,
+        force=False, backup=None):
+    '''
+    Make memory at addr match data, rewriting only pages that differ
+    Everything outside of data keeps its current contents
+    force: write flash pages even if they need bits set 0 => 1
+    backup: file to save the current contents to before writing, default <target>_backup_<time>.bin
+    Returns the list of page addresses rewritten
+    '''
+    if isinstance(target, str):
+        target = TARGETS[target]
+    if addr + len(data) > target.size:
+        raise Exception('0x%X bytes at 0x%04X overflows %s' % (len(data), addr, target.name))
+
+    with gxs.lock:
+        # Whole part so verify catches damage outside of the pages rewritten
+        cur = target.read(gxs, 0, target.size)
+        new = cur[:addr] + data + cur[addr + len(data):]
+        pages = plan(target, 0, cur, new)
+        if verbose:
+            for page_addr in pages:
+                print '%s 0x%04X: program' % (target.name, page_addr)
+        print '%s: %d / %d pages differ' % (target.name, len(pages), target.size / target.page)
+        setting = sets_bits(target, pages, cur, new) if target.clear_only else []
+        if setting:
+            print '%s: %d page(s) need bits set 0 => 1: %s' % (target.name, len(setting),
+                    ' '.join('0x%04X' % page_addr for page_addr in setting))
+        if dry_run or not pages:
+            return pages
+        if setting and not force:
+            raise Exception('%s: refusing to write pages that need bits set 0 => 1 without an erase, '
+                    'use force if the part really overwrites' % (target.name,))
+
+        if backup is None:
+            backup = '%s_backup_%d.bin' % (target.name, int(time.time()))
+        open(backup, 'wb').write(cur)
+        print '%s: saved current contents to %s' % (target.name, backup)
+
+        program(gxs, target, pages, new)
+
+        if verify:
+            bad = plan(target, 0, target.read(gxs, 0, target.size), new)
+            if bad:
+                print '%s: %d page(s) wrong after update, rewriting' % (target.name, len(bad))
+                program(gxs, target, bad, new)
+                bad = plan(target, 0, target.read(gxs, 0, target.size), new)
+                if bad:
+                    raise Exception('%s verify failed: %s, original contents in %s' % (target.name,
+                            ' '.join('0x%04X' % page_addr for page_addr in bad), backup))
+            print '%s: verified 0x%X bytes' % (target.name, target.size)
+    return pages
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Update flash / EEPROM, only rewriting pages that changed')
+    parser.add_argument('--verbose', '-v', action='store_true', help='verbose')
+    parser.add_argument('--eeprom', action='store_true', help='update EEPROM instead of flash')
+    parser.add_argument('--addr', default='0', help='start address')
+    parser.add_argument('--dry-run', '-n', action='store_true', help='show what would be rewritten')
+    parser.add_argument('--no-verify', action='store_true', help="don't read back and repair")
+    parser.add_argument('--force', action='store_true', help='write flash pages that need bits set 0 => 1')
+    parser.add_argument('--backup', help='save current contents here (default: <target>_backup_<time>.bin)')
+    parser.add_argument('fn', help='image to write')
+    args = parser.parse_args()
+
+    usbcontext = usb1.USBContext()
+    dev = open_dev(usbcontext)
+    gxs = gxs700.GXS700(usbcontext, dev, verbose=args.verbose, init=False)
+
+    update(gxs, open(args.fn, 'rb').read(), addr=int(args.addr, 0),
+            target='eeprom' if args.eeprom else 'flash',
+            verify=not args.no_verify, dry_run=args.dry_run, verbose=args.verbose,
+            force=args.force, backup=args.backup)
+    print 'Done'
@@ -0,0 +1,42 @@
+'''
+FX2 RAM access through the boot ROM's 0xA0 request
+
+Was 16 bytes per transfer, 512 transfers to dump 8k
+The ROM takes any length (vendor driver's firmware load does 0x943 byte writes)
+so go up to what libusb / usbfs allow for a control transfer
+
+The available RAM spaces are 8 kbytes from
+0x0000-0x1FFF (code/data) and 512 bytes from 0xE000-0xE1FF (scratch pad RAM).
+'''
+
+import mem
+
+# CPU control and status, bit 0 holds the 8051 in reset
+CPUCS = 0xE600
+MAX_XFER = 0x1000
+
+PROG = (0x0000, 0x2000)
+SCRATCH = (0xE000, 0x0200)
+RAM = (PROG, SCRATCH)
+
+def reader(dev, usbcontext=None):
+    '''mem.MemReader for RAM at full transfer size, no probing'''
+    ret = mem.MemReader(dev, usbcontext, probe=False)
+    ret.chunks['ram'] = MAX_XFER
+    return ret
+
+def ram_r(dev, addr, n, usbcontext=None):
+    return reader(dev, usbcontext).read('ram', addr, n)
+
+def ram_w(dev, addr, data, max_write=MAX_XFER):
+    for off in xrange(0, len(data), max_write):
+        dev.controlWrite(0x40, 0xA0, addr + off, 0x0000, data[off:off + max_write], timeout=1000)
+
+def cpucs(dev, rst, addr=CPUCS):
+    '''Hold (rst true) or release the 8051 from reset'''
+    ram_w(dev, addr, chr(int(bool(rst))))
+
+def dump(dev, regions=RAM, usbcontext=None):
+    '''[(address, data)] of each (address, size) region'''
+    r = reader(dev, usbcontext)
+    return [(addr, r.read('ram', addr, n)) for addr, n in regions]
@@ -0,0 +1,142 @@
+'''
+FX2 firmware load from Intel HEX
+
+The FX2 boot ROM writes RAM with 0xA0 vendor requests while the CPU is held in reset (CPUCS 0xE600 = 1)
+Firmware used to be a replay of the vendor driver's writes, ~90 of them, mostly under 64 bytes
+Instead build the RAM image of each stage and write contiguous runs with as few transfers as possible
+
+Firmware is in fw/<name>_stage<n>.hex, loaded in order with a reset around each stage
+Vendor driver loads a small loader (stage 1), lets it run, then loads the real firmware (stage 2)
+
+To extract from a replay script (ie usbrply output with stage functions or a load(dev)),
+ex: the 2010 firmware from the last revision of load_firmware_2010.py before the HEX conversion
+(still a usbrply replay then), saved in this directory as replay_2010.py:
+    python fxload.py --extract replay_2010 2010
+'''
+
+import argparse
+import glob
+import importlib
+import os
+import re
+
+import fx2
+import ihex
+
+CPUCS = fx2.CPUCS
+MAX_WRITE = fx2.MAX_XFER
+FW_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fw')
+
+# (directory, name) => [stage segments]
+_stages = {}
+
+def coalesce(segments, max_write=MAX_WRITE):
+    '''
+    [(address, data)] => [(address, data)] with contiguous runs merged, at most max_write bytes each
+    Later segments win where they overlap, same as writing them in order
+    '''
+    mem = bytearray(0x10000)
+    used = bytearray(0x10000)
+    for addr, data in segments:
+        if addr <= CPUCS < addr + len(data):
+            raise Exception('Segment 0x%04X + 0x%X covers CPUCS' % (addr, len(data)))
+        mem[addr:addr + len(data)] = data
+        used[addr:addr + len(data)] = '\x01' * len(data)
+
+    ret = []
+    used = str(used)
+    start = used.find('\x01')
+    while start >= 0:
+        end = used.find('\x00', start)
+        if end < 0:
+            end = len(used)
+        for addr in xrange(start, end, max_write):
+            ret.append((addr, str(mem[addr:min(addr + max_write, end)])))
+        start = used.find('\x01', end)
+    return ret
+
+def load_stage(dev, segments, max_write=MAX_WRITE, cpucs_addr=CPUCS):
+    fx2.cpucs(dev, 1, cpucs_addr)
+    for addr, data in coalesce(segments, max_write):
+        fx2.ram_w(dev, addr, data, max_write)
+    fx2.cpucs(dev, 0, cpucs_addr)
+
+def stage_fns(name, d=None):
+    '''fw/<name>_stage<n>.hex in stage order (numeric, stage10 after stage9)'''
+    fns = glob.glob(os.path.join(d or FW_DIR, '%s_stage*.hex' % name))
+    fns = [fn for fn in fns if re.search(r'_stage(\d+)\.hex$', fn)]
+    return sorted(fns, key=lambda fn: int(re.search(r'_stage(\d+)\.hex$', fn).group(1)))
+
+def stages(name, d=None):
+    '''[segments] for each stage of firmware name, parsed once'''
+    k = (d or FW_DIR, name)
+    ret = _stages.get(k)
+    if ret is None:
+        fns = stage_fns(name, d)
+        if not fns:
+            raise Exception('No firmware %s in %s' % (name, d or FW_DIR))
+        ret = [coalesce(ihex.load(fn)) for fn in fns]
+        _stages[k] = ret
+    return ret
+
+def load(dev, name, d=None):
+    '''Load all stages of firmware name'''
+    # Captures don't show any delay between stages
+    for segments in stages(name, d):
+        load_stage(dev, segments)
+
+class Recorder:
+    '''Stands in for a device to collect a replay's RAM writes, split into stages by CPUCS'''
+    def __init__(self):
+        self.stages = []
+        self.cur = None
+
+    def controlWrite(self, request_type, request, value, index, data, timeout=0):
+        if request != 0xA0:
+            raise Exception('Unexpected request 0x%02X' % request)
+        if value == CPUCS:
+            if ord(data[0]) & 1:
+                self.cur = []
+            else:
+                if self.cur:
+                    self.stages.append(self.cur)
+                self.cur = None
+        elif self.cur is None:
+            raise Exception('Write 0x%04X while running' % value)
+        else:
+            self.cur.append((value, data))
+        return len(data)
+
+def extract(module, name, d=None):
+    '''Run replay module's load (or stage1, stage2...) against a Recorder and save fw/<name>_stage<n>.hex'''
+    m = importlib.import_module(module)
+    rec = Recorder()
+    if hasattr(m, 'stage1'):
+        n = 1
+        while hasattr(m, 'stage%d' % n):
+            getattr(m, 'stage%d' % n)(rec)
+            n += 1
+    else:
+        m.load(rec)
+    d = d or FW_DIR
+    if not os.path.exists(d):
+        os.makedirs(d)
+    for i, segments in enumerate(rec.stages, 1):
+        fn = os.path.join(d, '%s_stage%d.hex' % (name, i))
+        print '%s: %d writes => %d' % (fn, len(segments), len(coalesce(segments)))
+        ihex.dump(coalesce(segments), fn)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Extract / show FX2 firmware')
+    parser.add_argument('--dir', help='firmware directory (default: %s)' % FW_DIR)
+    parser.add_argument('--extract', metavar='MODULE', help='extract from replay script MODULE')
+    parser.add_argument('name', help='firmware name, ex: gxs700')
+    args = parser.parse_args()
+
+    if args.extract:
+        extract(args.extract, args.name, args.dir)
+    else:
+        for fn, segments in zip(stage_fns(args.name, args.dir), stages(args.name, args.dir)):
+            print '%s: %d transfers' % (fn, len(segments) + 2)
+            for addr, data in segments:
+                print '  0x%04X: 0x%04X bytes' % (addr, len(data))
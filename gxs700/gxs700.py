@@ -5,14 +5,29 @@ import usb1
 import libusb1
 import struct
 import binascii
+import contextlib
+import functools
+import json
+import sys
+import threading
+import time
+import Queue
 import Image
 try:
     from cStringIO import StringIO
 except ImportError:
     from StringIO import StringIO
+import usb_batch
+import mem
+import calrec
+import i2c
+import snapcache
+import state_mon
+from sensor_sm import SensorSM, STATE_IDLE, STATE_READY, STATE_NAMES, state_str
+from deadline import Timeout, Cancelled, CancelToken, Deadline
 
 '''
-19.5 um pixels
+19.5 um pixels (see calrec.py for the per sensor value)
 
 General notes
 
@@ -21,193 +36,607 @@ General notes
 5328:2030 Gendex large
 '''
 
-FRAME_SZ = 4972800
+# Readout geometry set with img_wh_w()
+# The flash calibration record says 1346 wide, see calrec.py
+IMG_W = 1344
+IMG_H = 1850
+# 16 bit pixels
+FRAME_SZ = IMG_W * IMG_H * 2
+# If the calibration record doesn't have one
+PITCH_UM = 19.5
+
+# Pixel value => inverted 8 bit grey level
+INVERT = ''.join(chr(0xFF - i) for i in xrange(256))
+
+# When to update the exposure timestamp at EEPROM 0x20
+# Vendor software writes it after every frame which costs a write per frame and wears the EEPROM
+# Leave it alone
+EXP_TS_NEVER = 0
+# First exposure after attaching
+EXP_TS_SESSION = 1
+# Last exposure of a cap_binv() run, written once the run is done
+EXP_TS_DEFERRED = 2
+
+def exp_ts_fmt(t):
+    '''Format a time.time() value like the vendor software does, ex: 2015/03/19-21:44:43:087'''
+    return time.strftime('%Y/%m/%d-%H:%M:%S', time.localtime(t)) + (':%03d' % (int(t * 1000) % 1000,))
+
+def locked(f):
+    '''Hold the GXS700 operation lock for the whole call'''
+    @functools.wraps(f)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return f(self, *args, **kwargs)
+    return wrapper
+
+class DeviceInfo:
+    '''
+    Static device parameters
+    These don't change while the sensor is attached so read them once instead of every frame
+    '''
+    def __init__(self, versions, fpga_sig, img_wh, cal, trig_param):
+        # {'mcu': (maj, min, build), 'fpga': ..., 'fpga_wg': ...}
+        self.versions = versions
+        self.fpga_sig = fpga_sig
+        self.img_wh = img_wh
+        # calrec.CalRecord from start of flash (0x10)
+        self.cal = cal
+        # ex: 2103231663 / Fairchild Imaging / SL2080302-G2
+        self.sn = cal.sn
+        self.vendor = cal.vendor
+        self.model = cal.model
+        self.trig_param = trig_param
+
+    @staticmethod
+    def read(gxs):
+        return DeviceInfo(
+                versions=gxs.versions(),
+                fpga_sig=gxs.fpga_rsig(),
+                img_wh=gxs.img_wh(),
+                cal=calrec.CalRecord.parse(gxs.flash_r(0x0000, calrec.SIZE)),
+                trig_param=gxs.trig_param_r())
+
+    def pitch_um(self):
+        '''(x, y) pixel pitch in um'''
+        return self.cal.pitch_um(PITCH_UM)
+
+    def show(self):
+        print "MCU:     %s.%s.%s" % self.versions['mcu']
+        print 'FPGA:    %s.%s.%s' % self.versions['fpga']
+        print 'FGPA WG: %s.%s.%s' % self.versions['fpga_wg']
+        print 'FPGA sig: 0x%04X' % self.fpga_sig
+        print 'Image:   %dx%d' % self.img_wh
+        print 'Sensor:  %s %s, SN %s' % (self.vendor, self.model, self.sn)
+        print 'Pixel:   %0.1f x %0.1f um' % self.pitch_um()
+
+class FrameStatus:
+    '''
+    Per frame status, from one image counter read plus what we already know host side
+    Saved as a JSON sidecar next to the frame so analysis doesn't need the device or logs
+    '''
+    def __init__(self, img_ctr, int_time, t_exp, states):
+        # Raw 0x40 response, 8 bytes in practice
+        self.img_ctr = img_ctr
+        # Last value written with int_t_w(), None if not written this session
+        self.int_time = int_time
+        # time.time() frame became ready
+        self.t_exp = t_exp
+        # state name => time.time() entered this exposure
+        self.states = states
+
+    @staticmethod
+    def decode_ctr(buff):
+        '''img_ctr_r() response => (exposures since manufacture, last exposure calibration)'''
+        return (ord(buff[2]) << 16 | ord(buff[1]) << 8 | ord(buff[0]),
+                ord(buff[6]) << 16 | ord(buff[5]) << 8 | ord(buff[4]))
+
+    @staticmethod
+    def read(gxs, t_exp=None):
+        return FrameStatus(
+                img_ctr=gxs.img_ctr_r(0x100),
+                int_time=gxs.int_t,
+                t_exp=t_exp,
+                states=dict((STATE_NAMES.get(s, '0x%02X' % s), t) for s, t in gxs.sm.cycle_times().items()))
+
+    def exp_since_manu(self):
+        return self.decode_ctr(self.img_ctr)[0]
+
+    def exp_cal_last(self):
+        return self.decode_ctr(self.img_ctr)[1]
+
+    def to_dict(self):
+        return {
+                'img_ctr': binascii.hexlify(self.img_ctr),
+                'exp_since_manu': self.exp_since_manu(),
+                'exp_cal_last': self.exp_cal_last(),
+                'int_time': self.int_time,
+                't_exp': self.t_exp,
+                'states': self.states,
+                }
+
+    def save(self, fn):
+        json.dump(self.to_dict(), open(fn, 'w'), indent=4, sort_keys=True)
+
+    def show(self):
+        print 'Img ctr: %s (exposures %d, cal %d)' % (binascii.hexlify(self.img_ctr), self.exp_since_manu(), self.exp_cal_last())
+
+class TrigWait:
+    '''
+    Wait for a frame to be ready (STATE_READY) without hammering the control endpoint
+
+    Vendor software (and this code originally) polls state and error back to back,
+    thousands of transfers per exposure
+    Instead poll slowly while idle, sleep through most of the exposure
+    using the dwell times the state machine has measured (see sensor_sm.py),
+    and only poll fast around when STATE_READY is expected
+    '''
+    def __init__(self, sm=None, idle_poll=0.01, fast_poll=0.001, margin=0.15,
+                err_poll=0.5, timeout=None, busy_timeout=10.0):
+        # Expected state durations
+        self.sm = sm or SensorSM()
+        # Seconds between state reads while idle (adds at most this much latency to a sw_trig)
+        self.idle_poll = idle_poll
+        # Seconds between state reads once STATE_READY is expected
+        self.fast_poll = fast_poll
+        # Start polling fast this long before STATE_READY is predicted
+        self.margin = margin
+        # Seconds between error checks
+        self.err_poll = err_poll
+        # Give up if no frame after this many seconds, None to wait forever
+        self.timeout = timeout
+        # Give up if STATE_READY doesn't show up this long after leaving idle
+        self.busy_timeout = busy_timeout
+        # Last wait's state reads, for diagnostics
+        self.scans = 0
+
+    def predict(self, state, tstate):
+        '''Predicted time.time() of STATE_READY given we entered state at tstate'''
+        return self.sm.predict_ready(state, tstate)
+
+    def wait(self, gxs, deadline=None):
+        if deadline is None:
+            deadline = Deadline()
+        tstart = time.time()
+        terr = tstart
+        # Time we first saw the sensor leave idle
+        tbusy = None
+        last = None
+        tlast = None
+        self.scans = 0
+        while True:
+            # Need fresh values, not what state() returns while another thread has an operation going
+            state = gxs._state_sample()
+            now = time.time()
+            self.scans += 1
+            if gxs.verbose and self.scans % 1000 == 0:
+                print 'State poll %d' % (self.scans,)
+            if state == STATE_READY:
+                return
+            
+            if state != last:
+                last = state
+                tlast = now
+            if state != STATE_IDLE and tbusy is None:
+                tbusy = now
+            
+            # Errors were checked every poll, they don't need to be
+            if now - terr >= self.err_poll:
+                terr = now
+                e = gxs._error_sample()
+                if e:
+                    raise Exception('Unexpected error %s' % (e,))
+            
+            deadline.check('Trigger wait')
+            if self.timeout is not None and now - tstart > self.timeout:
+                raise Timeout('Timed out waiting for trigger')
+            if tbusy is not None and now - tbusy > self.busy_timeout:
+                raise Timeout('Timed out waiting for frame, stuck in state %s' % state_str(state))
+            
+            tready = self.predict(state, tlast)
+            if tready is None:
+                deadline.sleep(self.idle_poll)
+            else:
+                # Sleep until shortly before its expected, a bit at a time in case we mispredicted
+                deadline.sleep(max(self.fast_poll, min(self.idle_poll * 10, tready - self.margin - now)))
+
+class BurstWorker(threading.Thread):
+    '''
+    Runs cap_binv() callbacks off the capture thread for burst mode
+    One thread so callbacks run in frame order: cap_cb(k), loop_cb(k), cap_cb(k + 1), ...
+    '''
+    def __init__(self, cap_cb, loop_cb, depth=2):
+        threading.Thread.__init__(self, name='gxs700 burst worker')
+        self.daemon = True
+        self.cap_cb = cap_cb
+        self.loop_cb = loop_cb
+        # Frames waiting for callbacks, capture blocks if they fall this far behind
+        self.q = Queue.Queue(maxsize=depth)
+        self.lock = threading.Lock()
+        # Extra frames requested by cap_cb returning True
+        self.extra = 0
+        # sys.exc_info() of the first callback failure
+        self.exc = None
+
+    def run(self):
+        while True:
+            item = self.q.get()
+            try:
+                if item is None:
+                    return
+                # After a failure just drain so put() doesn't block
+                if self.exc is None:
+                    if self.cap_cb(*item):
+                        with self.lock:
+                            self.extra += 1
+                    self.loop_cb()
+            except:
+                self.exc = sys.exc_info()
+            finally:
+                self.q.task_done()
+
+    def check(self):
+        '''Re-raise a callback failure in the calling thread'''
+        if self.exc:
+            raise self.exc[0], self.exc[1], self.exc[2]
+
+    def put(self, imgb, meta):
+        self.check()
+        self.q.put((imgb, meta))
+
+    def take_extra(self):
+        with self.lock:
+            ret = self.extra
+            self.extra = 0
+        return ret
+
+    def drain(self):
+        '''Wait for all queued frames to be handled'''
+        self.q.join()
+        self.check()
+
+    def stop(self):
+        self.q.put(None)
+        self.join()
 
 class GXS700:
-    def __init__(self, usbcontext, dev, verbose=False, init=True):
+    def __init__(self, usbcontext, dev, verbose=False, init=True, cache=False):
         self.verbose = verbose
         self.usbcontext = usbcontext
         self.dev = dev
-        self.timeout = 0
+        # Held for every transfer and for composite operations (setup, cleanup, readout, batched()...)
+        # so another thread can't splice transfers into the middle of them
+        # or hit the ControlBatch standing in for dev inside batched()
+        # Reentrant so operations can be built from other operations
+        self.lock = threading.RLock()
+        # Last state() / error() actually read, returned instead of blocking on an operation
+        self.snap = {}
+        # Control transfer timeout in ms
+        # Was 0 (forever) which hangs on wedged firmware, transfers normally take ~1 ms
+        self.timeout = 5000
+        # sw_trig() doesn't complete until the frame is taken, a few seconds
+        self.sw_trig_timeout = 15000
+        # EEPROM / flash writes and erases wait on the part
+        self.mem_w_timeout = 15000
+        # Per thread state, deadline: capture Deadline bounding transfer timeouts, see _timeout()
+        self.tls = threading.local()
         self.wait_trig_cb = lambda: None
+        # Sensor state transitions and dwell time stats, fed by state()
+        self.sm = SensorSM()
+        self.trig_wait = TrigWait(self.sm)
+        self.exp_ts_policy = EXP_TS_DEFERRED
+        # time.time() of the last exposure, None if none taken yet
+        self.exp_last = None
+        self.exp_ts_written = False
+        # StateMonitor, see mon_start()
+        self.mon = None
+        # DeviceInfo, None if needs to be (re)read
+        self.info = None
+        # EEPROM / flash reads, probes chunk sizes on first use
+        self.mem = mem.MemReader(dev, usbcontext, timeout=self.timeout)
+        # Last int_t_w() value
+        self.int_t = None
+        # FrameStatus of the last frame captured
+        self.frame_meta = None
+        # (I2C bus address, register select or None, length) => read only value, see i2c_id() and i2c.py
+        self.i2c_ids = {}
+        # snapcache.SnapCache serving flash / EEPROM reads, see cache_enable()
+        self.snapcache = None
+        if cache:
+            self.cache_enable()
         if init:
             self._init()
+            self.get_info().show()
     
-    def _controlRead_mem(self, req, max_read, addr, dump_len):
-        ret = ''
-        i = 0
-        while i < dump_len:
-            l_this = min(dump_len - i, max_read)
-            
-            res = self.dev.controlRead(0xC0, 0xB0, req, addr + i, l_this, timeout=self.timeout)
-            ret += res
-            if len(res) != l_this:
-                raise Exception("wanted 0x%04X bytes but got 0x%04X" % (l_this, len(res),))
-            i += max_read
-        return ret
+    @locked
+    def _mem_r(self, region, addr, n):
+        '''Read a memory region (see mem.py) through the current dev so batched() ordering holds'''
+        return self.mem.read(region, addr, n, dev=self.dev, timeout=self._timeout())
 
+    @locked
     def _controlWrite_mem(self, req, max_write, addr, buff):
         i = 0
         while i < len(buff):
             this = buff[i:i+max_write]
-            res = self.dev.controlWrite(0x40, 0xB0, req, addr + i, this, timeout=self.timeout)
+            res = self.dev.controlWrite(0x40, 0xB0, req, addr + i, this, timeout=self._timeout(self.mem_w_timeout))
             if res != len(this):
                 raise Exception("wanted 0x%04X bytes but got 0x%04X" % (len(this), res,))
             i += max_write
 
+    def _timeout(self, timeout=None):
+        '''Control transfer timeout in ms: timeout (default self.timeout) cut short by this thread's capture deadline'''
+        ret = timeout or self.timeout
+        deadline = getattr(self.tls, 'deadline', None)
+        if deadline is not None:
+            remaining = deadline.remaining()
+            if remaining is not None:
+                # 0 would mean no timeout
+                ret = max(1, min(ret, int(remaining * 1000)))
+        return ret
+
+    @contextlib.contextmanager
+    def batched(self, depth=8):
+        '''
+        Pipeline writes issued inside the block as async control transfers
+        A read flushes everything queued before it so sequences keep their order
+        '''
+        with self.lock:
+            raw = self.dev
+            batch = usb_batch.ControlBatch(self.usbcontext, raw, depth=depth)
+            self.dev = batch
+            try:
+                yield batch
+                batch.flush()
+            except:
+                # Queued writes already went into the snapshot but may never have reached the device
+                if self.snapcache:
+                    self.snapcache.invalidate()
+                raise
+            finally:
+                self.dev = raw
+                batch.close()
+            if self.snapcache:
+                # Save the snapshot once for everything written in the block
+                self.snapcache.flush()
+
+    @locked
     def hw_trig_arm(self):
         '''Enable taking picture when x-rays are above threshold'''
-        self.dev.controlWrite(0x40, 0xB0, 0x2E, 0, '\x00')
+        self.dev.controlWrite(0x40, 0xB0, 0x2E, 0, '\x00', timeout=self._timeout())
 
+    @locked
     def hw_trig_disarm(self):
         '''Disable taking picture when x-rays are above threshold'''
-        self.dev.controlWrite(0x40, 0xB0, 0x2F, 0, '\x00')
+        self.dev.controlWrite(0x40, 0xB0, 0x2F, 0, '\x00', timeout=self._timeout())
+
+    def cache_enable(self, d=None):
+        '''Serve flash / EEPROM reads from an on disk snapshot, validated against the device'''
+        self.snapcache = snapcache.SnapCache(self, d)
+
+    def _cached_r(self, region, addr, n):
+        if self.snapcache:
+            ret = self.snapcache.read(region, addr, n)
+            if ret is not None:
+                return ret
+        return self._mem_r(region, addr, n)
 
     def eeprom_r(self, addr, n):
         # FIXME: should be 0x0D?
-        return self._controlRead_mem(0x0B, 0x80, addr, n)
+        return self._cached_r('eeprom', addr, n)
         
     def eeprom_w(self, addr, buff):
-        return self._controlWrite_mem(0x0C, 0x80, addr, buff)
+        ret = self._controlWrite_mem(0x0C, 0x80, addr, buff)
+        if self.snapcache:
+            self.snapcache.written('eeprom', addr, buff)
+        return ret
     
+    @locked
     def flash_erase(self, addr):
         '''Erase a flash page'''
-        self.dev.controlWrite(0x40, 0xB0, 0x11, addr, chr(addr), timeout=self.timeout)
+        self.dev.controlWrite(0x40, 0xB0, 0x11, addr, chr(addr), timeout=self._timeout(self.mem_w_timeout))
+        if self.snapcache:
+            # Page size isn't known for sure, start over
+            self.snapcache.invalidate()
+        if addr < calrec.SIZE:
+            self.info = None
 
+    @locked
     def sw_trig(self):
         '''Force taking an image without x-rays.  Takes a few seconds'''
-        self.dev.controlWrite(0x40, 0xB0, 0x2b, 0, '\x00', timeout=self.timeout)
+        self.dev.controlWrite(0x40, 0xB0, 0x2b, 0, '\x00', timeout=self._timeout(self.sw_trig_timeout))
 
     def flash_r(self, addr, n):
         '''Read (FPGA?) flash'''
-        return self._controlRead_mem(0x10, 0x100, addr, n)
+        return self._cached_r('flash', addr, n)
 
     def flash_w(self, addr, buff):
         '''Write (FPGA?) flash'''
-        return self._controlWrite_mem(0x0F, 0x100, addr, buff)
+        ret = self._controlWrite_mem(0x0F, 0x100, addr, buff)
+        if self.snapcache:
+            self.snapcache.written('flash', addr, buff)
+        if addr < calrec.SIZE:
+            # Calibration record changed
+            self.info = None
+        return ret
     
     def fpga_r(self, addr):
         '''Read FPGA register'''
         return self.fpga_rv(addr, 1)[0]
     
+    @locked
     def fpga_rv(self, addr, n):
         '''Read multiple consecutive FPGA registers'''
-        ret = self.dev.controlRead(0xC0, 0xB0, 0x03, addr, n << 1, timeout=self.timeout)
+        ret = self.dev.controlRead(0xC0, 0xB0, 0x03, addr, n << 1, timeout=self._timeout())
         if len(ret) != n << 1:
             raise Exception("Didn't get all data")
         return struct.unpack('>' + ('H' * n), ret)
 
+    @locked
     def fpga_rsig(self):
         '''Read FPGA signature'''
         # 0x1234 expected
-        return struct.unpack('>H', self.dev.controlRead(0xC0, 0xB0, 0x04, 0, 2, timeout=self.timeout))[0]
+        return struct.unpack('>H', self.dev.controlRead(0xC0, 0xB0, 0x04, 0, 2, timeout=self._timeout()))[0]
     
     def fpga_w(self, addr, v):
         '''Write an FPGA register'''
         self.fpga_wv(addr, [v])
     
+    @locked
     def fpga_wv(self, addr, vs):
         '''Write multiple consecutive FPGA registers'''
         self.dev.controlWrite(0x40, 0xB0, 0x02, addr,
                 struct.pack('>' + ('H' * len(vs)), *vs),
-                timeout=self.timeout)
+                timeout=self._timeout())
     
     # FIXME: remove/hack
+    @locked
     def fpga_wv2(self, addr, vs):
         self.dev.controlWrite(0x40, 0xB0, 0x02, addr,
                 vs,
-                timeout=self.timeout)
+                timeout=self._timeout())
     
+    @locked
     def trig_param_r(self):
         '''Write trigger parameter'''
-        return self.dev.controlRead(0xC0, 0xB0, 0x25, 0, 6, timeout=self.timeout)
+        return self.dev.controlRead(0xC0, 0xB0, 0x25, 0, 6, timeout=self._timeout())
 
+    @locked
     def i2c_r(self, addr, n):
         '''Read I2C bus'''
-        return self.dev.controlRead(0xC0, 0xB0, 0x0A, addr, n, timeout=self.timeout)
+        return self.dev.controlRead(0xC0, 0xB0, 0x0A, addr, n, timeout=self._timeout())
 
+    @locked
     def i2c_w(self, addr, buff):
         '''Write I2C bus'''
-        self.dev.controlWrite(0x40, 0xB0, 0x0A, addr, buff, timeout=self.timeout)
+        self.dev.controlWrite(0x40, 0xB0, 0x0A, addr, buff, timeout=self._timeout())
+
+    def i2c(self, depth=8):
+        '''Batched I2C session, see i2c.py'''
+        return i2c.I2CSession(self, depth=depth)
+
+    @locked
+    def i2c_id(self, addr, n, reg=None):
+        '''
+        Read only I2C value (ex: device ID), read once per GXS700
+        reg: register select to write first, part of the cache key since it decides what the read returns
+        '''
+        k = (addr, reg, n)
+        if k not in self.i2c_ids:
+            if reg is not None:
+                self.i2c_w(addr, reg)
+            self.i2c_ids[k] = self.i2c_r(addr, n)
+        return self.i2c_ids[k]
     
     def tim_running(self):
         '''Get if timing analysis is running'''
         return self.fpga_r(0x2002)
 
+    @locked
     def rst(self):
         '''Reset the system'''
         # Reset is accomplished by writing a 1 to address 0xE600. 
         #self.mcu_rst(1)
-        self.dev.controlWrite(0x40, 0xB0, 0xe600, 0, 1, timeout=self.timeout)
+        self.dev.controlWrite(0x40, 0xB0, 0xe600, 0, 1, timeout=self._timeout())
         
         # Start running by writing a 0 to that address. 
         #self.mcu_rst(0)
-        self.dev.controlWrite(0x40, 0xB0, 0xe600, 0, 0, timeout=self.timeout)
+        self.dev.controlWrite(0x40, 0xB0, 0xe600, 0, 0, timeout=self._timeout())
+        # Firmware restarted, cached versions etc may no longer be valid
+        self.info = None
         
+    @locked
     def mcu_rst(self, rst):
         '''Reset FX2'''
-        self.dev.controlWrite(0x40, 0xB0, 0xe600, 0, chr(int(bool(rst))), timeout=self.timeout)
+        self.dev.controlWrite(0x40, 0xB0, 0xe600, 0, chr(int(bool(rst))), timeout=self._timeout())
 
     def mcu_w(self, addr, v):
         '''Write FX2 register'''
         self.mcu_w(addr, [v])
     
+    @locked
     def mcu_wv(self, addr, vs):
         '''Write multiple consecutive FX2 registers'''
         # Revisit if over-simplified
         self.dev.controlWrite(0x40, 0xB0, addr, 0, 
                 struct.pack('>' + ('B' * len(vs)), *vs),
-                timeout=self.timeout)
+                timeout=self._timeout())
     
     def fpga_off(self):
         '''Turn FPGA power off'''
-        self.i2c_w(0x82, '\x03\x00')
-        self.i2c_w(0x82, '\x01\x0E')
+        with self.i2c() as s:
+            s.w(0x82, '\x03\x00')
+            s.w(0x82, '\x01\x0E')
     
     def exp_cal_last(self):
         '''Get last exposure calibration'''
-        buff = self.img_ctr_r(0x100)
-        return ord(buff[6]) << 16 | ord(buff[5]) << 8 | ord(buff[4])
+        return FrameStatus.decode_ctr(self.img_ctr_r(0x100))[1]
 
     def exp_since_manu(self):
         '''Get exposure since manual?'''
-        buff = self.img_ctr_r(0x100)
-        return ord(buff[2]) << 16 | ord(buff[1]) << 8 | ord(buff[0])
+        return FrameStatus.decode_ctr(self.img_ctr_r(0x100))[0]
+
+    def status(self):
+        '''Exposure counters and calibration from a single read, see FrameStatus'''
+        return FrameStatus.read(self)
 
     def exp_ts(self):
         '''Get exposure timestamp as string'''
         return self.eeprom_r(self, 0x20, 0x17)
 
     def versions(self):
-        '''Get versions as strings'''
+        '''Get versions as (major, minor, build) tuples'''
+        return self._status('versions', self._versions_r)
+
+    @locked
+    def _versions_r(self):
         # 12 actual bytes...
-        buff = bytearray(self.dev.controlRead(0xC0, 0xB0, 0x51, 0, 0x1C, timeout=self.timeout))
-        print "MCU:     %s.%s.%s" % (buff[0], buff[1], buff[2] << 8 | buff[3])
-        print 'FPGA:    %s.%s.%s' % (buff[4], buff[5], buff[6] << 8 | buff[7])
-        print 'FGPA WG: %s.%s.%s' % (buff[8], buff[9], buff[10] << 8 | buff[11])
+        buff = bytearray(self.dev.controlRead(0xC0, 0xB0, 0x51, 0, 0x1C, timeout=self._timeout()))
+        return {
+                'mcu':      (buff[0], buff[1], buff[2] << 8 | buff[3]),
+                'fpga':     (buff[4], buff[5], buff[6] << 8 | buff[7]),
+                'fpga_wg':  (buff[8], buff[9], buff[10] << 8 | buff[11]),
+                }
+
+    @locked
+    def info_refresh(self):
+        '''Re-read static device info (versions, FPGA signature, geometry, identity)'''
+        self.info = DeviceInfo.read(self)
+        return self.info
+
+    def get_info(self):
+        '''Get cached device info, reading it if invalidated (ex: by a reset)'''
+        if self.info is None:
+            self.info_refresh()
+        return self.info
         
+    @locked
     def img_ctr_r(self, n):
-        return self.dev.controlRead(0xC0, 0xB0, 0x40, 0, n, timeout=self.timeout)
+        return self.dev.controlRead(0xC0, 0xB0, 0x40, 0, n, timeout=self._timeout())
 
+    @locked
     def img_wh(self):
         '''Get image (width, height)'''
-        return struct.unpack('>HH', self.dev.controlRead(0xC0, 0xB0, 0x23, 0, 4, timeout=self.timeout))
+        return struct.unpack('>HH', self.dev.controlRead(0xC0, 0xB0, 0x23, 0, 4, timeout=self._timeout()))
     
+    @locked
     def img_wh_w(self, w, h):
         '''Set image width, height'''
-        self.dev.controlWrite(0x40, 0xB0, 0x22, 0, struct.pack('>HH', w, h), timeout=self.timeout)
+        self.dev.controlWrite(0x40, 0xB0, 0x22, 0, struct.pack('>HH', w, h), timeout=self._timeout())
     
+    @locked
     def int_t_w(self, t):
         '''Set integration time'''
-        self.dev.controlWrite(0x40, 0xB0, 0x2C, 0, struct.pack('>H', t), timeout=self.timeout)
+        self.dev.controlWrite(0x40, 0xB0, 0x2C, 0, struct.pack('>H', t), timeout=self._timeout())
+        self.int_t = t
 
+    @locked
     def int_time(self):
         '''Get integration time units?'''
-        return struct.unpack('>HH', self.dev.controlRead(0xC0, 0xB0, 0x2D, 0, 4, timeout=self.timeout))[0]
+        return struct.unpack('>HH', self.dev.controlRead(0xC0, 0xB0, 0x2D, 0, 4, timeout=self._timeout()))[0]
         
+    @locked
     def img_ctr_rst(self):
         '''Reset image counter'''
-        self.dev.controlWrite(0x40, 0xB0, 0x41, 0, '\x00')
+        self.dev.controlWrite(0x40, 0xB0, 0x41, 0, '\x00', timeout=self._timeout())
 
     def exp_ts_w(self, ts):
         '''Write exposure timestamp'''
@@ -215,15 +644,18 @@ class GXS700:
             raise Exception('Invalid timestamp')
         self.eeprom_w(0x20, ts)
 
+    @locked
     def flash_sec_act(self, sec):
         '''Activate flash sector?'''
-        self.dev.controlWrite(0x40, 0xB0, 0x0E, sec, '')
+        self.dev.controlWrite(0x40, 0xB0, 0x0E, sec, '', timeout=self._timeout())
     
+    @locked
     def cap_mode_w(self, mode):
         if not mode in (0, 5):
             raise Exception('Invalid mode')
-        self.dev.controlWrite(0x40, 0xB0, 0x21, mode, '\x00')
+        self.dev.controlWrite(0x40, 0xB0, 0x21, mode, '\x00', timeout=self._timeout())
         
+    @locked
     def trig_param_w(self, pix_clust_ctr_thresh, bin_thresh):
         '''Set trigger parameters?'''
         buff = bytearray()
@@ -233,22 +665,67 @@ class GXS700:
         buff.append((pix_clust_ctr_thresh >> 0) & 0xFF)
         buff.append((pix_clust_ctr_thresh >> 24) & 0xFF)
         buff.append((pix_clust_ctr_thresh >> 16) & 0xFF)
-        self.dev.controlWrite(0x40, 0xB0, 0x24, 0, buff)
+        self.dev.controlWrite(0x40, 0xB0, 0x24, 0, buff, timeout=self._timeout())
 
-    def state(self):
-        '''Get camera state'''
+    def _status(self, k, read):
         '''
-        Observed states
-        -0x01: no activity
-        -0x02: short lived
-        -0x04: longer lived than 2
-        -0x08: read right before capture
+        Cheap status read that doesn't wait on another thread's operation:
+        if the lock is busy return the last value read instead
         '''
-        return ord(self.dev.controlRead(0xC0, 0xB0, 0x0020, 0x0000, 1))
+        if self.lock.acquire(False):
+            try:
+                ret = self.snap[k] = read()
+            finally:
+                self.lock.release()
+            return ret
+        if k in self.snap:
+            return self.snap[k]
+        # Nothing to fall back on yet
+        with self.lock:
+            ret = self.snap[k] = read()
+        return ret
+
+    @locked
+    def _state_r(self):
+        ret = ord(self.dev.controlRead(0xC0, 0xB0, 0x0020, 0x0000, 1, timeout=self._timeout()))
+        self.sm.update(ret)
+        return ret
+
+    @locked
+    def _error_r(self):
+        return ord(self.dev.controlRead(0xC0, 0xB0, 0x0080, 0x0000, 1, timeout=self._timeout()))
+
+    def state(self):
+        '''Get camera state, one of sensor_sm.STATE_*'''
+        return self._status('state', self._state_r)
 
     def error(self):
         '''Get error code'''
-        return ord(self.dev.controlRead(0xC0, 0xB0, 0x0080, 0x0000, 1))
+        return self._status('error', self._error_r)
+
+    def _state_sample(self):
+        '''Fresh state() even if that means waiting for an operation to finish'''
+        with self.lock:
+            ret = self.snap['state'] = self._state_r()
+        return ret
+
+    def _error_sample(self):
+        '''Fresh error() even if that means waiting for an operation to finish'''
+        with self.lock:
+            ret = self.snap['error'] = self._error_r()
+        return ret
+
+    def mon_start(self):
+        '''Start a background state monitor.  Capture waits on it instead of polling'''
+        if self.mon is None:
+            self.mon = state_mon.StateMonitor(self)
+            self.mon.start()
+        return self.mon
+
+    def mon_stop(self):
+        if self.mon:
+            self.mon.stop()
+            self.mon = None
 
     '''
     ***************************************************************************
@@ -256,21 +733,22 @@ class GXS700:
     ***************************************************************************
     '''
     
+    @locked
     def _init(self):
         state = self.state()
         print 'Init state: %d' % state
-        if state == 0x08:
+        if state == STATE_READY:
             print 'Flusing stale capture'
             self._cap_frame_bulk()
-        elif state != 0x01:
+        elif state != STATE_IDLE:
             raise Exception('Not idle, refusing to setup')
     
-        self.img_wh_w(1344, 1850)
+        self.img_wh_w(IMG_W, IMG_H)
         
         self.flash_sec_act(0x0000)
     
             
-        if self.img_wh() != (1344, 1850):
+        if self.img_wh() != (IMG_W, IMG_H):
             raise Exception("Unexpected w/h")
         
         '''
@@ -285,12 +763,14 @@ class GXS700:
         if self.fpga_rsig() != 0x1234:
             raise Exception("Invalid FPGA signature")
         
-        self._setup_fpga1()
+        with self.batched():
+            self._setup_fpga1()
         
         if self.fpga_rsig() != 0x1234:
             raise Exception("Invalid FPGA signature")
         
-        self._setup_fpga2()
+        with self.batched():
+            self._setup_fpga2()
         
         self.fpga_w(0x2002, 0x0001)
         v = self.fpga_r(0x2002)
@@ -305,54 +785,58 @@ class GXS700:
           Expected; 01
           Actual:   02
         '''
-        if self.state() != 1:
+        if self.state() != STATE_IDLE:
             print 'WARNING: unexpected state'
         
-        #self.img_wh_w(1344, 1850)
+        #self.img_wh_w(IMG_W, IMG_H)
         
         self.flash_sec_act(0x0000)
 
     
-        if self.img_wh() != (1344, 1850):
+        if self.img_wh() != (IMG_W, IMG_H):
             raise Exception("Unexpected w/h")
         
         '''
         FIXME: fails verification if already plugged in
         '''
-        if self.state() != 1:
+        if self.state() != STATE_IDLE:
             print 'WARNING: unexpected state'
     
-        self.img_wh_w(1344, 1850)
+        self.img_wh_w(IMG_W, IMG_H)
         
         self.flash_sec_act(0x0000)
         
         
-        if self.img_wh() != (1344, 1850):
+        if self.img_wh() != (IMG_W, IMG_H):
             raise Exception("Unexpected w/h")
         
-        if self.state() != 1:
+        if self.state() != STATE_IDLE:
             raise Exception('Unexpected state')
         
-        self.img_wh_w(1344, 1850)
+        self.img_wh_w(IMG_W, IMG_H)
         
         self.flash_sec_act(0x0000)
     
     
-        if self.img_wh() != (1344, 1850):
+        if self.img_wh() != (IMG_W, IMG_H):
             raise Exception("Unexpected w/h")
         
         
-        if self.state() != 1:
+        if self.state() != STATE_IDLE:
             raise Exception('Unexpected state')
         
         self.int_t_w(0x02BC)
         
         self.cap_mode_w(0)
     
-    def _cap_frame_bulk(self):
+    @locked
+    def _cap_frame_bulk(self, deadline=None):
         '''Take care of the bulk transaction prat of capturing frames'''
         global bulk_start
         
+        if deadline is None:
+            deadline = Deadline()
+        
         def async_cb(trans):
             '''
             # shutting down
@@ -361,6 +845,10 @@ class GXS700:
                 return
             '''
             
+            if aborted[0] or trans.getStatus() == libusb1.LIBUSB_TRANSFER_CANCELLED:
+                remain[0] -= 1
+                return
+            
             buf = trans.getBuffer()
             all_dat[0] += buf
             
@@ -375,79 +863,94 @@ class GXS700:
         trans_l = []
         all_submit = FRAME_SZ
         i = 0
+        rx = 0
+        all_dat = ['']
+        aborted = [False]
         while all_submit > 0:
             trans = self.dev.getTransfer()
             this_submit = max(all_submit - 0x4000, all_submit)
             this_submit = min(0x4000, this_submit)
             trans.setBulk(0x82, this_submit, callback=async_cb, user_data=None, timeout=1000)
-            trans.submit()
             trans_l.append(trans)
             all_submit -= this_submit
-    
-        rx = 0
+        def cancel_all():
+            '''Pull back whatever is still in flight, callbacks still fire (cancelled)'''
+            aborted[0] = True
+            for trans in trans_l:
+                try:
+                    trans.cancel()
+                except usb1.USBError:
+                    # Already completed or never submitted
+                    pass
+
+        # Set before anything is submitted: callbacks may run on an event thread (see multi.py)
+        # and only ever decrement it
         remain = [len(trans_l)]
-        all_dat = ['']
-        while remain[0]:
-            self.usbcontext.handleEventsTimeout(tv=0.1)
+        try:
+            for i in xrange(len(trans_l)):
+                try:
+                    trans_l[i].submit()
+                except:
+                    # The rest will never call back
+                    remain[0] -= len(trans_l) - i
+                    raise
+            while remain[0]:
+                if not aborted[0] and deadline.expired():
+                    cancel_all()
+                self.usbcontext.handleEventsTimeout(tv=0.1)
+        finally:
+            # Interrupted (failed submit, KeyboardInterrupt...) with transfers in flight
+            # libusb can't close a submitted transfer: cancel them and wait for their callbacks first
+            if remain[0]:
+                cancel_all()
+                tend = time.time() + 2.0
+                while remain[0] and time.time() < tend:
+                    self.usbcontext.handleEventsTimeout(tv=0.1)
+            for trans in trans_l:
+                if remain[0] and trans.isSubmitted():
+                    # Never called back, leak it rather than free a transfer libusb still owns
+                    continue
+                trans.close()
         
-        for i in xrange(len(trans_l)):
-            trans_l[i].close()
+        if aborted[0]:
+            deadline.check('Bulk frame read')
     
         all_dat = all_dat[0]
         return all_dat
     
-    def _cap_bin(self):
+    def _cap_bin(self, deadline=None):
         '''Capture a raw binary frame, waiting for trigger'''
         
-        self.wait_trig_cb()
+        if deadline is None:
+            deadline = Deadline()
         
-        i = 0
-        while True:
-            if i % 1000 == 0:
-                print 'scan %d' % (i,)
-            
-            # Generated from packet 861/862
-            #buff = dev.controlRead(0xC0, 0xB0, 0x0020, 0x0000, 1)
-            #if args.verbose:
-            #    print 'r1: %s' % binascii.hexlify(buff)
-            #state = ord(buff)
-            state = self.state()
-            
-            '''
-            Observed states
-            -0x01: no activity
-            -0x02: short lived
-            -0x04: longer lived than 2
-            -0x08: read right before capture
-            '''
-            if state != 0x01:
-                #print 'Non-1 state: 0x%02X' % state
-                if state == 0x08:
-                    print 'Go go go'
-                    break
+        # Transfers on this thread (including sw_trig() from wait_trig_cb) don't outlast the deadline
+        self.tls.deadline = deadline
+        try:
+            self.wait_trig_cb()
             
-            # Generated from packet 863/864
-            #buff = dev.controlRead(0xC0, 0xB0, 0x0080, 0x0000, 1)
-            #if args.verbose:
-            #    print 'r2: %s' % binascii.hexlify(buff)
-            #validate_read("\x00", buff, "packet 863/864")
-            if self.error():
-                raise Exception('Unexpected error')
-
-            i = i + 1
+            # Generated from packets 861/862 (state) and 863/864 (error), polled in a loop
+            if self.mon:
+                self.mon.wait_state(STATE_READY, timeout=self.trig_wait.timeout, deadline=deadline,
+                        busy_timeout=self.trig_wait.busy_timeout)
+            else:
+                self.trig_wait.wait(self, deadline=deadline)
+            print 'Go go go'
+            self.exp_last = time.time()
+            return self._cap_readout(deadline)
+        finally:
+            self.tls.deadline = None
 
-        
+    @locked
+    def _cap_readout(self, deadline):
+        '''Status checks and bulk read once a frame is ready'''
         # Generated from packet 783/784
         #buff = dev.controlRead(0xC0, 0xB0, 0x0040, 0x0000, 128)
         # NOTE:: req max 128 but got 8
         #validate_read("\x8E\x00\x00\x00\x58\x00\x00\x00", buff, "packet 783/784", True)
-        print 'Img ctr: %s' % binascii.hexlify(self.img_ctr_r(128))
-        
-        # Generated from packet 785/786
-        #buff = dev.controlRead(0xC0, 0xB0, 0x0040, 0x0000, 128)
-        # NOTE:: req max 128 but got 8
-        #validate_read("\x8E\x00\x00\x00\x58\x00\x00\x00", buff, "packet 785/786", True)
-        print 'Img ctr: %s' % binascii.hexlify(self.img_ctr_r(128))
+        # Vendor software reads it twice (785/786), once is enough
+        self.frame_meta = FrameStatus.read(self, self.exp_last)
+        self.frame_meta.show()
         
         # Generated from packet 787/788
         #buff = dev.controlRead(0xC0, 0xB0, 0x0080, 0x0000, 1)
@@ -460,37 +963,94 @@ class GXS700:
         #buff = self.dev.controlRead(0xC0, 0xB0, 0x0051, 0x0000, 28)
         # NOTE:: req max 28 but got 12
         #validate_read("\x00\x05\x00\x0A\x00\x03\x00\x06\x00\x04\x00\x05", buff, "packet 789/790")
-        self.versions()
-        
         # Generated from packet 791/792
         #buff = dev.controlRead(0xC0, 0xB0, 0x0004, 0x0000, 2)
         #validate_read("\x12\x34", buff, "packet 791/792")
+        # Versions are cached, see DeviceInfo
+        # Signature is re-read as a cheap check the FPGA is still configured
         if self.fpga_rsig() != 0x1234:
             raise Exception("Invalid FPGA signature")
 
-        return self._cap_frame_bulk()
+        return self._cap_frame_bulk(deadline)
 
-    def cap_binv(self, n, cap_cb, loop_cb=lambda: None):
-        self._cap_setup()
-        
-        taken = 0
-        while taken < n:
-            imgb = self._cap_bin()
-            rc = cap_cb(imgb)
-            # hack: consider doing something else
-            if rc:
-                n += 1
-            taken += 1
-            self.cap_cleanup()
-            loop_cb()
+    def cap_binv(self, n, cap_cb, loop_cb=lambda: None, timeout=None, cancel=None, burst=False, burst_depth=2, meta=False):
+        '''
+        Capture n frames, calling cap_cb(frame) for each
+        meta: call cap_cb(frame, FrameStatus) instead
+        timeout: seconds allowed per frame (trigger wait + readout), None for no limit
+        cancel: CancelToken to abort from another thread
+        burst: re-arm as soon as the frame is read out and run cap_cb / loop_cb on a worker thread
+            Callbacks still run in frame order but the next exposure doesn't wait for them
+            so don't use it if loop_cb has to finish before the next exposure (ex: rotating a CT table)
+        burst_depth: frames that can wait for callbacks before capture blocks
+        Raises Timeout or Cancelled, leaving the trigger disarmed
+        '''
+        if not meta:
+            cap_cb_meta = lambda imgb, frame_meta: cap_cb(imgb)
+        else:
+            cap_cb_meta = cap_cb
+        worker = None
+        try:
+            self._cap_setup()
+            if burst:
+                worker = BurstWorker(cap_cb_meta, loop_cb, burst_depth)
+                worker.start()
+            
+            taken = 0
+            while True:
+                if taken >= n:
+                    if worker is None:
+                        break
+                    # Frames still in callbacks may ask for more
+                    worker.drain()
+                    n += worker.take_extra()
+                    if taken >= n:
+                        break
+                
+                imgb = self._cap_bin(Deadline(timeout, cancel))
+                taken += 1
+                if worker:
+                    self.cap_cleanup()
+                    worker.put(imgb, self.frame_meta)
+                    n += worker.take_extra()
+                else:
+                    rc = cap_cb_meta(imgb, self.frame_meta)
+                    # hack: consider doing something else
+                    if rc:
+                        n += 1
+                    self.cap_cleanup()
+                    loop_cb()
+            
+            if worker:
+                worker.stop()
+                worker.check()
+        except usb1.USBErrorTimeout as e:
+            self._cap_abort(worker)
+            raise Timeout('USB transfer timed out: %s' % (e,))
+        except:
+            self._cap_abort(worker)
+            raise
 
         self.hw_trig_disarm()
+        
+        if self.exp_ts_policy == EXP_TS_DEFERRED and self.exp_last is not None:
+            self.exp_ts_w(exp_ts_fmt(self.exp_last))
+    
+    def _cap_abort(self, worker=None):
+        '''Best effort disarm after a failed capture, don't mask the original error'''
+        try:
+            self.hw_trig_disarm()
+        except usb1.USBError as e:
+            print 'WARNING: failed to disarm trigger: %s' % (e,)
+        if worker and worker.is_alive():
+            worker.stop()
     
-    def cap_bin(self):
+    def cap_bin(self, timeout=None, cancel=None):
+        '''Capture one frame, status is left in frame_meta'''
         ret = []
         def cb(buff):
             ret.append(buff)
-        self.cap_binv(1, cb)
+        self.cap_binv(1, cb, timeout=timeout, cancel=cancel)
         return ret[0]
 
     def cap_img(self):
@@ -498,32 +1058,22 @@ class GXS700:
         return self.decode(self.cap_bin())
 
     @staticmethod
-    def decode(buff):
-        '''Given bin return PIL image object'''
-        height = 1850
-        width = 1344
-        depth = 2
-        
-        # no need to reallocate each loop
-        img = Image.new("RGB", (width, height), "White")
-        
-        for y in range(height):
-            line0 = buff[y * width * depth:(y + 1) * width * depth]
-            for x in range(width):
-                b0 = ord(line0[2*x + 0])
-                b1 = ord(line0[2*x + 1])
-                
-                # FIXME: 16 bit pixel truncation to fit into png
-                #G = (b1 << 8) + b0
-                G = b1
-                
-                # In most x-rays white is the part that blocks the x-rays
-                # however, the camera reports brightness (unimpeded x-rays)
-                # compliment to give in conventional form per above
-                G = 0xFF - G
-                
-                img.putpixel((x, y), (G, G, G))
-        return img
+    def decode(buff, wh=None):
+        '''Given bin return PIL image object.  wh: (width, height), default readout geometry'''
+        width, height = wh or (IMG_W, IMG_H)
+        if len(buff) < width * height * 2:
+            raise Exception('Expected 0x%X bytes for %dx%d, got 0x%X' % (width * height * 2, width, height, len(buff)))
+        
+        # FIXME: 16 bit pixel truncation to fit into png
+        # Keep the high byte of each little endian pixel
+        G = buff[1:width * height * 2:2]
+        
+        # In most x-rays white is the part that blocks the x-rays
+        # however, the camera reports brightness (unimpeded x-rays)
+        # compliment to give in conventional form per above
+        G = G.translate(INVERT)
+        
+        return Image.frombuffer('L', (width, height), G, 'raw', 'L', 0, 1).convert('RGB')
 
     def _setup_fpga1(self):
         self.fpga_wv2(0x0400, "\x00\x00\x60\x00\x00\x00")
@@ -677,77 +1227,82 @@ class GXS700:
         self.fpga_wv2(0x10F0, "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00")
         self.fpga_wv2(0x10F8, "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00")
 
+    @locked
     def cap_cleanup(self):
-        if self.state() != 1:
+        if self.state() != STATE_IDLE:
             raise Exception('Unexpected state')
         
         if self.error():
             raise Exception('Unexpected error')
         
-        if self.state() != 1:
+        if self.state() != STATE_IDLE:
             raise Exception('Unexpected state')
         
         if self.error():
             raise Exception('Unexpected error')
         
-        self.eeprom_w(0x0020, "2015/03/19-21:44:43:087")
+        # Vendor software writes the exposure timestamp here every frame
+        #self.eeprom_w(0x0020, "2015/03/19-21:44:43:087")
+        if self.exp_ts_policy == EXP_TS_SESSION and not self.exp_ts_written and self.exp_last is not None:
+            self.exp_ts_w(exp_ts_fmt(self.exp_last))
+            self.exp_ts_written = True
         
-        if self.state() != 1:
+        if self.state() != STATE_IDLE:
             raise Exception('Unexpected state')
         
         if self.error():
             raise Exception('Unexpected error')
         
-        self.int_t_w(0x02BC)
+        with self.batched():
+            self.int_t_w(0x02BC)
+            self.cap_mode_w(0)
+            self.hw_trig_arm()
         
-        self.cap_mode_w(0)
-    
-        self.hw_trig_arm()
-        
-        if self.state() != 1:
+        if self.state() != STATE_IDLE:
             raise Exception('Unexpected state')
         
         if self.error():
             raise Exception('Unexpected error')
-        if self.state() != 1:
+        if self.state() != STATE_IDLE:
             raise Exception('Unexpected state')
         
-        if self.state() != 1:
+        if self.state() != STATE_IDLE:
             raise Exception('Unexpected state')
         
-        self.img_wh_w(1344, 1850)
+        self.img_wh_w(IMG_W, IMG_H)
         
         self.flash_sec_act(0x0000)
         
-        if self.img_wh() != (1344, 1850):
+        if self.img_wh() != (IMG_W, IMG_H):
             raise Exception("Unexpected w/h")
         
-        if self.state() != 1:
+        if self.state() != STATE_IDLE:
             raise Exception('Unexpected state')
     
         if self.error():
             raise Exception('Unexpected error')
         
-        if self.state() != 1:
+        if self.state() != STATE_IDLE:
             raise Exception('Unexpected state')
 
+    @locked
     def _cap_setup(self):
         '''Setup done right before taking an image'''
         
         self.hw_trig_arm()
         
-        if self.state() != 1:
+        if self.state() != STATE_IDLE:
             raise Exception('Unexpected state')
         
         if self.error():
             raise Exception('Unexpected error')
         
-        if self.state() != 1:
+        if self.state() != STATE_IDLE:
             raise Exception('Unexpected state')
         
         print 'Img ctr: %s' % binascii.hexlify(self.img_ctr_r(128))
         
-        if self.state() != 1:
+        if self.state() != STATE_IDLE:
             raise Exception('Unexpected state')
         
         print 'Img ctr: %s' % binascii.hexlify(self.img_ctr_r(128))
@@ -755,18 +1310,16 @@ class GXS700:
         if self.error():
             raise Exception('Unexpected error')
         
-        self.versions()
-        
-        if self.state() != 1:
+        if self.state() != STATE_IDLE:
             raise Exception('Unexpected state')
         if self.error():
             raise Exception('Unexpected error')
         
-        self.img_wh_w(1344, 1850)
+        self.img_wh_w(IMG_W, IMG_H)
         self.flash_sec_act(0x0000)
-        if self.img_wh() != (1344, 1850):
+        if self.img_wh() != (IMG_W, IMG_H):
             raise Exception("Unexpected w/h")
     
-        if self.state() != 1:
+        if self.state() != STATE_IDLE:
             raise Exception('Unexpected state')
 
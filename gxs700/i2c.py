@@ -0,0 +1,115 @@
+'''
+Batched I2C
+
+I2C goes over vendor request 0x0A with wIndex as the 8 bit bus address (ex: 0x82 in fpga_off())
+GXS700.i2c_r() / i2c_w() are one blocking control transfer each
+A session queues reads and writes and sends them all as pipelined control transfers,
+reads included since EP0 keeps them in order behind the writes, then returns the read results together:
+    with gxs.i2c() as s:
+        s.w(0x82, '\\x03\\x00')
+        s.w(0x82, '\\x01\\x0E')
+        s.r(0x82, 2)
+    print s.results
+
+Reads marked ident (chip IDs and such) are cached per GXS700 and never go out again,
+including a repeat of one within the same session
+0x0A has no register field, what a read returns depends on the register select written before it
+so the cache key is (bus address, register select, length).  Give the select as reg= to r()
+An ident read without one is only cached if nothing was written to that bus address earlier in the session
+Like i2c_r() a short read isn't an error, the result is just shorter
+'''
+
+import usb_batch
+
+class I2CSession:
+    def __init__(self, gxs, depth=8):
+        self.gxs = gxs
+        self.depth = depth
+        # ('w', addr, buff) or ('r', addr, n, ident, reg)
+        self.ops = []
+        # Read results in queue order after submit()
+        self.results = []
+
+    def w(self, addr, buff):
+        '''Queue a write of buff to bus address addr'''
+        self.ops.append(('w', addr, buff))
+        return self
+
+    def r(self, addr, n, ident=False, reg=None):
+        '''
+        Queue an n byte read from bus address addr
+        ident: read only value (ex: device ID), served from / saved to the GXS700 cache
+        reg: register select written to addr first (ex: '\\x00'), skipped along with the read on a cache hit
+        Returns the index into results
+        '''
+        self.ops.append(('r', addr, n, ident, reg))
+        return len([op for op in self.ops if op[0] == 'r']) - 1
+
+    def submit(self):
+        '''Send everything queued, return the list of read results'''
+        gxs = self.gxs
+        ops = self.ops
+        self.ops = []
+        results = [None] * len([op for op in ops if op[0] == 'r'])
+        # (result index, ident key) for ident reads already queued earlier in this session
+        dups = []
+
+        def store(i, k):
+            def cb(data):
+                results[i] = data
+                if k is not None:
+                    gxs.i2c_ids[k] = data
+            return cb
+
+        with gxs.lock:
+            # Already inside batched()?  Queue behind whatever it has
+            if isinstance(gxs.dev, usb_batch.ControlBatch):
+                batch = gxs.dev
+            else:
+                batch = usb_batch.ControlBatch(gxs.usbcontext, gxs.dev, depth=self.depth, timeout=gxs._timeout())
+            try:
+                # ident keys queued so far
+                queued = set()
+                # Bus addresses written to so far, their register pointer is unknown
+                written = set()
+                i = 0
+                for op in ops:
+                    if op[0] == 'w':
+                        _rw, addr, buff = op
+                        batch.controlWrite(0x40, 0xB0, 0x0A, addr, buff)
+                        written.add(addr)
+                        continue
+                    _rw, addr, n, ident, reg = op
+                    k = None
+                    if ident and (reg is not None or addr not in written):
+                        k = (addr, reg, n)
+                    if k is not None and k in gxs.i2c_ids:
+                        results[i] = gxs.i2c_ids[k]
+                    elif k is not None and k in queued:
+                        dups.append((i, k))
+                    else:
+                        if k is not None:
+                            queued.add(k)
+                        if reg is not None:
+                            batch.controlWrite(0x40, 0xB0, 0x0A, addr, reg)
+                            written.add(addr)
+                        batch.controlReadAsync(0xC0, 0xB0, 0x0A, addr, n, store(i, k), short_ok=True)
+                    i += 1
+                batch.flush()
+                for i, k in dups:
+                    results[i] = gxs.i2c_ids[k]
+            finally:
+                if batch is not gxs.dev:
+                    batch.close()
+        self.results = results
+        return results
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        if exc_type is None:
+            self.submit()
+        else:
+            self.ops = []
+        return False
@@ -0,0 +1,67 @@
+'''
+Intel HEX read / write
+Only what the FX2 needs: data (00) and EOF (01) records, 16 bit addresses
+
+A file is handled as a list of (address, data) segments in file order
+'''
+
+import binascii
+import struct
+
+# Bytes per data record when writing, same as fxload / sdcc
+RECORD_LEN = 16
+
+def checksum(rec):
+    return (-sum(bytearray(rec))) & 0xFF
+
+def record(rtype, addr, data=''):
+    rec = struct.pack('>BHB', len(data), addr, rtype) + data
+    return ':%s%02X' % (binascii.hexlify(rec).upper(), checksum(rec))
+
+def loads(s):
+    '''Parse Intel HEX text into [(address, data)], adjacent records merged'''
+    ret = []
+    for linen, l in enumerate(s.splitlines(), 1):
+        l = l.strip()
+        if not l:
+            continue
+        if not l.startswith(':'):
+            raise Exception('Line %d: expected record' % linen)
+        try:
+            rec = binascii.unhexlify(l[1:])
+        except TypeError:
+            raise Exception('Line %d: bad hex' % linen)
+        if len(rec) < 5:
+            raise Exception('Line %d: short record' % linen)
+        n, addr, rtype = struct.unpack('>BHB', rec[0:4])
+        data = rec[4:-1]
+        if len(data) != n:
+            raise Exception('Line %d: length 0x%02X but 0x%02X data bytes' % (linen, n, len(data)))
+        if checksum(rec[:-1]) != ord(rec[-1]):
+            raise Exception('Line %d: bad checksum' % linen)
+        if rtype == 0x01:
+            break
+        if rtype != 0x00:
+            raise Exception('Line %d: unsupported record type 0x%02X' % (linen, rtype))
+        if ret and ret[-1][0] + len(ret[-1][1]) == addr:
+            ret[-1] = (ret[-1][0], ret[-1][1] + data)
+        else:
+            ret.append((addr, data))
+    return ret
+
+def load(fn):
+    return loads(open(fn, 'r').read())
+
+def dumps(segments):
+    '''[(address, data)] => Intel HEX text'''
+    ret = []
+    for addr, data in segments:
+        if addr + len(data) > 0x10000:
+            raise Exception('Segment 0x%04X + 0x%X past 64k' % (addr, len(data)))
+        for off in xrange(0, len(data), RECORD_LEN):
+            ret.append(record(0x00, addr + off, data[off:off + RECORD_LEN]))
+    ret.append(record(0x01, 0))
+    return '\n'.join(ret) + '\n'
+
+def dump(segments, fn):
+    open(fn, 'w').write(dumps(segments))
@@ -1,5 +1,6 @@
 '''
-FIXME: extract firmware from this and properly pass it to fxload
+Load the Dexis 2010 firmware (fw/2010_stage*.hex) onto all pre-enumeration devices
+Devices, firmware and what they renumerate as are in firmware.py
 '''
 
 # https://github.com/vpelletier/python-libusb1
@@ -7,815 +8,22 @@ FIXME: extract firmware from this and properly pass it to fxload
 import usb1
 # Bare ctype wrapper, inspired from library C header file.
 import libusb1
-import binascii
-import sys
 import argparse
-import time
-import util
+import firmware
 
-def load(dev):
-    # Source data: 2010_early.cap
-
-    # Generated from packet 91/92
-    dev.controlWrite(0x40, 0xA0, 0xE600, 0x0000, "\x01")
-    # Generated from packet 93/94
-    dev.controlWrite(0x40, 0xA0, 0x0357, 0x0000, "\x90\xE6\x68\xE0\xFF\x74\xFF\xF0\xE0\xB4\x0B\x04\xEF\xF0\xD3\x22"
-              "\x90\xE6\x68\xEF\xF0\xC3\x22")
-    # Generated from packet 95/96
-    dev.controlWrite(0x40, 0xA0, 0x01B5, 0x0000, "\x90\x7F\xE9\xE0\x64\xA3\x60\x03\x02\x02\xC5\xA3\xE0\x75\x08\x00"
-              "\xF5\x09\xA3\xE0\xFE\xE4\xEE\x42\x08\x90\x7F\xEE\xE0\x75\x0A\x00"
-              "\xF5\x0B\xA3\xE0\xFE\xE4\xEE\x42\x0A\x90\x7F\xE8\xE0\x64\x40\x70"
-              "\x64\xE5\x0B\x45\x0A\x70\x03\x02\x02\xD6\xE4\x90\x7F\xC5\xF0\x90"
-              "\x7F\xB4\xE0\x20\xE3\xF9\x90\x7F\xC5\xE0\x75\x0C\x00\xF5\x0D\xE4"
-              "\xFC\xFD\xC3\xED\x95\x0D\xEC\x95\x0C\x50\x1F\x74\xC0\x2D\xF5\x82"
-              "\xE4\x34\x7E\xF5\x83\xE0\xFF\xE5\x09\x2D\xF5\x82\xE5\x08\x3C\xF5"
-              "\x83\xEF\xF0\x0D\xBD\x00\x01\x0C\x80\xD8\xE5\x0D\x25\x09\xF5\x09"
-              "\xE5\x0C\x35\x08\xF5\x08\xC3\xE5\x0B\x95\x0D\xF5\x0B\xE5\x0A\x95"
-              "\x0C\xF5\x0A\x80\x9C\x90\x7F\xE8\xE0\x64\xC0\x60\x03\x02\x02\xD6"
-              "\xE5\x0B\x45\x0A\x60\x7B\xC3\xE5\x0B\x94\x40\xE5\x0A\x94\x00\x50"
-              "\x08\x85\x0A\x0C\x85\x0B\x0D\x80\x06\x75\x0C\x00\x75\x0D\x40\xE4"
-              "\xFC\xFD\xC3\xED\x95\x0D\xEC\x95\x0C\x50\x1F\xE5\x09\x2D\xF5\x82"
-              "\xE5\x08\x3C\xF5\x83\xE0\xFF\x74\x00\x2D\xF5\x82\xE4\x34\x7F\xF5"
-              "\x83\xEF\xF0\x0D\xBD\x00\x01\x0C\x80\xD8\x90\x7F\xB5\xE5\x0D\xF0"
-              "\x25\x09\xF5\x09\xE5\x0C\x35\x08\xF5\x08\xC3\xE5\x0B\x95\x0D\xF5"
-              "\x0B\xE5\x0A\x95\x0C\xF5\x0A\x90\x7F\xB4\xE0\x30\xE2\x92\x80\xF7"
-              "\x90\x7F\xE9\xE0\xB4\xAC\x0A\xE4\x90\x7F\x00\xF0\x90\x7F\xB5\x04"
-              "\xF0\x90\x7F\xB4\xE0\x44\x02\xF0\x22")
-    # Generated from packet 97/98
-    dev.controlWrite(0x40, 0xA0, 0x0080, 0x0000, "\x90\xE6\xB9\xE0\x64\xA3\x60\x03\x02\x01\x98\xA3\xE0\x75\x08\x00"
-              "\xF5\x09\xA3\xE0\xFE\xE4\xEE\x42\x08\x90\xE6\xBE\xE0\x75\x0A\x00"
-              "\xF5\x0B\xA3\xE0\xFE\xE4\xEE\x42\x0A\x90\xE6\xB8\xE0\x64\x40\x70"
-              "\x66\xE5\x0B\x45\x0A\x70\x03\x02\x01\xAD\xE4\x90\xE6\x8A\xF0\xA3"
-              "\xF0\x90\xE6\xA0\xE0\x20\xE1\xF9\x90\xE6\x8B\xE0\x75\x0C\x00\xF5"
-              "\x0D\xE4\xFC\xFD\xC3\xED\x95\x0D\xEC\x95\x0C\x50\x1F\x74\x40\x2D"
-              "\xF5\x82\xE4\x34\xE7\xF5\x83\xE0\xFF\xE5\x09\x2D\xF5\x82\xE5\x08"
-              "\x3C\xF5\x83\xEF\xF0\x0D\xBD\x00\x01\x0C\x80\xD8\xE5\x0D\x25\x09"
-              "\xF5\x09\xE5\x0C\x35\x08\xF5\x08\xC3\xE5\x0B\x95\x0D\xF5\x0B\xE5"
-              "\x0A\x95\x0C\xF5\x0A\x80\x9A\x90\xE6\xB8\xE0\x64\xC0\x60\x03\x02"
-              "\x01\xAD\xE5\x0B\x45\x0A\x70\x03\x02\x01\xAD\xC3\xE5\x0B\x94\x40"
-              "\xE5\x0A\x94\x00\x50\x08\x85\x0A\x0C\x85\x0B\x0D\x80\x06\x75\x0C"
-              "\x00\x75\x0D\x40\xE4\xFC\xFD\xC3\xED\x95\x0D\xEC\x95\x0C\x50\x1F"
-              "\xE5\x09\x2D\xF5\x82\xE5\x08\x3C\xF5\x83\xE0\xFF\x74\x40\x2D\xF5"
-              "\x82\xE4\x34\xE7\xF5\x83\xEF\xF0\x0D\xBD\x00\x01\x0C\x80\xD8\xE4"
-              "\x90\xE6\x8A\xF0\xA3\xE5\x0D\xF0\x25\x09\xF5\x09\xE5\x0C\x35\x08"
-              "\xF5\x08\xC3\xE5\x0B\x95\x0D\xF5\x0B\xE5\x0A\x95\x0C\xF5\x0A\x90"
-              "\xE6\xA0\xE0\x30\xE1\x8C\x80\xF7\x90\xE6\xB9\xE0\xB4\xAC\x0E\x90"
-              "\xE7\x40\x74\x01\xF0\xE4\x90\xE6\x8A\xF0\xA3\x04\xF0\x90\xE6\xA0"
-              "\xE0\x44\x80\xF0\x22")
-    # Generated from packet 99/100
-    dev.controlWrite(0x40, 0xA0, 0x02DE, 0x0000, "\xC2\x01\x12\x03\x57\x92\x00\x90\x7F\x95\xE0\x44\xC0\xF0\xD2\xE8"
-              "\x30\x00\x08\x90\xE6\x68\x74\x08\xF0\x80\x07\x90\x7F\xAF\xE0\x44"
-              "\x01\xF0\x30\x00\x08\x90\xE6\x5C\x74\x01\xF0\x80\x06\x90\x7F\xAE"
-              "\x74\x01\xF0\xD2\xAF\x30\x01\xFD\x30\x00\x05\x12\x00\x80\x80\x03"
-              "\x12\x01\xB5\xC2\x01\x80\xEE")
-    # Generated from packet 101/102
-    dev.controlWrite(0x40, 0xA0, 0x0003, 0x0000, "\x02\x03\x25")
-    # Generated from packet 103/104
-    dev.controlWrite(0x40, 0xA0, 0x0325, 0x0000, "\xC0\xE0\xC0\x83\xC0\x82\xC0\x85\xC0\x84\xC0\x86\x75\x86\x00\xD2"
-              "\x01\x53\x91\xEF\x30\x00\x08\x90\xE6\x5D\x74\x01\xF0\x80\x06\x90"
-              "\x7F\xAB\x74\x01\xF0\xD0\x86\xD0\x84\xD0\x85\xD0\x82\xD0\x83\xD0"
-              "\xE0\x32")
-    # Generated from packet 105/106
-    dev.controlWrite(0x40, 0xA0, 0x0043, 0x0000, "\x02\x04\x00")
-    # Generated from packet 107/108
-    dev.controlWrite(0x40, 0xA0, 0x0400, 0x0000, "\x02\x03\x25\x00")
-    # Generated from packet 109/110
-    dev.controlWrite(0x40, 0xA0, 0x0000, 0x0000, "\x02\x03\x6E")
-    # Generated from packet 111/112
-    dev.controlWrite(0x40, 0xA0, 0x036E, 0x0000, "\x78\x7F\xE4\xF6\xD8\xFD\x75\x81\x20\x02\x02\xDE")
-    # Generated from packet 113/114
-    dev.controlWrite(0x40, 0xA0, 0xE600, 0x0000, "\x00")
-    # Generated from packet 115/116
-    dev.controlWrite(0x40, 0xA0, 0xE600, 0x0000, "\x01")
-    # Generated from packet 117/118
-    dev.controlWrite(0x40, 0xA0, 0x22C0, 0x0000, "\x00\x01\x02\x02\x03\x03\x04\x04\x05\x05")
-    # Generated from packet 119/120
-    dev.controlWrite(0x40, 0xA0, 0x1916, 0x0000, "\xD2\x88\xC2\xA8\xC2\x89\xE4\xF5\x1C\xC2\x03\xC2\x00\xC2\x02\xC2"
-              "\x01\x12\x00\x46\x75\x56\x1C\x75\x57\x00\x75\x5E\x1C\x75\x5F\x12"
-              "\x75\x54\x1C\x75\x55\x1C\x75\x5C\x1C\x75\x5D\x36\x75\x60\x1C\x75"
-              "\x61\x50\xD2\xE8\x43\xD8\x20\x90\xE6\x68\xE0\x44\x09\xF0\x90\xE6"
-              "\x5C\xE0\x44\x3D\xF0\xE0\x44\x02\xF0\xD2\xAF\x90\xE6\x80\xE0\x20"
-              "\xE1\x05\xD2\x04\x12\x16\xCC\x90\xE6\x80\xE0\x54\xF7\xF0\x53\x8E"
-              "\xF8\xC2\x03\x12\x22\xA9\x30\x01\x05\x12\x0C\x09\xC2\x01\x30\x03"
-              "\xF2\x12\x22\xEB\x50\xED\xC2\x03\x12\x21\xB5\x20\x00\x16\x90\xE6"
-              "\x82\xE0\x30\xE7\x04\xE0\x20\xE1\xEF\x90\xE6\x82\xE0\x30\xE6\x04"
-              "\xE0\x20\xE0\xE4\x12\x20\xE3\x12\x1A\x3E\x80\xC7")
-    # Generated from packet 121/122
-    dev.controlWrite(0x40, 0xA0, 0x1BFE, 0x0000, "\xD3\x22")
-    # Generated from packet 123/124
-    dev.controlWrite(0x40, 0xA0, 0x0C09, 0x0000, "\x90\xE6\xB9\xE0\x70\x03\x02\x0C\xC8\x14\x70\x03\x02\x0D\x45\x24"
-              "\xFE\x70\x03\x02\x0D\xC8\x24\xFB\x70\x03\x02\x0C\xC2\x14\x70\x03"
-              "\x02\x0C\xBC\x14\x70\x03\x02\x0C\xB0\x14\x70\x03\x02\x0C\xB6\x24"
-              "\x05\x60\x03\x02\x0E\x2C\x12\x22\xEF\x40\x03\x02\x0E\x38\x90\xE6"
-              "\xBB\xE0\x24\xFE\x60\x27\x14\x60\x38\x24\xFD\x60\x11\x14\x60\x27"
-              "\x24\x06\x70\x50\xE5\x56\x90\xE6\xB3\xF0\xE5\x57\x80\x3C\x12\x1B"
-              "\xFE\x50\x3E\xE5\x5E\x90\xE6\xB3\xF0\xE5\x5F\x80\x2D\xE5\x58\x90"
-              "\xE6\xB3\xF0\xE5\x59\x80\x23\xE5\x5A\x90\xE6\xB3\xF0\xE5\x5B\x80"
-              "\x19\x90\xE6\xBA\xE0\xFF\x12\x21\x3A\xAA\x06\xA9\x07\x7B\x01\xEA"
-              "\x49\x4B\x60\x0D\xEE\x90\xE6\xB3\xF0\xEF\x90\xE6\xB4\xF0\x02\x0E"
-              "\x38\x02\x0E\x27\x02\x0E\x27\x12\x22\x75\x02\x0E\x38\x12\x22\xE3"
-              "\x02\x0E\x38\x12\x22\xDB\x02\x0E\x38\x12\x22\x63\x02\x0E\x38\x12"
-              "\x22\xF1\x40\x03\x02\x0E\x38\x90\xE6\xB8\xE0\x24\x7F\x60\x15\x14"
-              "\x60\x19\x24\x02\x70\x63\xA2\x00\xE4\x33\x25\xE0\xFF\xA2\x02\xE4"
-              "\x33\x4F\x80\x41\xE4\x90\xE7\x40\xF0\x80\x3F\x90\xE6\xBC\xE0\x54"
-              "\x7E\xFF\x7E\x00\xE0\xD3\x94\x80\x7C\x00\x40\x04\x7D\x01\x80\x02"
-              "\x7D\x00\xEC\x4E\xFE\xED\x4F\x24\xC0\xF5\x82\x74\x22\x3E\xF5\x83"
-              "\xE4\x93\xFF\x33\x95\xE0\xFE\xEF\x24\xA1\xFF\xEE\x34\xE6\x8F\x82"
-              "\xF5\x83\xE0\x54\x01\x90\xE7\x40\xF0\xE4\xA3\xF0\x90\xE6\x8A\xF0"
-              "\x90\xE6\x8B\x74\x02\xF0\x02\x0E\x38\x02\x0E\x27\x12\x22\xF3\x40"
-              "\x03\x02\x0E\x38\x90\xE6\xB8\xE0\x24\xFE\x60\x16\x24\x02\x60\x03"
-              "\x02\x0E\x38\x90\xE6\xBA\xE0\xB4\x01\x05\xC2\x00\x02\x0E\x38\x02"
-              "\x0E\x27\x90\xE6\xBA\xE0\x70\x55\x90\xE6\xBC\xE0\x54\x7E\xFF\x7E"
-              "\x00\xE0\xD3\x94\x80\x7C\x00\x40\x04\x7D\x01\x80\x02\x7D\x00\xEC"
-              "\x4E\xFE\xED\x4F\x24\xC0\xF5\x82\x74\x22\x3E\xF5\x83\xE4\x93\xFF"
-              "\x33\x95\xE0\xFE\xEF\x24\xA1\xFF\xEE\x34\xE6\x8F\x82\xF5\x83\xE0"
-              "\x54\xFE\xF0\x90\xE6\xBC\xE0\x54\x80\x13\x13\x13\x54\x1F\xFF\xE0"
-              "\x54\x0F\x2F\x90\xE6\x83\xF0\xE0\x44\x20\xF0\x80\x72\x80\x5F\x12"
-              "\x22\xF5\x50\x6B\x90\xE6\xB8\xE0\x24\xFE\x60\x19\x24\x02\x70\x4E"
-              "\x90\xE6\xBA\xE0\xB4\x01\x04\xD2\x00\x80\x54\x90\xE6\xBA\xE0\x64"
-              "\x02\x60\x4C\x80\x39\x90\xE6\xBC\xE0\x54\x7E\xFF\x7E\x00\xE0\xD3"
-              "\x94\x80\x7C\x00\x40\x04\x7D\x01\x80\x02\x7D\x00\xEC\x4E\xFE\xED"
-              "\x4F\x24\xC0\xF5\x82\x74\x22\x3E\xF5\x83\xE4\x93\xFF\x33\x95\xE0"
-              "\xFE\xEF\x24\xA1\xFF\xEE\x34\xE6\x8F\x82\xF5\x83\x80\x0D\x90\xE6"
-              "\xA0\x80\x08\x12\x22\xCA\x50\x07\x90\xE6\xA0\xE0\x44\x01\xF0\x90"
-              "\xE6\xA0\xE0\x44\x80\xF0\x22")
-    # Generated from packet 125/126
-    dev.controlWrite(0x40, 0xA0, 0x0033, 0x0000, "\x02\x16\xFB")
-    # Generated from packet 127/128
-    dev.controlWrite(0x40, 0xA0, 0x16FB, 0x0000, "\x53\xD8\xEF\x32")
-    # Generated from packet 129/130
-    dev.controlWrite(0x40, 0xA0, 0x0003, 0x0000, "\x02\x22\xD3")
-    # Generated from packet 131/132
-    dev.controlWrite(0x40, 0xA0, 0x22D3, 0x0000, "\xC2\x89\xC2\xA8\x75\x1C\x01\x32")
-    # Generated from packet 133/134
-    dev.controlWrite(0x40, 0xA0, 0x0036, 0x0000, "\xE4\xF5\x35\xF5\x36\x7F\x03\x7E\x20\x12\x1E\xF0\x22")
-    # Generated from packet 135/136
-    dev.controlWrite(0x40, 0xA0, 0x122C, 0x0000, "\x12\x22\xB5\x7B\x00\x7A\x00\x79\x2F\x75\x44\x00\x75\x45\x08\x7F"
-              "\x08\x7E\x00\x12\x1F\xC9\x75\x2D\x00\x8F\x2E\xAF\x31\xE4\xFC\xFD"
-              "\xFE\xFB\xFA\x79\x01\xF8\x12\x0A\x95\xA8\x04\xA9\x05\xAA\x06\xAB"
-              "\x07\xE5\x30\xFE\x7C\x00\xE4\x25\x2F\xFF\xEC\x3E\xFE\xE4\xFD\xEB"
-              "\x2F\xFF\xEA\x3E\xFE\xED\x39\xFD\xEC\x38\xFC\xEF\x24\x01\xFF\xE4"
-              "\x3E\xFE\xE4\x3D\xFD\xE4\x3C\x8F\x3A\x8E\x39\x8D\x38\xF5\x37\xAF"
-              "\x35\xE4\xFC\xFD\xFE\xFB\xFA\x79\x01\xF8\x12\x0A\x95\xA8\x04\xA9"
-              "\x05\xAA\x06\xAB\x07\xE5\x34\xFE\x7C\x00\xE4\x25\x33\xFF\xEC\x3E"
-              "\xFE\xE4\xFD\xEB\x2F\xFF\xEA\x3E\xFE\xED\x39\xFD\xEC\x38\xFC\xEF"
-              "\x24\x01\xFF\xE4\x3E\xFE\xE4\x3D\xFD\xE4\x3C\x8F\x3E\x8E\x3D\x8D"
-              "\x3C\xF5\x3B\xE5\x3A\xFF\xE4\x8F\x2F\xFB\x7A\x01\xF9\xF8\xAE\x39"
-              "\xAD\x38\xAC\x37\x12\x0B\x20\xE4\x8F\x30\xFB\xFA\x79\x01\xF8\xAF"
-              "\x3A\xAE\x39\xAD\x38\xAC\x37\x12\x0B\x20\x8F\x31\xE4\xF5\x32\xE5"
-              "\x3E\xFF\xE4\x8F\x33\xFB\x7A\x01\xF9\xF8\xAE\x3D\xAD\x3C\xAC\x3B"
-              "\x12\x0B\x20\xE4\x8F\x34\xFB\xFA\x79\x01\xF8\xAF\x3E\xAE\x3D\xAD"
-              "\x3C\xAC\x3B\x12\x0B\x20\x8F\x35\xE4\xF5\x36\xFB\x7A\x00\x79\x2F"
-              "\xF5\x44\x75\x45\x08\x7F\x08\xFE\x12\x1A\xBA\x75\x2D\x00\x8F\x2E"
-              "\x22")
-    # Generated from packet 137/138
-    dev.controlWrite(0x40, 0xA0, 0x1D4B, 0x0000, "\x01\x1F\x00")
-    # Generated from packet 139/140
-    dev.controlWrite(0x40, 0xA0, 0x218F, 0x0000, "\xD2\xB4\x75\x3C\x05\x7A\x00\x79\x3C\x12\x1D\xA2\x7B\x00\x7A\x00"
-              "\x79\x3C\x7D\x01\x7C\x00\x12\x1E\x4E\xC2\xB4\xE5\x3C\x20\xE0\x03"
-              "\x7F\x00\x22\x7F\x04\x22")
-    # Generated from packet 141/142
-    dev.controlWrite(0x40, 0xA0, 0x1DA2, 0x0000, "\x7B\x00\x7D\x01\x7C\x00\x8B\x40\x8A\x41\x89\x42\x8C\x43\x8D\x44"
-              "\xE4\xFF\xFE\xC3\xEF\x95\x44\xEE\x95\x43\x50\x35\xAB\x40\xAA\x41"
-              "\xA9\x42\x8F\x82\x8E\x83\x12\x09\xB2\xFD\xE4\xFB\xFA\xED\x30\xE7"
-              "\x04\xD2\xB6\x80\x02\xC2\xB6\xD2\xB7\xED\x25\xE0\xFD\xC2\xB7\x0B"
-              "\xBB\x00\x01\x0A\xEB\x64\x08\x4A\x70\xE3\x0F\xBF\x00\x01\x0E\x80"
-              "\xC2\xC2\xB7\xC2\xB6\x22")
-    # Generated from packet 143/144
-    dev.controlWrite(0x40, 0xA0, 0x1E4E, 0x0000, "\x8B\x3D\x8A\x3E\x89\x3F\x8C\x40\x8D\x41\xE4\xFF\xFE\xE5\x41\x24"
-              "\xFF\xFD\xE5\x40\x34\xFF\xFC\xD3\xEF\x9D\xEE\x9C\x50\x34\xE4\xFD"
-              "\xFC\xD2\xB7\xE5\x42\x25\xE0\xFB\xA2\xB5\xE4\x33\x4B\xF5\x42\xC2"
-              "\xB7\x0D\xBD\x00\x01\x0C\xED\x64\x08\x4C\x70\xE5\xE5\x42\xAB\x3D"
-              "\xAA\x3E\xA9\x3F\x8F\x82\x8E\x83\x12\x09\xF1\x0F\xBF\x00\x01\x0E"
-              "\x80\xBB\xC2\xB7\x22")
-    # Generated from packet 145/146
-    dev.controlWrite(0x40, 0xA0, 0x2287, 0x0000, "\xD2\xB4\xD2\xB4\x75\x3C\x06\x7A\x00\x79\x3C\x12\x1D\xA2\xC2\xB4"
-              "\x22\xD2\xB4\x75\x3C\x04\x7B\x00\x7A\x00\x79\x3C\x12\x1D\xA4\xC2"
-              "\xB4\x22")
-    # Generated from packet 147/148
-    dev.controlWrite(0x40, 0xA0, 0x1C76, 0x0000, "\xE4\xF5\x28\xF5\x27\xF5\x26\xF5\x25\x78\x25\x12\x0B\xC3\x7B\x40"
-              "\x7A\x42\x79\x0F\x78\x00\xD3\x12\x0B\xB2\x40\x06\x12\x21\x8F\xEF"
-              "\x70\xE7\x7F\x40\x7E\x42\x7D\x0F\x7C\x00\xAB\x28\xAA\x27\xA9\x26"
-              "\xA8\x25\xC3\x12\x0B\xB2\x40\x03\x7F\x02\x22\xD2\xB4\x75\x21\x90"
-              "\xE4\xF5\x22\xF5\x23\xF5\x24\xFB\x7A\x00\x79\x21\x7D\x04\xFC\x12"
-              "\x1D\xA8\x7B\x00\x7A\x00\x79\x21\x7D\x02\x12\x1E\x4E\xC2\xB4\xE5"
-              "\x21\xB4\x01\x08\xE5\x22\xB4\x17\x03\x7F\x00\x22\x7F\x03\x22")
-    # Generated from packet 149/150
-    dev.controlWrite(0x40, 0xA0, 0x186E, 0x0000, "\x8E\x2D\x8F\x2E\xD3\xE5\x2E\x94\xFF\xE5\x2D\x94\x00\x40\x03\x7F"
-              "\x01\x22\xE4\xF5\x36\xF5\x35\xF5\x34\xF5\x33\x78\x33\x12\x0B\xC3"
-              "\x7B\x40\x7A\x42\x79\x0F\x78\x00\xD3\x12\x0B\xB2\x40\x06\x12\x21"
-              "\x8F\xEF\x70\xE7\x7F\x40\x7E\x42\x7D\x0F\x7C\x00\xAB\x36\xAA\x35"
-              "\xA9\x34\xA8\x33\xC3\x12\x0B\xB2\x40\x03\x7F\x02\x22\x12\x22\x87"
-              "\xE4\xF5\x36\xF5\x35\xF5\x34\xF5\x33\x78\x33\x12\x0B\xC3\x7B\x40"
-              "\x7A\x42\x79\x0F\x78\x00\xD3\x12\x0B\xB2\x40\x06\x12\x21\x8F\xEF"
-              "\x70\xE7\x7F\x40\x7E\x42\x7D\x0F\x7C\x00\xAB\x36\xAA\x35\xA9\x34"
-              "\xA8\x33\xC3\x12\x0B\xB2\x40\x03\x7F\x02\x22\xD2\xB4\x75\x2F\xD8"
-              "\x85\x2E\x30\xE4\xF5\x31\xF5\x32\xFB\x7A\x00\x79\x2F\x7D\x04\xFC"
-              "\x12\x1D\xA8\xC2\xB4\x7F\x00\x22")
-    # Generated from packet 151/152
-    dev.controlWrite(0x40, 0xA0, 0x133D, 0x0000, "\x8E\x2D\x8F\x2E\x8B\x2F\x8A\x30\x89\x31\xE4\xF5\x3B\xF5\x3A\xF5"
-              "\x39\xF5\x38\x78\x38\x12\x0B\xC3\x7B\x40\x7A\x42\x79\x0F\x78\x00"
-              "\xD3\x12\x0B\xB2\x40\x06\x12\x21\x8F\xEF\x70\xE7\x7F\x40\x7E\x42"
-              "\x7D\x0F\x7C\x00\xAB\x3B\xAA\x3A\xA9\x39\xA8\x38\xC3\x12\x0B\xB2"
-              "\x40\x03\x7F\x02\x22\x12\x22\x87\xE4\xF5\x3B\xF5\x3A\xF5\x39\xF5"
-              "\x38\x78\x38\x12\x0B\xC3\x7B\x40\x7A\x42\x79\x0F\x78\x00\xD3\x12"
-              "\x0B\xB2\x40\x06\x12\x21\x8F\xEF\x70\xE7\x7F\x40\x7E\x42\x7D\x0F"
-              "\x7C\x00\xAB\x3B\xAA\x3A\xA9\x39\xA8\x38\xC3\x12\x0B\xB2\x40\x03"
-              "\x7F\x02\x22\xD2\xB4\x75\x34\x02\xE5\x1F\xF5\x35\xE5\x2D\xF5\x36"
-              "\xE5\x2E\xF5\x37\x7B\x00\x7A\x00\x79\x34\x7D\x04\x7C\x00\x12\x1D"
-              "\xA8\xAB\x2F\xAA\x30\xA9\x31\xAD\x33\xAC\x32\x12\x1D\xA8\xC2\xB4"
-              "\xE4\xF5\x3B\xF5\x3A\xF5\x39\xF5\x38\x78\x38\x12\x0B\xC3\x7B\x40"
-              "\x7A\x42\x79\x0F\x78\x00\xD3\x12\x0B\xB2\x40\x06\x12\x21\x8F\xEF"
-              "\x70\xE7\x7F\x40\x7E\x42\x7D\x0F\x7C\x00\xAB\x3B\xAA\x3A\xA9\x39"
-              "\xA8\x38\xC3\x12\x0B\xB2\x40\x03\x7F\x02\x22\x12\x22\x98\x7F\x00"
-              "\x22")
-    # Generated from packet 153/154
-    dev.controlWrite(0x40, 0xA0, 0x1B31, 0x0000, "\x8E\x2D\x8F\x2E\x8B\x2F\x8A\x30\x89\x31\xE4\xF5\x3B\xF5\x3A\xF5"
-              "\x39\xF5\x38\x78\x38\x12\x0B\xC3\x7B\x40\x7A\x42\x79\x0F\x78\x00"
-              "\xD3\x12\x0B\xB2\x40\x06\x12\x21\x8F\xEF\x70\xE7\x7F\x40\x7E\x42"
-              "\x7D\x0F\x7C\x00\xAB\x3B\xAA\x3A\xA9\x39\xA8\x38\xC3\x12\x0B\xB2"
-              "\x40\x03\x7F\x02\x22\xD2\xB4\x75\x34\x03\xE5\x1F\xF5\x35\xE5\x2D"
-              "\xF5\x36\xE5\x2E\xF5\x37\x7B\x00\x7A\x00\x79\x34\x7D\x04\x7C\x00"
-              "\x12\x1D\xA8\xAB\x2F\xAA\x30\xA9\x31\xAD\x33\xAC\x32\x12\x1E\x4E"
-              "\xC2\xB4\x7F\x00\x22")
-    # Generated from packet 155/156
-    dev.controlWrite(0x40, 0xA0, 0x2009, 0x0000, "\x8F\x52\x8D\x53\xAF\x64\xAE\x63\xD3\xE5\x64\x9F\xE5\x63\x9E\x40"
-              "\x12\xE5\x64\x9F\xFD\xE5\x63\x9E\xFC\xD3\xED\x95\x67\xEC\x95\x66"
-              "\x40\xE6\x22\xC3\xE5\x64\x9F\xE5\x63\x9E\x50\xDC\xC3\xEF\x95\x64"
-              "\xFD\xEE\x95\x63\xFC\xD3\xED\x95\x67\xEC\x95\x66\x40\xCA\x22")
-    # Generated from packet 157/158
-    dev.controlWrite(0x40, 0xA0, 0x1D4E, 0x0000, "\x60\x20\xE1\x64\xFF\xF0\xFF\xF0\xFF\xFB\xFF\xF7\x80\x00\xEF\xFF"
-              "\xFF\xFB\xEF\x10\xF0\xFF\xF0\xFF\xFB\xFF\xF7\xFF\xEF\xFF\xEF\xFF"
-              "\xFB\xFF\x80\x00\x60\x20\xE1\x84\x02\x05\x03\x05\x02\x01\x03\x00"
-              "\x0E\x0F\x0C\x07\x02\x01\x06\x04\x0A\x0D\x0B\x0D\x0A\x09\x0B\x08"
-              "\x0C\x07\x0C\x07\x0A\x09\x0C\x0F")
-    # Generated from packet 159/160
-    dev.controlWrite(0x40, 0xA0, 0x210F, 0x0000, "\x8B\x2D\x8A\x2E\x89\x2F\x7B\x01\x7A\xE0\x79\x00\xE4\xF5\x35\xF5"
-              "\x36\x7F\x04\x7E\xA0\x12\x1E\xF0\x90\xE0\x00\xE0\xFF\xA3\xE0\xAB"
-              "\x2D\xAA\x2E\xA9\x2F\xCF\x8F\xF0\x02\x0A\x76")
-    # Generated from packet 161/162
-    dev.controlWrite(0x40, 0xA0, 0x22B5, 0x0000, "\xC2\xB3\xC2\xB7\xD2\xB7\xD2\xB3\xC2\xB7\x22")
-    # Generated from packet 163/164
-    dev.controlWrite(0x40, 0xA0, 0x1EA3, 0x0000, "\x8B\x2F\x8A\x30\x89\x31\xC2\xB3\x12\x21\xFD\xE5\x32\x54\x7F\xFE"
-              "\xAF\x33\x12\x21\xFD\xE4\xF5\x34\xF5\x35\xD3\xE5\x35\x95\x33\xE5"
-              "\x34\x95\x32\x50\x25\xE5\x35\x25\xE0\xFF\xE5\x34\x33\xAB\x2F\xAA"
-              "\x30\xA9\x31\x8F\x82\xF5\x83\x12\x0A\x3E\xFF\xAE\xF0\x12\x21\xFD"
-              "\x05\x35\xE5\x35\x70\xD4\x05\x34\x80\xD0\xD2\xB3\x22\x8B\x32\x8A"
-              "\x33\x89\x34\xC2\xB3\x12\x21\xFD\xE5\x35\x54\x7F\xAF\x36\x44\x80"
-              "\xFE\x12\x21\xFD\xE4\xF5\x37\xF5\x38\xD3\xE5\x38\x95\x36\xE5\x37"
-              "\x95\x35\x50\x20\xE5\x38\x25\xE0\xFF\xE5\x37\x33\xFE\xAB\x32\xE5"
-              "\x34\x2F\xF9\xE5\x33\x3E\xFA\x12\x00\x06\x05\x38\xE5\x38\x70\xD9"
-              "\x05\x37\x80\xD5\xD2\xB3\x22")
-    # Generated from packet 165/166
-    dev.controlWrite(0x40, 0xA0, 0x21FD, 0x0000, "\xE4\xFD\xC2\xB7\xEE\x20\xE7\x04\xC2\xB6\x80\x02\xD2\xB6\xD2\xB7"
-              "\xEF\x25\xE0\xFF\xEE\x33\xFE\x0D\xBD\x10\xE7\xC2\xB7\xC2\xB6\x22")
-    # Generated from packet 167/168
-    dev.controlWrite(0x40, 0xA0, 0x0006, 0x0000, "\xE4\xF5\x39\xF5\x3A\xFD\xD2\xB7\xE5\x3A\x25\xE0\xF5\x3A\xE5\x39"
-              "\x33\xF5\x39\xA2\xB5\x92\x04\xC2\xB7\xA2\x04\xE4\x33\x42\x3A\x0D"
-              "\xBD\x10\xE3\xC2\xB7\xE5\x39\x85\x3A\xF0\x02\x0A\x76")
-    # Generated from packet 169/170
-    dev.controlWrite(0x40, 0xA0, 0x2165, 0x0000, "\x75\x1E\x82\xE5\x1E\x54\xEF\x44\x08\xF5\xB0\xE4\xF5\x2D\xF5\x2E"
-              "\x7F\x01\x12\x21\xDA\x05\x2E\xE5\x2E\x70\x02\x05\x2D\xC3\x94\x05"
-              "\xE5\x2D\x94\x00\x40\xEA\x75\x1D\x0F\x22")
-    # Generated from packet 171/172
-    dev.controlWrite(0x40, 0xA0, 0x1BA6, 0x0000, "\x8F\x3B\xE5\x1D\x65\x3B\x60\x4F\x74\x01\x7E\x00\xA8\x3B\x08\x80"
-              "\x05\xC3\x33\xCE\x33\xCE\xD8\xF9\xFF\xE5\x1D\x25\xE0\x24\x64\xF5"
-              "\x82\xE4\x34\xE1\xF5\x83\xE0\x5E\xFE\xA3\xE0\x5F\x4E\x60\x04\x7F"
-              "\x01\x80\x02\x7F\x00\x8F\x3C\x12\x21\xDA\xE5\x1D\x25\xE0\x24\x84"
-              "\xF5\x82\xE4\x34\xE1\xF5\x83\xE5\x82\x25\x3C\xF5\x82\xE4\x35\x83"
-              "\xF5\x83\xE0\xF5\x1D\x80\xAB\x22")
-    # Generated from packet 173/174
-    dev.controlWrite(0x40, 0xA0, 0x1DF8, 0x0000, "\x8F\x2D\x8D\x2E\xE5\x1D\x65\x2E\x60\x05\xAF\x2E\x12\x1B\xA6\xE5"
-              "\x2E\xB4\x0F\x04\x7F\x01\x80\x02\x7F\x00\x8F\x2F\xE4\xF5\x33\xF5"
-              "\x32\xF5\x31\xF5\x30\xAF\x2D\xE4\xFC\xFD\xFE\xAB\x33\xAA\x32\xA9"
-              "\x31\xA8\x30\xC3\x12\x0B\xB2\x50\x1C\xAF\x2F\x12\x21\xDA\xE5\x33"
-              "\x24\x01\xF5\x33\xE4\x35\x32\xF5\x32\xE4\x35\x31\xF5\x31\xE4\x35"
-              "\x30\xF5\x30\x80\xD0\x22")
-    # Generated from packet 175/176
-    dev.controlWrite(0x40, 0xA0, 0x21DA, 0x0000, "\x53\x1E\x7B\xEF\x60\x04\x7F\x04\x80\x02\x7F\x00\xEF\x42\x1E\xE5"
-              "\x1E\x54\xEF\x44\x08\xF5\xB0\x43\x1E\x80\xE5\x1E\x54\xEF\x44\x08"
-              "\xF5\xB0\x22")
-    # Generated from packet 177/178
-    dev.controlWrite(0x40, 0xA0, 0x20B6, 0x0000, "\x53\x1E\x3B\xED\x60\x04\x7E\x40\x80\x02\x7E\x00\xEF\x60\x04\x7F"
-              "\x04\x80\x02\x7F\x00\xEF\x4E\x42\x1E\xE5\x1E\x54\xEF\x44\x08\xF5"
-              "\xB0\x43\x1E\x80\xE5\x1E\x54\xEF\x44\x08\xF5\xB0\x22")
-    # Generated from packet 179/180
-    dev.controlWrite(0x40, 0xA0, 0x2048, 0x0000, "\x53\x1E\x3B\xED\x60\x04\x7D\x40\x80\x02\x7D\x00\xEF\x60\x04\x7F"
-              "\x04\x80\x02\x7F\x00\xEF\x4D\x42\x1E\xE5\x1E\x54\xEF\x44\x08\xF5"
-              "\xB0\xE5\xB0\x54\x20\x25\xE0\x25\xE0\xFE\x43\x1E\x80\xE5\x1E\x54"
-              "\xEF\x44\x08\xF5\xB0\xAF\x06\x22")
-    # Generated from packet 181/182
-    dev.controlWrite(0x40, 0xA0, 0x15EF, 0x0000, "\x8E\x2D\x8F\x2E\x8C\x2F\x8D\x30\x8B\x31\xE4\xF5\x36\xF5\x37\x75"
-              "\x38\x01\xE5\x32\x70\x04\x7F\x02\x80\x02\x7F\x0A\x12\x1B\xA6\xE5"
-              "\x2E\xAE\x2D\x78\x03\xCE\xC3\x13\xCE\x13\xD8\xF9\xF5\x37\x8E\x36"
-              "\xE5\x2E\x54\x07\xFF\x74\x01\xA8\x07\x08\x80\x02\xC3\x33\xD8\xFC"
-              "\xF5\x38\xE5\x31\x70\x08\x05\x30\xE5\x30\x70\x02\x05\x2F\xAB\x33"
-              "\xAA\x34\xA9\x35\x85\x37\x82\x85\x36\x83\x12\x09\xB2\xFC\xE5\x30"
-              "\x15\x30\x70\x02\x15\x2F\x14\x45\x2F\x60\x33\xE5\x38\x70\x1A\x75"
-              "\x38\x01\x05\x37\xE5\x37\x70\x02\x05\x36\xAB\x33\xAA\x34\xA9\x35"
-              "\xF5\x82\x85\x36\x83\x12\x09\xB2\xFC\xEC\x54\x01\xFD\xE4\xFF\x12"
-              "\x20\xB6\xE5\x38\x25\xE0\xF5\x38\xEC\xC3\x13\xFC\x80\xC0\xE5\x31"
-              "\x60\x27\xE5\x38\x70\x1A\x75\x38\x01\x05\x37\xE5\x37\x70\x02\x05"
-              "\x36\xAB\x33\xAA\x34\xA9\x35\xF5\x82\x85\x36\x83\x12\x09\xB2\xFC"
-              "\xEC\x54\x01\xFD\x7F\x01\x12\x20\xB6\xE5\x32\x70\x07\x75\x1D\x01"
-              "\x7F\x03\x80\x05\x75\x1D\x09\x7F\x0B\x12\x1B\xA6\x22")
-    # Generated from packet 183/184
-    dev.controlWrite(0x40, 0xA0, 0x0FBD, 0x0000, "\x8E\x2D\x8F\x2E\x8C\x2F\x8D\x30\x8B\x31\xE4\xF5\x36\xF5\x37\xF5"
-              "\x38\xF5\x39\x75\x3A\x01\xE5\x32\x70\x04\x7F\x02\x80\x02\x7F\x0A"
-              "\x12\x1B\xA6\xE5\x2E\xAE\x2D\x78\x03\xCE\xC3\x13\xCE\x13\xD8\xF9"
-              "\xF5\x37\x8E\x36\xE5\x2E\x54\x07\xFF\x74\x01\xA8\x07\x08\x80\x02"
-              "\xC3\x33\xD8\xFC\xF5\x3A\xE5\x31\x70\x08\x05\x30\xE5\x30\x70\x02"
-              "\x05\x2F\x74\x00\x25\x39\xF5\x82\xE4\x34\xE1\xF5\x83\xE4\xF0\xAB"
-              "\x33\xAA\x34\xA9\x35\x85\x37\x82\x85\x36\x83\x12\x09\xB2\xFC\xE5"
-              "\x30\x15\x30\x70\x02\x15\x2F\x14\x45\x2F\x60\x59\xE5\x3A\x70\x2E"
-              "\x75\x3A\x01\x05\x37\xE5\x37\x70\x02\x05\x36\x05\x39\xE5\x39\x70"
-              "\x02\x05\x38\x24\x00\xF5\x82\xE4\x34\xE1\xF5\x83\xE4\xF0\xAB\x33"
-              "\xAA\x34\xA9\x35\x85\x37\x82\x85\x36\x83\x12\x09\xB2\xFC\xEC\x54"
-              "\x01\xFD\xE4\xFF\x12\x20\x48\xEF\x60\x0F\x74\x00\x25\x39\xF5\x82"
-              "\xE4\x34\xE1\xF5\x83\xE0\x45\x3A\xF0\xE5\x3A\x25\xE0\xF5\x3A\xEC"
-              "\xC3\x13\xFC\x80\x9A\xE5\x31\x60\x4F\xE5\x3A\x70\x30\x75\x3A\x01"
-              "\x05\x39\xE5\x39\x70\x02\x05\x38\x05\x37\xE5\x37\x70\x02\x05\x36"
-              "\x74\x00\x25\x39\xF5\x82\xE4\x34\xE1\xF5\x83\xE4\xF0\xAB\x33\xAA"
-              "\x34\xA9\x35\x85\x37\x82\x85\x36\x83\x12\x09\xB2\xFC\xEC\x54\x01"
-              "\xFD\x7F\x01\x12\x20\x48\xEF\x60\x0F\x74\x00\x25\x39\xF5\x82\xE4"
-              "\x34\xE1\xF5\x83\xE0\x45\x3A\xF0\xE5\x32\x70\x07\x75\x1D\x01\x7F"
-              "\x03\x80\x05\x75\x1D\x09\x7F\x0B\x12\x1B\xA6\x22\x8F\x46\x8B\x47"
-              "\x8A\x48\x89\x49\xE4\xF5\x4C\xF5\x4D\xF5\x50\xF5\x51\x12\x09\x99"
-              "\x70\x16\x90\x00\x01\x12\x09\xB2\xD3\x94\x05\x50\x0B\xE5\x4B\x64"
-              "\x02\x45\x4A\x60\x03\x7F\x00\x22\xAD\x4B\xE4\xFF\x12\x20\x09\x90"
-              "\xE6\x78\xE0\x44\x80\xF0\xE4\xF5\x4E\xF5\x4F\xE5\x4F\x45\x4E\x70"
-              "\x06\xE5\x46\x54\xFE\x80\x3E\xAB\x47\xAA\x48\xA9\x49\x12\x09\x99"
-              "\x70\x16\x90\x00\x01\x12\x09\xB2\xD3\x94\x05\x50\x0B\xE5\x4B\x64"
-              "\x02\x45\x4A\x60\x03\x7F\x00\x22\xAD\x4B\x7F\x01\x12\x20\x09\xAB"
-              "\x47\xAA\x48\xA9\x49\xE5\x4F\x24\xFF\xFF\xE5\x4E\x34\xFF\x8F\x82"
-              "\xF5\x83\x12\x09\xB2\x90\xE6\x79\xF0\xE4\xFF\xFE\x90\xE6\x78\xE0"
-              "\x20\xE0\x10\xBE\x27\x06\xBF\x10\x03\x7F\x06\x22\x0F\xBF\x00\x01"
-              "\x0E\x80\xE9\x90\xE6\x78\xE0\x30\xE2\x03\x7F\x08\x22\x90\xE6\x78"
-              "\xE0\x20\xE1\x22\x75\x4C\x00\x75\x4D\x01\xE0\x44\x40\xF0\x90\xE6"
-              "\x78\xE0\x30\xE6\xF9\x05\x51\xE5\x51\x70\x02\x05\x50\x90\xE6\x78"
-              "\xE0\x44\x80\xF0\x80\x0D\xE4\xF5\x4C\xF5\x4D\x05\x4F\xE5\x4F\x70"
-              "\x02\x05\x4E\xE5\x4D\x64\x01\x45\x4C\x70\x10\xC3\xE5\x51\x94\x10"
-              "\xE5\x50\x64\x80\x94\xA7\x50\x03\x02\x11\x38\xE5\x4B\x24\x01\xFF"
-              "\xE4\x35\x4A\xFE\xEF\x65\x4F\x70\x03\xEE\x65\x4E\x60\x03\x02\x11"
-              "\x38\xE5\x51\xB4\x10\x08\xE5\x50\xB4\x27\x03\x7F\x07\x22\x90\xE6"
-              "\x78\xE0\x44\x40\xF0\x90\xE6\x78\xE0\x20\xE6\xF9\x7F\x00\x22")
-    # Generated from packet 185/186
-    dev.controlWrite(0x40, 0xA0, 0x1511, 0x0000, "\x8B\x47\x8A\x48\x89\x49\xAD\x07\x90\xE6\x78\xE0\x44\x80\xF0\xED"
-              "\x44\x01\x90\xE6\x79\xF0\xE4\xF5\x4C\xF5\x4D\xD3\xE5\x4D\x95\x4B"
-              "\xE5\x4C\x95\x4A\x40\x03\x02\x15\xE5\xE4\xFF\xFE\x90\xE6\x78\xE0"
-              "\x20\xE0\x10\xBE\x27\x06\xBF\x10\x03\x7F\x06\x22\x0F\xBF\x00\x01"
-              "\x0E\x80\xE9\xC3\xE5\x4D\x95\x4B\xE5\x4C\x95\x4A\x50\x15\x90\xE6"
-              "\x78\xE0\x20\xE1\x0E\xE0\x44\x40\xF0\x90\xE6\x78\xE0\x30\xE6\xF9"
-              "\x7F\x07\x22\xE5\x4D\x45\x4C\x70\x17\xE5\x4B\x45\x4A\x70\x09\x90"
-              "\xE6\x78\xE0\x44\x20\xF0\x80\x00\x90\xE6\x79\xE0\xF5\x4E\x80\x49"
-              "\xE5\x4B\x24\xFF\xFF\xE5\x4A\x34\xFF\xFE\xEF\xB5\x4D\x0C\xEE\xB5"
-              "\x4C\x08\x90\xE6\x78\xE0\x44\x20\x80\x10\xE5\x4D\xB5\x4B\x0E\xE5"
-              "\x4C\xB5\x4A\x09\x90\xE6\x78\xE0\x44\x40\xF0\x80\x00\x90\xE6\x79"
-              "\xE0\xFF\xAB\x47\xAA\x48\xA9\x49\xE5\x4D\x24\xFF\xFD\xE5\x4C\x34"
-              "\xFF\x8D\x82\xF5\x83\xEF\x12\x09\xF1\x05\x4D\xE5\x4D\x70\x02\x05"
-              "\x4C\x02\x15\x2C\x90\xE6\x78\xE0\x20\xE6\xF9\x7F\x00\x22")
-    # Generated from packet 187/188
-    dev.controlWrite(0x40, 0xA0, 0x1ABA, 0x0000, "\x8E\x3F\x8F\x40\x8B\x41\x8A\x42\x89\x43\xE5\x45\x45\x44\x70\x02"
-              "\xFF\x22\xE5\x45\x24\x02\xFF\xE4\x35\x44\xFE\xC3\xEF\x94\x02\xEE"
-              "\x94\x00\x40\x21\xAB\x41\xAA\x42\xA9\x43\x74\xFE\x2F\xF5\x82\x74"
-              "\xFF\x3E\xF5\x83\x12\x09\xB2\x8F\x82\x8E\x83\x12\x09\xF1\xEF\x1F"
-              "\x70\xD9\x1E\x80\xD6\xE5\x40\xAB\x41\xAA\x42\xA9\x43\x90\x00\x01"
-              "\x12\x09\xF1\xE5\x3F\x54\x1F\x12\x09\xDF\xAB\x41\xAA\x42\xA9\x43"
-              "\xE5\x45\x24\x02\xF5\x4B\xE4\x35\x44\xF5\x4A\x7F\xA2\x12\x10\xF9"
-              "\xEF\x60\x01\x22\x7F\x00\x22")
-    # Generated from packet 189/190
-    dev.controlWrite(0x40, 0xA0, 0x1FC9, 0x0000, "\x8B\x41\x8A\x42\x89\x43\xEF\x90\x00\x01\x12\x09\xF1\xEE\x54\x1F"
-              "\x12\x09\xDF\xAB\x41\xAA\x42\xA9\x43\x75\x4A\x00\x75\x4B\x02\x7F"
-              "\xA2\x12\x10\xF9\xEF\x60\x01\x22\xAB\x41\xAA\x42\xA9\x43\x85\x44"
-              "\x4A\x85\x45\x4B\x7F\xA2\x12\x15\x11\xEF\x60\x01\x22\x7F\x00\x22")
-    # Generated from packet 191/192
-    dev.controlWrite(0x40, 0xA0, 0x0E40, 0x0000, "\x90\xE6\x00\x74\x10\xF0\x75\xB2\x0A\x75\x80\x0A\x00\x00\x00\x75"
-              "\xB5\xDF\x75\xB0\x09\x90\xE6\x7A\x74\x01\xF0\x12\x1C\x76\xEF\x60"
-              "\x02\xF5\x09\xD2\xB0\xE4\xFF\xFE\x0F\xBF\x00\x01\x0E\xBE\x01\xF8"
-              "\xBF\xF4\xF5\xC2\xB0\xE4\xFE\xFF\x0F\xBF\x00\x01\x0E\xBE\x01\xF8"
-              "\xBF\xF4\xF5\xD2\xB0\xE4\xFE\xFF\x0F\xBF\x00\x01\x0E\xBE\x01\xF8"
-              "\xBF\xF4\xF5\xC2\xB0\xE4\xFE\xFF\x0F\xBF\x00\x01\x0E\xBE\x01\xF8"
-              "\xBF\xF4\xF5\xD2\xB0\xE4\xFE\xFF\x0F\xBF\x00\x01\x0E\xBE\x01\xF8"
-              "\xBF\xF4\xF5\xC2\xB0\xE4\xFE\xFF\x0F\xBF\x00\x01\x0E\xBE\x01\xF8"
-              "\xBF\xF4\xF5\x7B\x01\x7A\xE0\x79\x00\x12\x21\x0F\x90\xE0\x00\xE0"
-              "\xFE\xA3\xE0\x20\xE0\x05\xEE\x64\x12\x60\x03\x75\x09\x05\x00\x00"
-              "\x00\x90\xE6\x01\x74\xE3\xF0\x00\x00\x00\x90\xE6\x0B\x74\x03\xF0"
-              "\x00\x00\x00\x90\xE6\x12\x74\xE0\xF0\x00\x00\x00\xE4\x90\xE6\x13"
-              "\xF0\x00\x00\x00\x90\xE6\x14\xF0\x00\x00\x00\x90\xE6\x15\xF0\x00"
-              "\x00\x00\x90\xE6\x04\x74\x80\xF0\x00\x00\x00\x74\x02\xF0\x00\x00"
-              "\x00\xE4\xF0\x00\x00\x00\x74\x80\xF0\x00\x00\x00\x74\x04\xF0\x00"
-              "\x00\x00\xE4\xF0\x00\x00\x00\x74\x80\xF0\x00\x00\x00\x74\x06\xF0"
-              "\x00\x00\x00\xE4\xF0\x00\x00\x00\x74\x80\xF0\x00\x00\x00\x74\x08"
-              "\xF0\x00\x00\x00\xE4\xF0\x00\x00\x00\x00\x00\x00\x90\xE6\x18\x74"
-              "\x0C\xF0\x00\x00\x00\xE4\x90\xE6\x19\xF0\x00\x00\x00\x90\xE6\x1A"
-              "\xF0\x00\x00\x00\x90\xE6\x1B\xF0\x00\x00\x00\x90\xE6\x02\x74\x04"
-              "\xF0\x00\x00\x00\xE4\x90\xE6\x03\xF0\x00\x00\x00\x90\xE6\x70\xF0"
-              "\x00\x00\x00\x90\xE6\x09\x74\x18\xF0\x00\x00\x00\xE4\x90\xE6\x20"
-              "\xF0\x00\x00\x00\x90\xE6\x21\x74\x40\xF0\x00\x00\x00\x90\xE6\x30"
-              "\x74\x80\xF0\x00\x00\x00\x90\xE6\x31\x74\xC0\xF0\x22")
-    # Generated from packet 193/194
-    dev.controlWrite(0x40, 0xA0, 0x142E, 0x0000, "\x75\x30\x00\x75\x31\x00\x75\x32\x27\x75\x33\x01\x75\x34\xE0\x75"
-              "\x35\x00\x7B\x00\x7A\x00\x79\x25\xE4\xF5\x38\xF5\x39\x90\xE6\xBD"
-              "\xE0\xFE\x90\xE6\xBC\xE0\x7C\x00\x24\x00\xFF\xEC\x3E\x8F\xF0\x12"
-              "\x0A\x76\x90\xE6\xBF\xE0\xFE\x90\xE6\xBE\xE0\x24\x00\xFF\xEC\x3E"
-              "\xAB\x30\xAA\x31\xA9\x32\x8F\xF0\x12\x0A\x76\xAB\x30\xAA\x31\xA9"
-              "\x32\x12\x0A\x13\xF5\x3B\x85\xF0\x3A\x90\xE6\xB8\xE0\x64\x40\x60"
-              "\x03\x02\x15\x10\xD3\xE5\x3B\x94\x00\xE5\x3A\x94\x00\x40\x73\xE4"
-              "\x90\xE6\x8A\xF0\x90\xE6\x8B\xF0\x90\xE6\xA0\xE0\x20\xE1\xF9\x90"
-              "\xE6\x8B\xE0\x75\x3C\x00\xF5\x3D\xC3\x95\x3B\xE5\x3C\x95\x3A\x50"
-              "\x0F\xC3\xE5\x3B\x95\x3D\xF5\x3B\xE5\x3A\x95\x3C\xF5\x3A\x80\x05"
-              "\xE4\xF5\x3A\xF5\x3B\xE4\xF5\x36\xF5\x37\xC3\xE5\x37\x95\x3D\xE5"
-              "\x36\x95\x3C\x50\xAF\x74\x40\x25\x37\xF5\x82\xE4\x34\xE7\xF5\x83"
-              "\xE0\xAB\x33\xAA\x34\xA9\x35\x85\x39\x82\x85\x38\x83\x12\x09\xF1"
-              "\x05\x39\xE5\x39\x70\x02\x05\x38\x05\x37\xE5\x37\x70\xCC\x05\x36"
-              "\x80\xC8\x22")
-    # Generated from packet 195/196
-    dev.controlWrite(0x40, 0xA0, 0x17B8, 0x0000, "\xE5\x28\x24\xFF\xFF\xE5\x27\x34\xFF\xFE\x7B\x01\x7A\xE0\x79\x00"
-              "\x8E\x2D\x8F\x2E\x8B\x2F\x8A\x30\x89\x31\xE4\xF5\x32\xF5\x33\xF5"
-              "\x36\xF5\x37\x05\x2E\xE5\x2E\x70\x02\x05\x2D\xE4\xF5\x32\xF5\x33"
-              "\xD3\xE5\x2E\x94\x00\xE5\x2D\x94\x00\x40\x7A\xD3\xE5\x2E\x94\x40"
-              "\xE5\x2D\x94\x00\x40\x14\x75\x34\x00\x75\x35\x40\x74\xC0\x25\x2E"
-              "\xF5\x2E\x74\xFF\x35\x2D\xF5\x2D\x80\x0B\x85\x2D\x34\x85\x2E\x35"
-              "\xE4\xF5\x2D\xF5\x2E\xE5\xBA\x20\xE0\xFB\xE4\xFF\xFE\xC3\xEF\x95"
-              "\x35\xEE\x95\x34\x50\x2B\xAB\x2F\xAA\x30\xA9\x31\x85\x33\x82\x85"
-              "\x32\x83\x12\x09\xB2\xFD\x74\x40\x2F\xF5\x82\xE4\x34\xE7\xF5\x83"
-              "\xED\xF0\x05\x33\xE5\x33\x70\x02\x05\x32\x0F\xBF\x00\x01\x0E\x80"
-              "\xCC\x00\x00\x00\xE4\x90\xE6\x8A\xF0\x00\x00\x00\x90\xE6\x8B\xE5"
-              "\x35\xF0\x02\x17\xE8\x22")
-    # Generated from packet 197/198
-    dev.controlWrite(0x40, 0xA0, 0x0056, 0x0000, "\x90\xE6\xB9\xE0\x64\xB0\x60\x03\x02\x09\x97\xA3\xE0\xFF\x12\x0B"
-              "\xE3\x03\x78\x02\x03\xA5\x03\x00\xDD\x04\x03\xD5\x0A\x03\xFF\x0B"
-              "\x04\x2C\x0C\x04\x7A\x0D\x09\x06\x0E\x09\x12\x0F\x09\x3C\x10\x09"
-              "\x67\x11\x00\xF3\x20\x01\xD7\x21\x02\x1D\x22\x02\x55\x23\x01\x17"
-              "\x24\x01\x30\x25\x01\x0E\x2B\x02\x97\x2C\x02\xB2\x2D\x01\x50\x2E"
-              "\x01\x5D\x2F\x05\x32\x30\x06\x16\x31\x06\x32\x32\x06\x3E\x33\x05"
-              "\xD2\x34\x06\x4C\x35\x06\x58\x36\x08\xDE\x37\x06\x77\x38\x04\xCB"
-              "\x40\x05\x05\x41\x01\x6A\x51\x02\xD7\x60\x03\x14\x61\x03\x51\x62"
-              "\x01\xB2\x80\x00\x00\x09\x88\x7B\x01\x7A\xE0\x79\x00\x12\x21\x0F"
-              "\x7B\x01\x7A\xE0\x79\x00\x7F\x01\x7E\x00\x02\x01\xD1\x7B\x00\x7A"
-              "\x00\x79\x29\x12\x00\x36\x90\xE0\x00\xE5\x2A\xF0\x7B\x01\x7A\xE0"
-              "\x79\x00\xE4\xFF\xFE\x02\x01\xAC\x12\x14\x2E\x12\x12\x2C\x02\x03"
-              "\xF9\x12\x14\x2E\x7B\x01\x7A\xE0\x79\x00\x75\x32\x00\x75\x33\x03"
-              "\x7F\x03\x7E\xE0\x12\x1E\xA3\x02\x03\xF9\x7B\x01\x7A\xE0\x79\x00"
-              "\x75\x35\x00\x75\x36\x03\x7F\x03\x7E\xE0\x12\x1E\xF0\x7B\x01\x7A"
-              "\xE0\x79\x00\x7F\x03\x7E\x00\x02\x01\xAC\x12\x14\x2E\xE4\xF5\x1C"
-              "\xC2\x89\xD2\xA8\x02\x02\x18\x12\x14\x2E\xE4\xF5\x1C\xC2\x89\xC2"
-              "\xA8\x02\x02\x18\x12\x14\x2E\x90\xE0\x00\xE4\xF0\xA3\x74\x05\xF0"
-              "\xA3\xE4\xF0\xA3\x74\x0A\xF0\x7B\x01\x7A\xE0\x79\x04\x75\x35\x00"
-              "\x75\x36\x01\x7F\x00\x7E\xA0\x12\x1E\xF0\x7B\x01\x7A\xE0\x79\x08"
-              "\x75\x35\x00\x75\x36\x01\xE4\xFF\xFE\x12\x1E\xF0\x7B\x01\x7A\xE0"
-              "\x79\x00\x7F\x0B\x7E\x00\x12\x17\xC8\xE4\x80\x66\xE5\x09\xF4\x90"
-              "\xE0\x00\x60\x08\xE5\x09\xF0\x75\x09\xFF\x80\x03\xE5\x0A\xF0\xE4"
-              "\xF5\x0A\x7B\x01\x7A\xE0\x79\x00\xE4\xFF\xFE\x12\x17\xC8\x02\x09"
-              "\x83\x12\x14\x2E\xE5\x26\x45\x25\x60\x1B\xE5\x26\x64\x01\x45\x25"
-              "\x60\x13\xE5\x26\x64\x03\x45\x25\x60\x0B\xE5\x26\x64\x05\x45\x25"
-              "\x60\x03\x02\x09\x88\x90\xE0\x00\xE5\x25\xF0\xA3\xE5\x26\xF0\x7B"
-              "\x01\x7A\xE0\x79\x00\xE4\xF5\x32\xF5\x33\x7F\x02\x7E\x40\x12\x1E"
-              "\xA3\xE4\xF5\x0A\x02\x09\x83\x12\x14\x2E\x90\xE0\x01\xE0\x24\xFF"
-              "\xF0\x90\xE0\x00\xE0\x34\xFF\xF0\x90\xE0\x03\xE0\x24\xFF\xF0\x90"
-              "\xE0\x02\xE0\x34\xFF\xF0\x7B\x01\x7A\xE0\x79\x00\x75\x32\x00\x75"
-              "\x33\x01\x7F\x04\x7E\x60\x12\x1E\xA3\xE4\xF5\x0A\x02\x09\x83\x7B"
-              "\x01\x7A\xE0\x79\x00\x75\x35\x00\x75\x36\x01\x7F\x04\x7E\x60\x12"
-              "\x1E\xF0\x90\xE0\x01\xE0\x04\xF0\x70\x06\x90\xE0\x00\xE0\x04\xF0"
-              "\x90\xE0\x03\xE0\x04\xF0\x70\x06\x90\xE0\x02\xE0\x04\xF0\x7B\x01"
-              "\x7A\xE0\x79\x00\x7F\x03\x7E\x00\x12\x17\xC8\xE4\xF5\x0A\x02\x09"
-              "\x83\x12\x14\x2E\x7B\x01\x7A\xE0\x79\x00\xE4\xF5\x32\xF5\x33\x7F"
-              "\x04\x7E\x20\x12\x1E\xA3\xE4\xF5\x0A\x02\x09\x83\x7B\x01\x7A\xE0"
-              "\x79\x00\xE4\xF5\x35\xF5\x36\x7F\x04\x7E\x20\x12\x1E\xF0\x7B\x01"
-              "\x7A\xE0\x79\x00\x7F\x01\x7E\x00\x12\x17\xC8\xE4\xF5\x0A\x02\x09"
-              "\x83\x12\x14\x2E\xE5\x26\xAE\x25\x78\x02\xC3\x33\xCE\x33\xCE\xD8"
-              "\xF9\x24\x00\xF5\x24\xEE\x34\x04\xF5\x23\x7B\x01\x7A\xE0\x79\x00"
-              "\xE5\x27\xC3\x13\xFE\xE5\x28\x13\x24\xFF\xF5\x33\xEE\x34\xFF\xF5"
-              "\x32\xAF\x24\xAE\x23\x12\x1E\xA3\xE4\xF5\x0A\x02\x09\x83\x12\x14"
-              "\x2E\xE5\x26\xAE\x25\x78\x03\xC3\x33\xCE\x33\xCE\xD8\xF9\x24\x00"
-              "\xF5\x24\xEE\x34\x10\xF5\x23\x7B\x01\x7A\xE0\x79\x00\xE5\x27\xC3"
-              "\x13\xFE\xE5\x28\x13\x24\xFF\xF5\x33\xEE\x34\xFF\xF5\x32\xAF\x24"
-              "\xAE\x23\x12\x1E\xA3\xE4\xF5\x0A\x02\x09\x83\x12\x14\x2E\x90\xE0"
-              "\x00\xE4\xF0\xA3\x04\xF0\x75\x27\x00\xF5\x28\xFB\x7A\xE0\x79\x00"
-              "\xE4\xF5\x32\xF5\x33\x7F\x02\x7E\x20\x12\x1E\xA3\xE4\xF5\x0A\x02"
-              "\x09\x83\x12\x14\x2E\x85\x25\x23\x85\x26\x24\x7B\x01\x7A\xE0\x79"
-              "\x00\xE5\x27\xC3\x13\xFE\xE5\x28\x13\x24\xFF\xF5\x33\xEE\x34\xFF"
-              "\xF5\x32\xAF\x24\xAE\x23\x12\x1E\xA3\xE4\xF5\x0A\x02\x09\x83\x12"
-              "\x14\x2E\x85\x25\x23\x85\x26\x24\x7B\x01\x7A\xE0\x79\x00\xE5\x27"
-              "\xC3\x13\xFE\xE5\x28\x13\x24\xFF\xF5\x36\xEE\x34\xFF\xF5\x35\xAF"
-              "\x24\xAE\x23\x12\x1E\xF0\x12\x17\xB8\xE4\xF5\x0A\x02\x09\x83\x12"
-              "\x14\x2E\x85\x25\x23\x85\x26\x24\x7B\x01\x7A\xE0\x79\x00\x85\x27"
-              "\x44\x85\x28\x45\xAF\x24\xAE\x23\x12\x1A\xBA\x8F\x22\xEF\x60\x03"
-              "\x02\x09\x7C\xE4\xF5\x0A\x02\x09\x83\x12\x14\x2E\x85\x25\x23\x85"
-              "\x26\x24\x7B\x01\x7A\xE0\x79\x00\x85\x27\x44\x85\x28\x45\xAF\x24"
-              "\xAE\x23\x12\x1F\xC9\x8F\x22\xEF\x60\x03\x02\x09\x7C\x12\x17\xB8"
-              "\xE4\xF5\x0A\x02\x09\x83\x12\x14\x2E\x85\x25\x23\x85\x26\x24\xC3"
-              "\xE5\x24\x94\x20\xE5\x23\x94\x00\x40\x13\xE5\x24\x25\x28\xFF\xE5"
-              "\x23\x35\x27\xFE\xD3\xEF\x94\xFF\xEE\x94\x1F\x40\x06\x75\x0A\x01"
-              "\xE4\xF5\x21\x7B\x01\x7A\xE0\x79\x00\x85\x27\x44\x85\x28\x45\xAF"
-              "\x24\xAE\x23\x12\x1A\xBA\x8F\x22\xEF\x60\x03\x02\x09\x7C\xE4\xF5"
-              "\x0A\x02\x09\x83\x12\x14\x2E\x85\x25\x23\x85\x26\x24\xC3\xE5\x24"
-              "\x94\x20\xE5\x23\x94\x00\x40\x13\xE5\x24\x25\x28\xFF\xE5\x23\x35"
-              "\x27\xFE\xD3\xEF\x94\xFF\xEE\x94\x1F\x40\x06\x75\x0A\x01\xE4\xF5"
-              "\x21\x7B\x01\x7A\xE0\x79\x00\x85\x27\x44\x85\x28\x45\xAF\x24\xAE"
-              "\x23\x12\x1F\xC9\x8F\x22\xEF\x60\x03\x02\x09\x7C\x12\x17\xB8\xE4"
-              "\xF5\x0A\x02\x09\x83\x12\x14\x2E\x7B\x01\x7A\xE0\x79\x00\x75\x44"
-              "\x00\x75\x45\x08\x7F\x08\x7E\x00\x12\x1F\xC9\xEF\x60\x04\x7F\x01"
-              "\x80\x02\x7F\x00\x8F\x22\xEF\x60\x03\x02\x09\x7C\x7B\x01\x7A\xE0"
-              "\x79\x00\x7F\x07\x7E\x00\x12\x17\xC8\xE4\xF5\x0A\x02\x09\x83\x12"
-              "\x14\x2E\xE4\x90\xE0\x00\xF0\xA3\xF0\xA3\xF0\xA3\xF0\x7B\x01\x7A"
-              "\xE0\x79\x00\xF5\x44\x75\x45\x04\x7F\x0C\xFE\x12\x1A\xBA\x8F\x22"
-              "\xEF\x60\x03\x02\x09\x7C\xE4\xF5\x0A\x02\x09\x83\x12\x14\x2E\x90"
-              "\xE0\x00\xE0\xF5\x0D\xA3\xE0\xF5\x0E\xA3\xE0\xF5\x16\xA3\xE0\xF5"
-              "\x17\xA3\xE0\xFE\xA3\xE0\x75\x0B\x00\xF5\x0C\xEE\x75\x0F\x00\xF5"
-              "\x10\xE5\x26\xF5\x18\xE5\x25\xF5\x13\xE5\x10\x64\x02\x45\x0F\x70"
-              "\x3B\xAB\x0C\x75\x32\x01\xF5\x33\x75\x34\x00\x75\x35\x18\x7D\x08"
-              "\xFC\xFF\xFE\x12\x15\xEF\xAB\x0C\xE4\xF5\x32\x75\x33\x01\x75\x34"
-              "\xE0\x75\x35\x06\xAD\x17\xAC\x16\xAF\x0E\xAE\x0D\x12\x15\xEF\x7D"
-              "\x0C\xAF\x13\x12\x1D\xF8\xE4\xF5\x0A\x02\x09\x83\xE5\x10\x45\x0F"
-              "\x60\x08\xE5\x10\x64\x01\x45\x0F\x70\x1F\xAB\x0C\x85\x10\x32\x75"
-              "\x33\x01\x75\x34\xE0\x75\x35\x06\xAD\x17\xAC\x16\xAF\x0E\xAE\x0D"
-              "\x12\x15\xEF\xE4\xF5\x0A\x02\x09\x83\x02\x09\x88\x12\x14\x2E\x90"
-              "\xE0\x00\xE0\xF5\x0D\xA3\xE0\xF5\x0E\xA3\xE0\xF5\x16\xA3\xE0\xF5"
-              "\x17\xA3\xE0\xFE\xA3\xE0\x75\x0B\x00\xF5\x0C\xEE\x75\x0F\x00\xF5"
-              "\x10\xAB\x0C\x85\x10\x32\x75\x33\x01\x75\x34\xE0\x75\x35\x06\xAD"
-              "\x17\xAC\x16\xAF\x0E\xAE\x0D\x12\x0F\xBD\xE4\xF5\x0A\x02\x09\x83"
-              "\x12\x14\x2E\xE5\x28\x24\xFF\xFF\xE5\x27\x34\xFF\xFE\x7B\x01\x7A"
-              "\xE1\x79\x00\x12\x17\xC8\xE4\xF5\x0A\x02\x09\x83\x12\x14\x2E\x12"
-              "\x21\x65\xE4\xF5\x0A\x02\x09\x83\x12\x14\x2E\xAF\x26\x12\x1B\xA6"
-              "\xE4\xF5\x0A\x02\x09\x83\x12\x14\x2E\x85\x26\x1D\xE4\xF5\x0A\x02"
-              "\x09\x83\x12\x14\x2E\x90\xE0\x00\xE0\xFE\xA3\xE0\x75\x29\x00\xF5"
-              "\x2A\xEE\xF5\x19\xAD\x2A\xAF\x19\x12\x1D\xF8\xE4\xF5\x0A\x02\x09"
-              "\x83\x12\x14\x2E\xE4\xF5\x14\xF5\x15\x85\x25\x1A\x85\x26\x1B\xF5"
-              "\x0A\x75\x21\x01\xD3\xE5\x1B\x94\x00\xE5\x1A\x94\x00\x50\x03\x02"
-              "\x09\x8E\xE5\x0A\x60\x03\x02\x09\x8E\xE5\x1B\x15\x1B\x70\x02\x15"
-              "\x1A\xE5\x15\x25\xE0\xFF\xE5\x14\x33\xFE\x74\x00\x2F\xF5\x82\x74"
-              "\xE0\x3E\xF5\x83\xE0\xF5\x2B\xA3\xE0\xF5\x2C\x64\x30\x45\x2B\x60"
-              "\x03\x02\x07\x75\xE5\x15\x25\xE0\xFF\xE5\x14\x33\xFE\x74\x02\x2F"
-              "\xF5\x82\x74\xE0\x3E\xF5\x83\xE0\xF5\x0D\xA3\xE0\xF5\x0E\x74\x04"
-              "\x2F\xF5\x82\x74\xE0\x3E\xF5\x83\xE0\xF5\x16\xA3\xE0\xF5\x17\x74"
-              "\x06\x2F\xF5\x82\x74\xE0\x3E\xF5\x83\xE0\xFE\xA3\xE0\x75\x0B\x00"
-              "\xF5\x0C\xEE\xF5\x10\x75\x0F\x00\xAB\x0C\xF5\x32\xE5\x15\x25\xE0"
-              "\xFF\xE5\x14\x33\xFE\x74\x08\x2F\xF9\x74\xE0\x3E\x75\x33\x01\xF5"
-              "\x34\x89\x35\xAD\x17\xAC\x16\xAF\x0E\xAE\x0D\x12\x15\xEF\xE5\x17"
-              "\x54\x07\x70\x10\xE5\x17\xAE\x16\x78\x03\xCE\xC3\x13\xCE\x13\xD8"
-              "\xF9\xFF\x80\x13\xE5\x17\xAE\x16\x78\x03\xCE\xC3\x13\xCE\x13\xD8"
-              "\xF9\x24\x01\xFF\xE4\x3E\xFE\x8E\x11\x8F\x12\xE5\x12\x20\xE0\x03"
-              "\x02\x08\x27\xE5\x12\x24\x01\xFF\xE4\x35\x11\xFE\x02\x08\x27\xE5"
-              "\x2C\x64\x34\x45\x2B\x60\x03\x02\x08\x47\xE5\x15\x25\xE0\xFF\xE5"
-              "\x14\x33\xFE\x74\x02\x2F\xF5\x82\x74\xE0\x3E\xF5\x83\xE0\xF5\x0D"
-              "\xA3\xE0\xF5\x0E\x74\x04\x2F\xF5\x82\x74\xE0\x3E\xF5\x83\xE0\xF5"
-              "\x16\xA3\xE0\xF5\x17\x74\x06\x2F\xF5\x82\x74\xE0\x3E\xF5\x83\xE0"
-              "\xFE\xA3\xE0\x75\x0B\x00\xF5\x0C\xEE\xF5\x10\x75\x0F\x00\xAB\x0C"
-              "\xF5\x32\xE5\x15\x25\xE0\xFF\xE5\x14\x33\xFE\x74\x08\x2F\xF9\x74"
-              "\xE0\x3E\x75\x33\x01\xF5\x34\x89\x35\xAD\x17\xAC\x16\xAF\x0E\xAE"
-              "\x0D\x12\x0F\xBD\xE5\x17\x54\x07\x70\x10\xE5\x17\xAE\x16\x78\x03"
-              "\xCE\xC3\x13\xCE\x13\xD8\xF9\xFF\x80\x13\xE5\x17\xAE\x16\x78\x03"
-              "\xCE\xC3\x13\xCE\x13\xD8\xF9\x24\x01\xFF\xE4\x3E\xFE\x8E\x11\x8F"
-              "\x12\xE5\x12\x20\xE0\x02\x80\x09\xE5\x12\x24\x01\xFF\xE4\x35\x11"
-              "\xFE\x8E\x11\x8F\x12\xE5\x11\xC3\x13\xFE\xE5\x12\x13\xFF\xE5\x15"
-              "\x24\x04\xCD\xE4\x35\x14\xCD\x2F\xF5\x15\xED\x3E\xF5\x14\x02\x06"
-              "\x8A\xE5\x2C\x64\x32\x45\x2B\x70\x0E\x12\x21\x65\x05\x15\xE5\x15"
-              "\x70\x02\x05\x14\x02\x06\x8A\xE5\x2C\x64\x33\x45\x2B\x70\x1B\xE5"
-              "\x15\x25\xE0\xFF\xE5\x14\x33\xFE\x74\x02\x2F\xF5\x82\x74\xE0\x3E"
-              "\xF5\x83\xA3\xE0\xFF\x12\x1B\xA6\x80\x47\xE5\x2C\x64\x35\x45\x2B"
-              "\x70\x19\xE5\x15\x25\xE0\xFF\xE5\x14\x33\xFE\x74\x02\x2F\xF5\x82"
-              "\x74\xE0\x3E\xF5\x83\xA3\xE0\xF5\x1D\x80\x26\xE5\x2C\x64\x36\x45"
-              "\x2B\x70\x2C\xE5\x15\x25\xE0\xFF\xE5\x14\x33\xFE\x74\x02\x2F\xF5"
-              "\x82\x74\xE0\x3E\xF5\x83\xE0\xFC\xA3\xE0\xFD\xEC\xFF\xED\x12\x1D"
-              "\xF8\x74\x02\x25\x15\xF5\x15\xE4\x35\x14\xF5\x14\x02\x06\x8A\x75"
-              "\x0A\x01\xE4\xF5\x21\x02\x06\x8A\x12\x14\x2E\x74\x55\x90\xE0\x00"
-              "\xF0\xA3\xF0\xA3\xF0\xA3\xF0\xA3\xF0\xA3\xF0\xA3\xF0\xA3\xF0\xA3"
-              "\xF0\xA3\xF0\xA3\xF0\xA3\xF0\x12\x17\xB8\xE4\xF5\x0A\x02\x09\x83"
-              "\x12\x14\x2E\x85\x26\x1F\xE4\xF5\x0A\x02\x09\x83\x12\x14\x2E\x85"
-              "\x25\x23\x85\x26\x24\x7B\x01\x7A\xE0\x79\x00\x85\x27\x32\x85\x28"
-              "\x33\xAF\x24\xAE\x23\x12\x13\x3D\x8F\x22\xEF\x60\x03\x02\x09\x7C"
-              "\xE4\xF5\x0A\x02\x09\x83\x12\x14\x2E\x85\x25\x23\x85\x26\x24\x7B"
-              "\x01\x7A\xE0\x79\x00\x85\x27\x32\x85\x28\x33\xAF\x24\xAE\x23\x12"
-              "\x1B\x31\x8F\x22\xEF\x60\x02\x80\x1D\x12\x17\xB8\xE4\xF5\x0A\x80"
-              "\x1C\x12\x14\x2E\x85\x25\x23\x85\x26\x24\xAF\x24\xAE\x23\x12\x18"
-              "\x6E\x8F\x22\xEF\x60\x04\xF5\x0A\x80\x0B\xE4\xF5\x0A\x75\x21\x01"
-              "\x80\x06\x75\x0A\x01\xE4\xF5\x21\xE5\x21\xB4\x01\x02\xD3\x22\xC3"
-              "\x22\xC3\x22")
-    # Generated from packet 199/200
-    dev.controlWrite(0x40, 0xA0, 0x1D96, 0x0000, "\x02\x63\x00\x00\x02\x66\x00\x08\x01\x62\x01")
-    # Generated from packet 201/202
-    dev.controlWrite(0x40, 0xA0, 0x0046, 0x0000, "\x12\x0E\x40\x90\xE6\x05\xE0\x54\xFD\xF0\xD2\x00\x22")
-    # Generated from packet 203/204
-    dev.controlWrite(0x40, 0xA0, 0x22A9, 0x0000, "\xE5\x1C\xB4\x01\x06\xE4\xF5\x1C\x12\x12\x2C\x22")
-    # Generated from packet 205/206
-    dev.controlWrite(0x40, 0xA0, 0x22EB, 0x0000, "\xC2\x83\xD3\x22")
-    # Generated from packet 207/208
-    dev.controlWrite(0x40, 0xA0, 0x1A3E, 0x0000, "\xD2\x83\xE4\xFF\xFE\x0F\xBF\x00\x01\x0E\xBE\x03\xF8\xBF\xE8\xF5"
-              "\xD2\xB0\xE4\xFE\xFF\x0F\xBF\x00\x01\x0E\xBE\x03\xF8\xBF\xE8\xF5"
-              "\xC2\xB0\xE4\xFE\xFF\x0F\xBF\x00\x01\x0E\xBE\x03\xF8\xBF\xE8\xF5"
-              "\x00\x00\x00\x90\xE6\x04\x74\x80\xF0\x00\x00\x00\x74\x02\xF0\x00"
-              "\x00\x00\xE4\xF0\x00\x00\x00\x74\x80\xF0\x00\x00\x00\x74\x04\xF0"
-              "\x00\x00\x00\xE4\xF0\x00\x00\x00\x74\x80\xF0\x00\x00\x00\x74\x06"
-              "\xF0\x00\x00\x00\xE4\xF0\x00\x00\x00\x74\x80\xF0\x00\x00\x00\x74"
-              "\x08\xF0\x00\x00\x00\xE4\xF0\x00\x00\x00\xD3\x22")
-    # Generated from packet 209/210
-    dev.controlWrite(0x40, 0xA0, 0x22EF, 0x0000, "\xD3\x22")
-    # Generated from packet 211/212
-    dev.controlWrite(0x40, 0xA0, 0x22DB, 0x0000, "\x90\xE6\xBA\xE0\xF5\x68\xD3\x22")
-    # Generated from packet 213/214
-    dev.controlWrite(0x40, 0xA0, 0x2263, 0x0000, "\x90\xE7\x40\xE5\x68\xF0\xE4\x90\xE6\x8A\xF0\x90\xE6\x8B\x04\xF0"
-              "\xD3\x22")
-    # Generated from packet 215/216
-    dev.controlWrite(0x40, 0xA0, 0x22E3, 0x0000, "\x90\xE6\xBA\xE0\xF5\x65\xD3\x22")
-    # Generated from packet 217/218
-    dev.controlWrite(0x40, 0xA0, 0x2275, 0x0000, "\x90\xE7\x40\xE5\x65\xF0\xE4\x90\xE6\x8A\xF0\x90\xE6\x8B\x04\xF0"
-              "\xD3\x22")
-    # Generated from packet 219/220
-    dev.controlWrite(0x40, 0xA0, 0x22F1, 0x0000, "\xD3\x22\xD3\x22\xD3\x22")
-    # Generated from packet 221/222
-    dev.controlWrite(0x40, 0xA0, 0x22CA, 0x0000, "\x12\x00\x56\x40\x02\xD3\x22\xC3\x22")
-    # Generated from packet 223/224
-    dev.controlWrite(0x40, 0xA0, 0x221D, 0x0000, "\xC0\xE0\xC0\x83\xC0\x82\xD2\x01\x53\x91\xEF\x90\xE6\x5D\x74\x01"
-              "\xF0\xD0\x82\xD0\x83\xD0\xE0\x32")
-    # Generated from packet 225/226
-    dev.controlWrite(0x40, 0xA0, 0x224D, 0x0000, "\xC0\xE0\xC0\x83\xC0\x82\x53\x91\xEF\x90\xE6\x5D\x74\x04\xF0\xD0"
-              "\x82\xD0\x83\xD0\xE0\x32")
-    # Generated from packet 227/228
-    dev.controlWrite(0x40, 0xA0, 0x1F3A, 0x0000, "\xC0\xE0\xC0\x83\xC0\x82\xC0\xD0\xE5\x64\x45\x63\x70\x05\x75\x62"
-              "\x01\x80\x0D\xE5\x64\xB4\xFF\x08\xE5\x63\xB4\xFF\x03\x75\x62\x00"
-              "\xE5\x62\xB4\x01\x0A\x05\x64\xE5\x64\x70\x0C\x05\x63\x80\x08\xE5"
-              "\x64\x15\x64\x70\x02\x15\x63\x53\x91\xEF\x90\xE6\x5D\x74\x02\xF0"
-              "\xD0\xD0\xD0\x82\xD0\x83\xD0\xE0\x32")
-    # Generated from packet 229/230
-    dev.controlWrite(0x40, 0xA0, 0x2080, 0x0000, "\xC0\xE0\xC0\x83\xC0\x82\x85\x5C\x58\x85\x5D\x59\x85\x59\x82\x85"
-              "\x58\x83\xA3\x74\x02\xF0\x85\x54\x5A\x85\x55\x5B\x85\x5B\x82\x85"
-              "\x5A\x83\xA3\x74\x07\xF0\x53\x91\xEF\x90\xE6\x5D\x74\x10\xF0\xD0"
-              "\x82\xD0\x83\xD0\xE0\x32")
-    # Generated from packet 231/232
-    dev.controlWrite(0x40, 0xA0, 0x2235, 0x0000, "\xC0\xE0\xC0\x83\xC0\x82\xD2\x03\x53\x91\xEF\x90\xE6\x5D\x74\x08"
-              "\xF0\xD0\x82\xD0\x83\xD0\xE0\x32")
-    # Generated from packet 233/234
-    dev.controlWrite(0x40, 0xA0, 0x1CE5, 0x0000, "\xC0\xE0\xC0\x83\xC0\x82\x90\xE6\x80\xE0\x30\xE7\x49\x85\x54\x58"
-              "\x85\x55\x59\x75\x66\x00\x75\x67\xF0\x85\x59\x82\x85\x58\x83\xA3"
-              "\x74\x02\xF0\x85\x5C\x5A\x85\x5D\x5B\x85\x5B\x82\x85\x5A\x83\xA3"
-              "\x74\x07\xF0\x00\x00\x00\x90\xE6\x20\x74\x02\xF0\x00\x00\x00\x90"
-              "\xE6\x21\xE4\xF0\x00\x00\x00\x90\xE6\x30\x74\x98\xF0\x00\x00\x00"
-              "\x90\xE6\x31\x74\x64\xF0\x53\x91\xEF\x90\xE6\x5D\x74\x20\xF0\xD0"
-              "\x82\xD0\x83\xD0\xE0\x32")
-    # Generated from packet 235/236
-    dev.controlWrite(0x40, 0xA0, 0x16FF, 0x0000, "\x32")
-    # Generated from packet 237/238
-    dev.controlWrite(0x40, 0xA0, 0x22F7, 0x0000, "\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32"
-              "\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32"
-              "\x32\x32\x32")
-    # Generated from packet 239/240
-    dev.controlWrite(0x40, 0xA0, 0x1C00, 0x0000, "\x12\x01\x00\x02\x00\x00\x00\x40\x28\x53\x10\x20\x00\x00\x01\x02"
-              "\x00\x01\x0A\x06\x00\x02\x00\x00\x00\x40\x01\x00\x09\x02\x19\x00"
-              "\x01\x01\x00\x80\xFA\x09\x04\x00\x00\x01\xFF\x00\x00\x00\x07\x05"
-              "\x82\x02\x00\x02\x00\x00\x09\x02\x19\x00\x01\x01\x00\x80\xFA\x09"
-              "\x04\x00\x00\x01\xFF\x00\x00\x00\x07\x05\x82\x02\x40\x00\x00\x00"
-              "\x04\x03\x09\x04\x14\x03\x46\x00\x61\x00\x69\x00\x72\x00\x63\x00"
-              "\x68\x00\x69\x00\x6C\x00\x64\x00\x0C\x03\x44\x00\x45\x00\x58\x00"
-              "\x49\x00\x53\x00\x00\x00")
-    # Generated from packet 241/242
-    dev.controlWrite(0x40, 0xA0, 0x0043, 0x0000, "\x02\x17\x00")
-    # Generated from packet 243/244
-    dev.controlWrite(0x40, 0xA0, 0x0053, 0x0000, "\x02\x17\x00")
-    # Generated from packet 245/246
-    dev.controlWrite(0x40, 0xA0, 0x1700, 0x0000, "\x02\x22\x1D\x00\x02\x1F\x3A\x00\x02\x22\x4D\x00\x02\x22\x35\x00"
-              "\x02\x20\x80\x00\x02\x1C\xE5\x00\x02\x16\xFF\x00\x02\x22\xF7\x00"
-              "\x02\x22\xF8\x00\x02\x22\xF9\x00\x02\x22\xFA\x00\x02\x22\xFB\x00"
-              "\x02\x22\xFC\x00\x02\x22\xFD\x00\x02\x22\xFE\x00\x02\x22\xFF\x00"
-              "\x02\x23\x00\x00\x02\x22\xF7\x00\x02\x23\x01\x00\x02\x23\x02\x00"
-              "\x02\x23\x03\x00\x02\x23\x04\x00\x02\x23\x05\x00\x02\x23\x06\x00"
-              "\x02\x23\x07\x00\x02\x22\xF7\x00\x02\x22\xF7\x00\x02\x22\xF7\x00"
-              "\x02\x23\x08\x00\x02\x23\x09\x00\x02\x23\x0A\x00\x02\x23\x0B\x00"
-              "\x02\x23\x0C\x00\x02\x23\x0D\x00\x02\x23\x0E\x00\x02\x23\x0F\x00"
-              "\x02\x23\x10\x00\x02\x23\x11\x00\x02\x23\x12\x00\x02\x23\x13\x00"
-              "\x02\x23\x14\x00\x02\x23\x15\x00\x02\x23\x16\x00\x02\x23\x17\x00"
-              "\x02\x23\x18\x00\x02\x23\x19\x00")
-    # Generated from packet 247/248
-    dev.controlWrite(0x40, 0xA0, 0x20E3, 0x0000, "\x90\xE6\x82\xE0\x30\xE0\x04\xE0\x20\xE6\x0B\x90\xE6\x82\xE0\x30"
-              "\xE1\x19\xE0\x30\xE7\x15\x90\xE6\x80\xE0\x44\x01\xF0\x7F\x14\x7E"
-              "\x00\x12\x1F\x83\x90\xE6\x80\xE0\x54\xFE\xF0\x22")
-    # Generated from packet 249/250
-    dev.controlWrite(0x40, 0xA0, 0x16CC, 0x0000, "\x30\x04\x09\x90\xE6\x80\xE0\x44\x0A\xF0\x80\x07\x90\xE6\x80\xE0"
-              "\x44\x08\xF0\x7F\xDC\x7E\x05\x12\x1F\x83\x90\xE6\x5D\x74\xFF\xF0"
-              "\x90\xE6\x5F\xF0\x53\x91\xEF\x90\xE6\x80\xE0\x54\xF7\xF0\x22")
-    # Generated from packet 251/252
-    dev.controlWrite(0x40, 0xA0, 0x213A, 0x0000, "\xA9\x07\xAE\x60\xAF\x61\x8F\x82\x8E\x83\xA3\xE0\x64\x03\x70\x17"
-              "\xAD\x01\x19\xED\x70\x01\x22\x8F\x82\x8E\x83\xE0\x7C\x00\x2F\xFD"
-              "\xEC\x3E\xFE\xAF\x05\x80\xDF\xE4\xFE\xFF\x22")
-    # Generated from packet 253/254
-    dev.controlWrite(0x40, 0xA0, 0x21B5, 0x0000, "\x90\xE6\x82\xE0\x44\xC0\xF0\x90\xE6\x81\xF0\x43\x87\x01\x00\x00"
-              "\x00\x00\x00\x22")
-    # Generated from packet 255/256
-    dev.controlWrite(0x40, 0xA0, 0x1F83, 0x0000, "\x8E\x21\x8F\x22\x90\xE6\x00\xE0\x54\x18\x70\x12\xE5\x22\x24\x01"
-              "\xFF\xE4\x35\x21\xC3\x13\xF5\x21\xEF\x13\xF5\x22\x80\x15\x90\xE6"
-              "\x00\xE0\x54\x18\xFF\xBF\x10\x0B\xE5\x22\x25\xE0\xF5\x22\xE5\x21"
-              "\x33\xF5\x21\xE5\x22\x15\x22\xAE\x21\x70\x02\x15\x21\x4E\x60\x05"
-              "\x12\x21\xC9\x80\xEE\x22")
-    # Generated from packet 257/258
-    dev.controlWrite(0x40, 0xA0, 0x21C9, 0x0000, "\x74\x00\xF5\x86\x90\xFD\xA5\x7C\x05\xA3\xE5\x82\x45\x83\x70\xF9"
-              "\x22")
-    # Generated from packet 259/260
-    dev.controlWrite(0x40, 0xA0, 0x0000, 0x0000, "\x02\x19\xB2")
-    # Generated from packet 261/262
-    dev.controlWrite(0x40, 0xA0, 0x19B2, 0x0000, "\x78\x7F\xE4\xF6\xD8\xFD\x75\x81\x68\x02\x19\xF9")
-    # Generated from packet 263/264
-    dev.controlWrite(0x40, 0xA0, 0x0999, 0x0000, "\xBB\x01\x06\x89\x82\x8A\x83\xE0\x22\x50\x02\xE7\x22\xBB\xFE\x02"
-              "\xE3\x22\x89\x82\x8A\x83\xE4\x93\x22\xBB\x01\x0C\xE5\x82\x29\xF5"
-              "\x82\xE5\x83\x3A\xF5\x83\xE0\x22\x50\x06\xE9\x25\x82\xF8\xE6\x22"
-              "\xBB\xFE\x06\xE9\x25\x82\xF8\xE2\x22\xE5\x82\x29\xF5\x82\xE5\x83"
-              "\x3A\xF5\x83\xE4\x93\x22\xBB\x01\x06\x89\x82\x8A\x83\xF0\x22\x50"
-              "\x02\xF7\x22\xBB\xFE\x01\xF3\x22\xF8\xBB\x01\x0D\xE5\x82\x29\xF5"
-              "\x82\xE5\x83\x3A\xF5\x83\xE8\xF0\x22\x50\x06\xE9\x25\x82\xC8\xF6"
-              "\x22\xBB\xFE\x05\xE9\x25\x82\xC8\xF2\x22\xBB\x01\x0A\x89\x82\x8A"
-              "\x83\xE0\xF5\xF0\xA3\xE0\x22\x50\x06\x87\xF0\x09\xE7\x19\x22\xBB"
-              "\xFE\x07\xE3\xF5\xF0\x09\xE3\x19\x22\x89\x82\x8A\x83\xE4\x93\xF5"
-              "\xF0\x74\x01\x93\x22\xBB\x01\x10\xE5\x82\x29\xF5\x82\xE5\x83\x3A"
-              "\xF5\x83\xE0\xF5\xF0\xA3\xE0\x22\x50\x09\xE9\x25\x82\xF8\x86\xF0"
-              "\x08\xE6\x22\xBB\xFE\x0A\xE9\x25\x82\xF8\xE2\xF5\xF0\x08\xE2\x22"
-              "\xE5\x83\x2A\xF5\x83\xE9\x93\xF5\xF0\xA3\xE9\x93\x22\xBB\x01\x0A"
-              "\x89\x82\x8A\x83\xF0\xE5\xF0\xA3\xF0\x22\x50\x06\xF7\x09\xA7\xF0"
-              "\x19\x22\xBB\xFE\x06\xF3\xE5\xF0\x09\xF3\x19\x22\xE8\x8F\xF0\xA4"
-              "\xCC\x8B\xF0\xA4\x2C\xFC\xE9\x8E\xF0\xA4\x2C\xFC\x8A\xF0\xED\xA4"
-              "\x2C\xFC\xEA\x8E\xF0\xA4\xCD\xA8\xF0\x8B\xF0\xA4\x2D\xCC\x38\x25"
-              "\xF0\xFD\xE9\x8F\xF0\xA4\x2C\xCD\x35\xF0\xFC\xEB\x8E\xF0\xA4\xFE"
-              "\xA9\xF0\xEB\x8F\xF0\xA4\xCF\xC5\xF0\x2E\xCD\x39\xFE\xE4\x3C\xFC"
-              "\xEA\xA4\x2D\xCE\x35\xF0\xFD\xE4\x3C\xFC\x22\x75\xF0\x08\x75\x82"
-              "\x00\xEF\x2F\xFF\xEE\x33\xFE\xCD\x33\xCD\xCC\x33\xCC\xC5\x82\x33"
-              "\xC5\x82\x9B\xED\x9A\xEC\x99\xE5\x82\x98\x40\x0C\xF5\x82\xEE\x9B"
-              "\xFE\xED\x9A\xFD\xEC\x99\xFC\x0F\xD5\xF0\xD6\xE4\xCE\xFB\xE4\xCD"
-              "\xFA\xE4\xCC\xF9\xA8\x82\x22\xB8\x00\xC1\xB9\x00\x59\xBA\x00\x2D"
-              "\xEC\x8B\xF0\x84\xCF\xCE\xCD\xFC\xE5\xF0\xCB\xF9\x78\x18\xEF\x2F"
-              "\xFF\xEE\x33\xFE\xED\x33\xFD\xEC\x33\xFC\xEB\x33\xFB\x10\xD7\x03"
-              "\x99\x40\x04\xEB\x99\xFB\x0F\xD8\xE5\xE4\xF9\xFA\x22\x78\x18\xEF"
-              "\x2F\xFF\xEE\x33\xFE\xED\x33\xFD\xEC\x33\xFC\xC9\x33\xC9\x10\xD7"
-              "\x05\x9B\xE9\x9A\x40\x07\xEC\x9B\xFC\xE9\x9A\xF9\x0F\xD8\xE0\xE4"
-              "\xC9\xFA\xE4\xCC\xFB\x22\x75\xF0\x10\xEF\x2F\xFF\xEE\x33\xFE\xED"
-              "\x33\xFD\xCC\x33\xCC\xC8\x33\xC8\x10\xD7\x07\x9B\xEC\x9A\xE8\x99"
-              "\x40\x0A\xED\x9B\xFD\xEC\x9A\xFC\xE8\x99\xF8\x0F\xD5\xF0\xDA\xE4"
-              "\xCD\xFB\xE4\xCC\xFA\xE4\xC8\xF9\x22\xEB\x9F\xF5\xF0\xEA\x9E\x42"
-              "\xF0\xE9\x9D\x42\xF0\xE8\x9C\x45\xF0\x22\x74\x01\xFF\x33\x95\xE0"
-              "\xFE\xFD\xFC\x08\x08\x08\xE6\xCF\x2F\xF6\x18\xE6\xCE\x3E\xF6\x18"
-              "\xE6\xCD\x3D\xF6\x18\xE6\xCC\x3C\xF6\x22\xD0\x83\xD0\x82\xF8\xE4"
-              "\x93\x70\x12\x74\x01\x93\x70\x0D\xA3\xA3\x93\xF8\x74\x01\x93\xF5"
-              "\x82\x88\x83\xE4\x73\x74\x02\x93\x68\x60\xEF\xA3\xA3\xA3\x80\xDF")
-    # Generated from packet 265/266
-    dev.controlWrite(0x40, 0xA0, 0x19BE, 0x0000, "\x02\x19\x16\xE4\x93\xA3\xF8\xE4\x93\xA3\x40\x03\xF6\x80\x01\xF2"
-              "\x08\xDF\xF4\x80\x29\xE4\x93\xA3\xF8\x54\x07\x24\x0C\xC8\xC3\x33"
-              "\xC4\x54\x0F\x44\x20\xC8\x83\x40\x04\xF4\x56\x80\x01\x46\xF6\xDF"
-              "\xE4\x80\x0B\x01\x02\x04\x08\x10\x20\x40\x80\x90\x1D\x4B\xE4\x7E"
-              "\x01\x93\x60\xBC\xA3\xFF\x54\x3F\x30\xE5\x09\x54\x1F\xFE\xE4\x93"
-              "\xA3\x60\x01\x0E\xCF\x54\xC0\x25\xE0\x60\xA8\x40\xB8\xE4\x93\xA3"
-              "\xFA\xE4\x93\xA3\xF8\xE4\x93\xA3\xC8\xC5\x82\xC8\xCA\xC5\x83\xCA"
-              "\xF0\xA3\xC8\xC5\x82\xC8\xCA\xC5\x83\xCA\xDF\xE9\xDE\xE7\x80\xBE")
-    # Generated from packet 267/268
-    dev.controlWrite(0x40, 0xA0, 0x1DA1, 0x0000, "\x00")
-    # Generated from packet 269/270
-    dev.controlWrite(0x40, 0xA0, 0xE600, 0x0000, "\x00")
-
-
-pidvid2name = {
-        (0x5328, 0x2009): 'Dexis Platinum (pre-enumeration)',
-        #(0x5328, 0x2010): '??? auto enum',
-        #(0x5328, 0x2010): 'Dexis Platinum (pre-enumeration something)',
-        (0x5328, 0x202F): 'Gendex GXS700 (pre-enumeration)',
-        # ooops
-        # Bus 002 Device 043: ID 04b4:8613 Cypress Semiconductor Corp. CY7C68013 EZ-USB FX2 USB 2.0 Development Kit
-        (0x04b4, 0x8613): 'CY7C68013 EZ-USB FX2 USB 2.0 Development Kit',
-        }
+FW = '2010'
 
 def load_all(wait=False):
-    ret = False
-    usbcontext = usb1.USBContext()
-    print 'Scanning for devices...'
-    for udev in usbcontext.getDeviceList(skip_on_error=True):
-        vid = udev.getVendorID()
-        pid = udev.getProductID()
-        if (vid, pid) in pidvid2name.keys():
-            print
-            print
-            print 'Found device'
-            print 'Bus %03i Device %03i: ID %04x:%04x' % (
-                udev.getBusNumber(),
-                udev.getDeviceAddress(),
-                vid,
-                pid)
-            print 'Loading firmware'
-            load(udev.open())
-            print 'Firmware load OK'
-            ret = True
+    '''Load firmware onto all devices that need it, True if any were loaded'''
+    return firmware.load_all(wait=wait, bundle=FW) > 0
 
-    if ret and wait:
-        print 'Waiting for device to come up'
-        tstart = time.time()
-        while time.time() - tstart < 3.0:
-            udev = util.check_device()
-            if udev:
-                break
-        else:
-            raise Exception("Renumeration timed out")
-        print 'Up after %0.1f sec' % (time.time() - tstart,)
-
-    return ret
+def load(dev):
+    firmware.BUNDLES[FW].load(dev)
 
 if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description='Replay captured USB packets')
+    parser = argparse.ArgumentParser(description='Load Dexis 2010 firmware')
     parser.add_argument('--verbose', '-v', action='store_true', help='verbose')
+    parser.add_argument('--wait', '-w', action='store_true', help='wait for devices to renumerate')
     args = parser.parse_args()
 
-    load_all()
-
+    load_all(wait=args.wait)
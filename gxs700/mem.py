@@ -0,0 +1,157 @@
+'''
+Memory region reads
+
+EEPROM, flash and FX2 RAM were read in fixed small chunks (0x80, 0x100, 16 bytes)
+with the result built up by string concatenation
+The firmware handles larger reads for some of them but not all
+(ex: flash reads over 0x200 come back as zeros, see dump_eeprom.py)
+so find the largest chunk that reads back the same as the known good size,
+remember it, and read into one preallocated buffer with several reads in flight
+
+I2C isn't here: wIndex is the bus address, not an offset, so there is nothing to chunk
+'''
+
+# https://github.com/vpelletier/python-libusb1
+# Python-ish (classes, exceptions, ...) wrapper around libusb1.py . See docstrings (pydoc recommended) for usage.
+import usb1
+# Bare ctype wrapper, inspired from library C header file.
+import libusb1
+import usb_batch
+
+class Region:
+    def __init__(self, name, request, value, size, chunk, addr_in_value=False):
+        self.name = name
+        # bRequest, and wValue if addressed by wIndex
+        self.request = request
+        self.value = value
+        self.size = size
+        # Known good read size
+        self.chunk = chunk
+        # FX2 style (0xA0): address in wValue, wIndex 0
+        self.addr_in_value = addr_in_value
+
+    def setup(self, addr):
+        '''(request, value, index) to read at addr'''
+        if self.addr_in_value:
+            return (self.request, addr, 0)
+        return (self.request, self.value, addr)
+
+REGIONS = {
+        # Wraps around at 0x2000
+        'eeprom':   Region('eeprom', 0xB0, 0x0B, 0x2000, 0x80),
+        'flash':    Region('flash', 0xB0, 0x10, 0x800, 0x100),
+        # 8k code/data.  Scratch pad is at 0xE000-0xE1FF
+        'ram':      Region('ram', 0xA0, None, 0x10000, 0x10, addr_in_value=True),
+        }
+
+# Chunk sizes to try, largest first
+# libusb / usbfs don't do control transfers past 4k
+PROBE_CHUNKS = (0x1000, 0x800, 0x400, 0x200, 0x100, 0x80, 0x40)
+
+class MemReader:
+    def __init__(self, dev, usbcontext=None, timeout=1000, depth=4, probe=True):
+        self.dev = dev
+        # Needed for async reads, None to read synchronously
+        self.usbcontext = usbcontext
+        # Default per transfer timeout in ms, read() can override it
+        self.timeout = timeout
+        # Reads in flight
+        self.depth = depth
+        # Probe for a larger chunk size or just use the known good one
+        self.probe_enable = probe
+        # region name => chunk size
+        self.chunks = {}
+
+    def _read1(self, dev, region, addr, n, timeout=None):
+        request, value, index = region.setup(addr)
+        return dev.controlRead(0xC0, request, value, index, n, timeout=timeout or self.timeout)
+
+    def probe(self, region, dev=None, timeout=None):
+        '''
+        Find the largest chunk size that reads back the same as region.chunk
+        Oversize reads can come back as zeros so a candidate is only trusted
+        if the span it covers isn't all one value (ex: blank or zeroed flash)
+        '''
+        dev = dev or self.dev
+        n = min(PROBE_CHUNKS[0], region.size)
+        ref = bytearray(n)
+        for off in xrange(0, n, region.chunk):
+            ref[off:off + region.chunk] = self._read1(dev, region, off, region.chunk, timeout)
+        ref = str(ref)
+        for chunk in PROBE_CHUNKS:
+            if chunk <= region.chunk:
+                break
+            if chunk > n:
+                continue
+            if len(set(ref[:chunk])) < 2:
+                # Can't tell a good read from a bad one
+                continue
+            try:
+                res = self._read1(dev, region, 0, chunk, timeout)
+            except usb1.USBError:
+                # Probably stalled
+                continue
+            if res == ref[:chunk]:
+                return chunk
+        return region.chunk
+
+    def chunk(self, region, dev=None, timeout=None):
+        if isinstance(region, str):
+            region = REGIONS[region]
+        ret = self.chunks.get(region.name)
+        if ret is None:
+            if self.probe_enable:
+                ret = self.probe(region, dev, timeout)
+            else:
+                ret = region.chunk
+            self.chunks[region.name] = ret
+        return ret
+
+    def read(self, region, addr, n, dev=None, timeout=None):
+        '''
+        Read n bytes at addr
+        dev: use this instead of self.dev, if its a ControlBatch reads are queued on it
+        timeout: per transfer timeout in ms, default self.timeout
+        '''
+        if isinstance(region, str):
+            region = REGIONS[region]
+        dev = dev or self.dev
+        timeout = timeout or self.timeout
+        if n <= region.chunk:
+            # Not worth probing for
+            chunk = region.chunk
+        else:
+            chunk = self.chunk(region, dev, timeout)
+        ret = bytearray(n)
+
+        def store(off):
+            def cb(data):
+                ret[off:off + len(data)] = data
+            return cb
+
+        if isinstance(dev, usb_batch.ControlBatch):
+            batch = dev
+        elif self.usbcontext is not None and self.depth > 1 and n > chunk:
+            batch = usb_batch.ControlBatch(self.usbcontext, dev, depth=self.depth, timeout=timeout)
+        else:
+            batch = None
+
+        if batch is None:
+            for off in xrange(0, n, chunk):
+                l = min(chunk, n - off)
+                res = self._read1(dev, region, addr + off, l, timeout)
+                if len(res) != l:
+                    raise Exception("wanted 0x%04X bytes but got 0x%04X" % (l, len(res),))
+                ret[off:off + l] = res
+            return str(ret)
+
+        try:
+            for off in xrange(0, n, chunk):
+                l = min(chunk, n - off)
+                request, value, index = region.setup(addr + off)
+                batch.controlReadAsync(0xC0, request, value, index, l, store(off), timeout=timeout)
+            batch.flush()
+        finally:
+            if batch is not dev:
+                batch.close()
+        return str(ret)
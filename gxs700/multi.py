@@ -0,0 +1,227 @@
+'''
+Capture from several sensors on one host
+
+Each sensor gets its own GXS700 and capture thread
+Async transfers for all of them (bulk frame reads, batched writes) are serviced
+by one shared USB event thread instead of every capture loop calling handleEventsTimeout()
+    ctx, heads = multi.open_heads(serials=['2103231663', '2103231664'])
+    mc = multi.MultiCapture(heads)
+    for meta, imgb in mc.capture(1):
+        ...
+'''
+
+# https://github.com/vpelletier/python-libusb1
+# Python-ish (classes, exceptions, ...) wrapper around libusb1.py . See docstrings (pydoc recommended) for usage.
+import usb1
+# Bare ctype wrapper, inspired from library C header file.
+import libusb1
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+
+import gxs700
+import util
+from deadline import CancelToken
+
+class EventThread(threading.Thread):
+    '''Handles libusb events for a context until stopped'''
+    def __init__(self, usbcontext, tv=0.05):
+        threading.Thread.__init__(self, name='gxs700 usb events')
+        self.daemon = True
+        self.usbcontext = usbcontext
+        self.tv = tv
+        self.cond = threading.Condition()
+        # handleEventsTimeout() calls completed
+        self.passes = 0
+        self.running = True
+        # Exceptions raised by transfer callbacks, oldest first
+        self.errors = []
+
+    def run(self):
+        while self.running:
+            try:
+                self.usbcontext.handleEventsTimeout(tv=self.tv)
+            except Exception as e:
+                # A bad callback shouldn't stop events for every other head
+                print 'WARNING: USB event callback failed'
+                traceback.print_exc()
+                with self.cond:
+                    self.errors.append(e)
+            with self.cond:
+                self.passes += 1
+                self.cond.notify_all()
+
+    def stop(self):
+        self.running = False
+        self.join()
+
+class SharedContext:
+    '''
+    USBContext stand in for GXS700 when an EventThread is handling events
+    handleEventsTimeout() waits for the event thread to do a pass instead of handling them itself
+    '''
+    def __init__(self, usbcontext=None):
+        if usbcontext is None:
+            usbcontext = usb1.USBContext()
+        self.usbcontext = usbcontext
+        self.events = EventThread(usbcontext)
+        self.events.start()
+
+    def __getattr__(self, name):
+        return getattr(self.usbcontext, name)
+
+    def handleEventsTimeout(self, tv=0):
+        events = self.events
+        with events.cond:
+            passes = events.passes
+            tend = time.time() + tv
+            while events.passes == passes:
+                remain = tend - time.time()
+                if remain <= 0:
+                    break
+                events.cond.wait(remain)
+
+    def close(self):
+        self.events.stop()
+
+class Head:
+    '''One sensor: where it is on the bus plus its GXS700'''
+    def __init__(self, udev, gxs):
+        self.bus = udev.getBusNumber()
+        self.addr = udev.getDeviceAddress()
+        self.gxs = gxs
+        self.sn = gxs.get_info().sn
+
+    def __str__(self):
+        return 'bus %03i device %03i SN %s' % (self.bus, self.addr, self.sn)
+
+def open_heads(usbcontext=None, busaddrs=None, serials=None, verbose=False):
+    '''
+    Open and set up sensors, all of them by default
+    busaddrs: only sensors at these (bus, address)
+    serials: only sensors with these serial numbers
+    Returns (SharedContext, [Head])
+    '''
+    if usbcontext is None:
+        usbcontext = usb1.USBContext()
+    ctx = SharedContext(usbcontext)
+    heads = []
+    for udev, dev in util.open_devs(usbcontext, busaddrs):
+        # Serial number is in flash, need to talk to it before we know if we want it
+        gxs = gxs700.GXS700(ctx, dev, verbose=verbose, init=False)
+        head = Head(udev, gxs)
+        if serials is not None and head.sn not in serials:
+            print 'Skipping %s' % head
+            dev.close()
+            continue
+        gxs._init()
+        heads.append(head)
+    if serials is not None:
+        missing = set(serials) - set(head.sn for head in heads)
+        if missing:
+            raise Exception('Sensor(s) not found: %s' % ', '.join(sorted(missing)))
+    return ctx, heads
+
+class MultiCapture:
+    def __init__(self, heads):
+        self.heads = heads
+
+    def cap_binv(self, n, cap_cb, timeout=None, cancel=None):
+        '''
+        Capture n frames from every head concurrently
+        cap_cb(head, frame, meta) is called from that head's capture thread
+        meta: sn, bus, addr, index (per head frame number), t_exp (trigger time), t_rx (readout done),
+            status (FrameStatus.to_dict())
+        If any head fails the others are cancelled (through cancel if given) and the first error is raised
+        '''
+        if cancel is None:
+            cancel = CancelToken()
+        # First failure as (head, sys.exc_info())
+        failed = []
+        lock = threading.Lock()
+
+        def run(head):
+            taken = [0]
+            def cb(imgb, frame_meta):
+                meta = {
+                    'sn': head.sn,
+                    'bus': head.bus,
+                    'addr': head.addr,
+                    'index': taken[0],
+                    't_exp': head.gxs.exp_last,
+                    't_rx': time.time(),
+                    'status': frame_meta.to_dict(),
+                    }
+                taken[0] += 1
+                return cap_cb(head, imgb, meta)
+            try:
+                head.gxs.cap_binv(n, cb, timeout=timeout, cancel=cancel, meta=True)
+            except:
+                with lock:
+                    if not failed:
+                        failed.append((head, sys.exc_info()))
+                cancel.cancel()
+
+        threads = []
+        for head in self.heads:
+            t = threading.Thread(target=run, args=(head,), name='gxs700 capture %s' % head.sn)
+            t.daemon = True
+            t.start()
+            threads.append(t)
+        for t in threads:
+            t.join()
+
+        if failed:
+            head, exc = failed[0]
+            print 'Capture failed on %s' % head
+            raise exc[0], exc[1], exc[2]
+
+    def capture(self, n, timeout=None, cancel=None):
+        '''Capture n frames from every head, return [(meta, frame)] in readout order'''
+        ret = []
+        lock = threading.Lock()
+        def cb(head, imgb, meta):
+            with lock:
+                ret.append((meta, imgb))
+        self.cap_binv(n, cb, timeout=timeout, cancel=cancel)
+        return sorted(ret, key=lambda mi: mi[0]['t_rx'])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Capture from several sensors at once')
+    parser.add_argument('--verbose', '-v', action='store_true', help='verbose')
+    parser.add_argument('--number', '-n', type=int, default=1, help='number to take per sensor')
+    parser.add_argument('--dev', action='append', help='bus:address to use (lsusb numbering), can be repeated')
+    parser.add_argument('--sn', action='append', help='serial number to use, can be repeated')
+    parser.add_argument('--timeout', type=float, default=None, help='seconds allowed per frame')
+    args = parser.parse_args()
+
+    busaddrs = None
+    if args.dev:
+        busaddrs = [util.parse_busaddr(s) for s in args.dev]
+    ctx, heads = open_heads(busaddrs=busaddrs, serials=args.sn, verbose=args.verbose)
+    print 'Capturing from %d sensor(s)' % len(heads)
+    for head in heads:
+        print '  %s' % head
+
+    lock = threading.Lock()
+    def cb(head, imgb, meta):
+        with lock:
+            imagen = 0
+            while os.path.exists('capture_%s_%03d.bin' % (head.sn, imagen)):
+                imagen += 1
+            fn = 'capture_%s_%03d.bin' % (head.sn, imagen)
+            # Reserve the name, write outside the lock
+            open(fn, 'w').close()
+        print 'Writing %s' % fn
+        open(fn, 'w').write(imgb)
+        json.dump(meta, open(fn.replace('.bin', '.json'), 'w'), indent=4, sort_keys=True)
+
+    try:
+        MultiCapture(heads).cap_binv(args.number, cb, timeout=args.timeout)
+    finally:
+        ctx.close()
+    print 'Done'
@@ -14,22 +14,17 @@ import sys
 import argparse
 from util import hexdump
 from util import open_dev
+import fx2
 
 verbose = False
 
 
 def ram_w(dev, addr, data):
-    bs = 16
-    offset = 0
-    while offset < len(data):
-        l = min(bs, len(data) - offset)
-        payload = data[offset:offset + l]
-        print 'Write 0x%04X: %s' % (addr + offset, binascii.hexlify(payload))
-        dev.controlWrite(0x40, 0xA0, addr + offset, 0x0000, payload, timeout=1000)
-        offset += bs
+    print 'Write 0x%04X: %s' % (addr, binascii.hexlify(data))
+    fx2.ram_w(dev, addr, data)
 
 def rst(dev, running):
-    ram_w(dev, 0xe600, chr(int(bool(running))))
+    ram_w(dev, fx2.CPUCS, chr(int(bool(running))))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Replay captured USB packets')
@@ -11,6 +11,8 @@ import time
 
 '''
 I seem to have somehow cleared the eeprom or something of that sort...
+
+To sweep all of a request's wValue / wIndex use scanner.py instead of the loops below
 '''
 
 verbose = False
@@ -0,0 +1,313 @@
+'''
+Address space scanner
+
+Sweeps wValue or wIndex of a vendor read with a bounded number of async control reads in flight
+instead of one synchronous read (and print) at a time like scan_regs.py / mu800 reg_test.py
+
+Results are columns in a numpy .npz, one row per address:
+    addr    u32 wValue / wIndex read
+    status  u8  libusb transfer status (0 completed, 2 timed out, 4 stall...)
+    n       u16 bytes returned
+    data    u8  [rows, length], zero padded
+    done    u8  1 if the device answered (data, stall...), timeouts and errors are retried
+plus a JSON header with the sweep parameters
+Saved every few seconds (write then rename) and on exit so an interrupted scan picks up where it left off
+
+Aliasing: rows are hashed in blocks, blocks that match earlier ones are reported as mirrors of them
+'''
+
+# https://github.com/vpelletier/python-libusb1
+# Python-ish (classes, exceptions, ...) wrapper around libusb1.py . See docstrings (pydoc recommended) for usage.
+import usb1
+# Bare ctype wrapper, inspired from library C header file.
+import libusb1
+import argparse
+import binascii
+import hashlib
+import json
+import os
+import time
+import numpy as np
+
+from util import open_dev
+
+STATUS_NAMES = {
+        libusb1.LIBUSB_TRANSFER_COMPLETED: 'ok',
+        libusb1.LIBUSB_TRANSFER_ERROR: 'error',
+        libusb1.LIBUSB_TRANSFER_TIMED_OUT: 'timeout',
+        libusb1.LIBUSB_TRANSFER_CANCELLED: 'cancelled',
+        libusb1.LIBUSB_TRANSFER_STALL: 'stall',
+        libusb1.LIBUSB_TRANSFER_NO_DEVICE: 'no device',
+        libusb1.LIBUSB_TRANSFER_OVERFLOW: 'overflow',
+        }
+
+# The device answered, anything else (timeout, cancelled, error) says nothing about the address
+ANSWERED = (
+        libusb1.LIBUSB_TRANSFER_COMPLETED,
+        libusb1.LIBUSB_TRANSFER_STALL,
+        libusb1.LIBUSB_TRANSFER_OVERFLOW,
+        )
+
+class Sweep:
+    def __init__(self, request, vary='index', fixed=0, start=0, end=0x10000, step=1, length=4,
+            request_type=0xC0):
+        self.request_type = request_type
+        self.request = request
+        # 'value' or 'index'
+        if vary not in ('value', 'index'):
+            raise Exception('Bad field %s' % vary)
+        self.vary = vary
+        # The other one
+        self.fixed = fixed
+        self.start = start
+        self.end = end
+        self.step = step
+        self.length = length
+
+    def addrs(self):
+        return np.arange(self.start, self.end, self.step, dtype=np.uint32)
+
+    def setup(self, addr):
+        '''(request_type, request, value, index, length) to read addr'''
+        if self.vary == 'value':
+            return (self.request_type, self.request, addr, self.fixed, self.length)
+        return (self.request_type, self.request, self.fixed, addr, self.length)
+
+    def to_dict(self):
+        return dict(self.__dict__)
+
+    @staticmethod
+    def from_dict(j):
+        return Sweep(**j)
+
+class Results:
+    '''Columns for every address of a sweep'''
+    def __init__(self, sweep):
+        self.sweep = sweep
+        self.addr = sweep.addrs()
+        rows = len(self.addr)
+        self.status = np.zeros(rows, dtype=np.uint8)
+        self.n = np.zeros(rows, dtype=np.uint16)
+        self.data = np.zeros((rows, sweep.length), dtype=np.uint8)
+        self.done = np.zeros(rows, dtype=np.uint8)
+
+    def save(self, fn):
+        # np.savez adds .npz if its not there
+        tmp = fn + '.tmp.npz'
+        np.savez(tmp, header=np.array(json.dumps(self.sweep.to_dict())),
+                addr=self.addr, status=self.status, n=self.n, data=self.data, done=self.done)
+        os.rename(tmp, fn)
+
+    @staticmethod
+    def load(fn):
+        f = np.load(fn)
+        ret = Results(Sweep.from_dict(json.loads(str(f['header']))))
+        for k in ('addr', 'status', 'n', 'data', 'done'):
+            setattr(ret, k, f[k].copy())
+        return ret
+
+    def reply(self, i):
+        '''Row i as a string, or None if the read failed'''
+        if self.status[i] != libusb1.LIBUSB_TRANSFER_COMPLETED:
+            return None
+        return self.data[i, :self.n[i]].tostring()
+
+class Scanner:
+    def __init__(self, usbcontext, dev, results, depth=16, timeout=100, checkpoint=None, checkpoint_t=5.0,
+            retries=2, verbose=False):
+        self.usbcontext = usbcontext
+        self.dev = dev
+        self.res = results
+        # Reads in flight
+        self.depth = depth
+        # Per read, ms
+        self.timeout = timeout
+        # File name to save progress to
+        self.checkpoint = checkpoint
+        self.checkpoint_t = checkpoint_t
+        # Extra passes over reads that didn't get an answer
+        self.retries = retries
+        self.verbose = verbose
+        self.inflight = 0
+        self.free = []
+        self.trans_l = []
+        self.todo = []
+        self.no_dev = False
+
+    def _cb(self, trans):
+        self.inflight -= 1
+        i = trans.getUserData()
+        status = trans.getStatus()
+        res = self.res
+        res.status[i] = status
+        if status == libusb1.LIBUSB_TRANSFER_COMPLETED:
+            n = trans.getActualLength()
+            res.n[i] = n
+            res.data[i, :n] = np.frombuffer(str(trans.getBuffer()[:n]), dtype=np.uint8)
+        elif status == libusb1.LIBUSB_TRANSFER_NO_DEVICE:
+            self.no_dev = True
+        if status in ANSWERED:
+            res.done[i] = 1
+        if self.verbose:
+            print '0x%04X: %s' % (res.addr[i], binascii.hexlify(res.reply(i) or '') or STATUS_NAMES.get(status, status))
+        self.free.append(trans)
+        self._pump()
+
+    def _pump(self):
+        while self.todo and self.inflight < self.depth and not self.no_dev:
+            i = self.todo.pop()
+            if self.free:
+                trans = self.free.pop()
+            else:
+                trans = self.dev.getTransfer()
+                self.trans_l.append(trans)
+            request_type, request, value, index, length = self.res.sweep.setup(int(self.res.addr[i]))
+            trans.setControl(request_type, request, value, index, length,
+                    callback=self._cb, user_data=i, timeout=self.timeout)
+            trans.submit()
+            self.inflight += 1
+
+    def run(self):
+        '''Read everything not already done, return the number of reads'''
+        n = int((self.res.done == 0).sum())
+        print 'Scanning %d / %d addresses' % (n, len(self.res.addr))
+        tstart = time.time()
+        tsave = tstart
+        try:
+            for attempt in xrange(1 + self.retries):
+                # Popped from the end, keep address order
+                self.todo = list(np.nonzero(self.res.done == 0)[0][::-1])
+                if not self.todo or self.no_dev:
+                    break
+                if attempt:
+                    print 'Retrying %d unanswered' % len(self.todo)
+                self._pump()
+                while self.inflight:
+                    self.usbcontext.handleEventsTimeout(tv=0.1)
+                    if self.checkpoint and time.time() - tsave > self.checkpoint_t:
+                        self.res.save(self.checkpoint)
+                        tsave = time.time()
+        finally:
+            del self.todo[:]
+            # Let whatever is in flight finish so its result isn't lost
+            while self.inflight:
+                self.usbcontext.handleEventsTimeout(tv=0.1)
+            for trans in self.trans_l:
+                trans.close()
+            self.trans_l = []
+            self.free = []
+            if self.checkpoint:
+                self.res.save(self.checkpoint)
+        if self.no_dev:
+            raise Exception('Device went away')
+        dt = time.time() - tstart
+        print 'Scanned %d in %0.1f sec (%0.0f / sec)' % (n, dt, n / dt if dt else 0)
+        left = int((self.res.done == 0).sum())
+        if left:
+            print '%d addresses unanswered, run again to retry them' % left
+        return n
+
+def aliases(res, block=0x100):
+    '''
+    [(first address, end address, earlier address)] for runs of blocks of rows identical to earlier blocks
+    Blocks where every row is the same (ex: all stall, all FF) aren't interesting and are skipped
+    '''
+    ret = []
+    seen = {}
+    for i in xrange(0, len(res.addr) - block + 1, block):
+        if not res.done[i:i + block].all():
+            continue
+        status = res.status[i:i + block]
+        data = res.data[i:i + block]
+        if (status == status[0]).all() and (data == data[0]).all():
+            continue
+        h = hashlib.sha1(status.tostring() + res.n[i:i + block].tostring() + data.tostring()).digest()
+        if h not in seen:
+            seen[h] = i
+            continue
+        addr = int(res.addr[i])
+        end = int(res.addr[i + block - 1]) + 1
+        orig = int(res.addr[seen[h]])
+        # Extend the previous run if this continues it at the same offset
+        # or repeats the same block (mirrored every block)
+        if ret and ret[-1][1] == addr and (ret[-1][0] - ret[-1][2] == addr - orig or ret[-1][2] == orig):
+            ret[-1] = (ret[-1][0], end, ret[-1][2])
+        else:
+            ret.append((addr, end, orig))
+    return ret
+
+def runs(res):
+    '''Collapse consecutive identical replies: [(first address, last address, reply or None, status)]'''
+    ret = []
+    for i in np.nonzero(res.done)[0]:
+        k = (res.reply(i), int(res.status[i]))
+        if ret and ret[-1][2:] == k and ret[-1][1] == int(res.addr[i]) - res.sweep.step:
+            ret[-1] = (ret[-1][0], int(res.addr[i])) + k
+        else:
+            ret.append((int(res.addr[i]), int(res.addr[i])) + k)
+    return ret
+
+def report(res, block=0x100):
+    for first, last, reply, status in runs(res):
+        if reply is None:
+            s = STATUS_NAMES.get(status, status)
+        else:
+            s = binascii.hexlify(reply)
+        if first == last:
+            print '0x%04X: %s' % (first, s)
+        else:
+            print '0x%04X-0x%04X: %s' % (first, last, s)
+    al = aliases(res, block)
+    if al:
+        print
+        print 'Aliased blocks (0x%X rows)' % block
+        for addr, end, orig in al:
+            print '  0x%04X-0x%04X mirrors 0x%04X (offset 0x%04X)' % (addr, end - 1, orig, addr - orig)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Scan a vendor request address space, resumable')
+    parser.add_argument('--verbose', '-v', action='store_true', help='print every reply as it comes in')
+    parser.add_argument('--request', '-r', help='bRequest, default 0xB0')
+    parser.add_argument('--value', action='store_true', help='sweep wValue instead of wIndex')
+    parser.add_argument('--fixed', help='wValue (or wIndex with --value) held constant, default 0')
+    parser.add_argument('--start', help='default 0')
+    parser.add_argument('--end', help='default 0x10000')
+    parser.add_argument('--step', help='default 1')
+    parser.add_argument('--length', '-l', help='bytes per read, default 4')
+    parser.add_argument('--retries', type=int, default=2, help='extra passes over reads that timed out / failed')
+    parser.add_argument('--depth', type=int, default=16, help='reads in flight')
+    parser.add_argument('--timeout', type=int, default=100, help='per read timeout in ms')
+    parser.add_argument('--block', default='0x100', help='rows per block for alias detection')
+    parser.add_argument('--report', action='store_true', help="only report on an existing results file, don't scan")
+    parser.add_argument('fn', help='results file (.npz), resumed if it exists')
+    args = parser.parse_args()
+
+    # Only what was given on the command line so a resume can tell if it disagrees with the file
+    given = {}
+    for k in ('request', 'fixed', 'start', 'end', 'step', 'length'):
+        if getattr(args, k) is not None:
+            given[k] = int(getattr(args, k), 0)
+    if args.value:
+        given['vary'] = 'value'
+
+    if os.path.exists(args.fn):
+        print 'Resuming %s' % args.fn
+        res = Results.load(args.fn)
+        j = res.sweep.to_dict()
+        for k, v in sorted(given.items()):
+            if j[k] != v:
+                fmt = lambda x: '0x%X' % x if isinstance(x, (int, long)) else x
+                print 'WARNING: %s is %s in %s, ignoring %s' % (k, fmt(j[k]), args.fn, fmt(v))
+    else:
+        if not args.fn.endswith('.npz'):
+            raise Exception('Results file must be .npz')
+        sweep = dict(request=0xB0, vary='index', fixed=0, start=0, end=0x10000, step=1, length=4)
+        sweep.update(given)
+        res = Results(Sweep(**sweep))
+
+    if not args.report:
+        usbcontext = usb1.USBContext()
+        dev = open_dev(usbcontext)
+        Scanner(usbcontext, dev, res, depth=args.depth, timeout=args.timeout,
+                checkpoint=args.fn, retries=args.retries, verbose=args.verbose).run()
+    report(res, int(args.block, 0))
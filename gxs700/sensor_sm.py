@@ -0,0 +1,132 @@
+'''
+Sensor state machine model
+
+State (request 0x20) is one hot
+Observed cycle per exposure, timings from capture_lib.py:
+    0x01 idle => 0x02 (~0.3 sec) => 0x04 (~2.0 sec) => 0x08 frame ready => 0x01 after readout
+States get skipped when polled slower than they last
+
+SensorSM validates transitions and keeps rolling dwell time stats per state
+so callers can predict when a frame will be ready and firmware slowdowns show up in the numbers
+'''
+
+import threading
+import time
+from collections import deque
+
+STATE_IDLE = 0x01
+# Short lived, exposure detected?
+STATE_TRIG = 0x02
+# Integrating
+STATE_INTEG = 0x04
+# Frame ready to be bulk read
+STATE_READY = 0x08
+
+STATE_NAMES = {
+        STATE_IDLE: 'idle',
+        STATE_TRIG: 'trig',
+        STATE_INTEG: 'integ',
+        STATE_READY: 'ready',
+        }
+
+CYCLE = (STATE_IDLE, STATE_TRIG, STATE_INTEG, STATE_READY)
+
+# Dwell time to assume until we've seen some
+DWELL_DEFAULT = {
+        STATE_TRIG: 0.3,
+        STATE_INTEG: 2.0,
+        }
+
+def state_str(state):
+    if state is None:
+        return 'None'
+    return '0x%02X (%s)' % (state, STATE_NAMES.get(state, 'unknown'))
+
+class SensorSM:
+    def __init__(self, history=32, strict=False, dwell_default=DWELL_DEFAULT):
+        # Raise on an invalid transition instead of counting it
+        self.strict = strict
+        self.dwell_default = dwell_default
+        self.lock = threading.Lock()
+        self.state = None
+        # time.time() state was first seen
+        self.tstate = None
+        # state => time.time() it was last entered
+        self.entered = {}
+        # state => recent dwell times in seconds
+        self.dwell = dict((s, deque(maxlen=history)) for s in CYCLE)
+        # (old, new) => count
+        self.invalid = {}
+
+    @staticmethod
+    def allowed(old, new):
+        '''Forward around the cycle (possibly skipping states) or back to idle'''
+        if old is None or new == old or new == STATE_IDLE:
+            return True
+        if old not in CYCLE or new not in CYCLE:
+            return False
+        return CYCLE.index(new) > CYCLE.index(old)
+
+    def update(self, state, t=None):
+        '''Feed a state sample.  Returns True if it was a transition'''
+        if t is None:
+            t = time.time()
+        with self.lock:
+            old = self.state
+            if state == old:
+                return False
+            if not self.allowed(old, state):
+                k = (old, state)
+                self.invalid[k] = self.invalid.get(k, 0) + 1
+                if self.strict:
+                    raise Exception('Invalid state transition %s => %s' % (state_str(old), state_str(state)))
+                print 'WARNING: unexpected state transition %s => %s' % (state_str(old), state_str(state))
+            # Idle time is just waiting on the user, still useful as a sanity check
+            if old in self.dwell:
+                self.dwell[old].append(t - self.tstate)
+            self.state = state
+            self.tstate = t
+            self.entered[state] = t
+            return True
+
+    def expected(self, state):
+        '''Expected seconds spent in state (rolling mean), None if unknown'''
+        d = self.dwell.get(state)
+        if d:
+            return sum(d) / len(d)
+        return self.dwell_default.get(state)
+
+    def predict_ready(self, state=None, tstate=None):
+        '''Predicted time.time() of STATE_READY, None if not exposing'''
+        if state is None:
+            state, tstate = self.state, self.tstate
+        if state == STATE_READY:
+            return tstate
+        if state == STATE_TRIG:
+            return tstate + self.expected(STATE_TRIG) + self.expected(STATE_INTEG)
+        if state == STATE_INTEG:
+            return tstate + self.expected(STATE_INTEG)
+        return None
+
+    def cycle_times(self):
+        '''state => time.time() entered, for states seen since last leaving idle'''
+        with self.lock:
+            tidle = self.entered.get(STATE_IDLE, 0)
+            return dict((s, t) for s, t in self.entered.items() if s != STATE_IDLE and t >= tidle)
+
+    def stats(self, state):
+        '''(samples, mean, min, max) of recent dwell times'''
+        d = list(self.dwell[state])
+        if not d:
+            return (0, None, None, None)
+        return (len(d), sum(d) / len(d), min(d), max(d))
+
+    def report(self):
+        for state in CYCLE:
+            n, mean, dmin, dmax = self.stats(state)
+            if n:
+                print '%-14s n %3d, mean %0.3f, min %0.3f, max %0.3f sec' % (state_str(state), n, mean, dmin, dmax)
+            else:
+                print '%-14s no samples' % (state_str(state),)
+        for (old, new), n in sorted(self.invalid.items()):
+            print 'Invalid %s => %s: %d' % (state_str(old), state_str(new), n)
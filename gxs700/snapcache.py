@@ -0,0 +1,123 @@
+'''
+On disk flash / EEPROM snapshot cache
+
+Identity and calibration data (serial, "Fairchild Imaging", "SL2080302-G2", pixel pitch...)
+doesn't change between runs but was re-read over control transfers every time
+Keep a copy per sensor serial number + firmware versions:
+    ~/.gxs700/snap/<serial>_<mcu>_<fpga>_<fpga_wg>.json
+and check it against a header read (versions, flash identity + calibration record, start of EEPROM) on attach
+Host writes through GXS700.eeprom_w() / flash_w() update the copy in memory,
+saved by flush() at the end of GXS700.batched() and at exit
+'''
+
+import atexit
+import binascii
+import json
+import os
+
+import calrec
+from util import nulls
+
+SNAP_DIR = os.path.join(os.path.expanduser('~'), '.gxs700', 'snap')
+
+# region => size
+REGIONS = {
+        'flash':    0x800,
+        'eeprom':   0x2000,
+        }
+
+# region => bytes at start of region that must match.  One control read each
+# Flash one covers the calibration record so recalibration is noticed
+# EEPROM one covers the exposure timestamp so vendor software writes are noticed
+HEADER = {
+        'flash':    calrec.SIZE,
+        'eeprom':   0x80,
+        }
+
+def ver_str(v):
+    return '%d.%d.%d' % v
+
+class SnapCache:
+    def __init__(self, gxs, d=None):
+        self.gxs = gxs
+        self.dir = d or os.getenv('GXS700_SNAP', SNAP_DIR)
+        self.fn = None
+        # region => bytearray
+        self.data = {}
+        # Written to since the last save()
+        self.dirty = False
+        self.load()
+        atexit.register(self.flush)
+
+    def _read(self, region, addr, n):
+        # Straight to the device, not through the cache
+        return self.gxs._mem_r(region, addr, n)
+
+    def load(self):
+        '''Validate the on disk copy against the device, re-reading everything if it doesn't match'''
+        versions = self.gxs.versions()
+        hdr = dict((region, self._read(region, 0, n)) for region, n in HEADER.items())
+        sn = nulls(hdr['flash'], 0x0C) or 'unknown'
+        self.fn = os.path.join(self.dir, '%s_%s_%s_%s.json' % (
+                sn, ver_str(versions['mcu']), ver_str(versions['fpga']), ver_str(versions['fpga_wg'])))
+
+        data = {}
+        if os.path.exists(self.fn):
+            try:
+                j = json.load(open(self.fn))
+                data = dict((region, bytearray(binascii.unhexlify(j[region]))) for region in REGIONS)
+            except (ValueError, KeyError, TypeError) as e:
+                print 'WARNING: bad snapshot %s: %s' % (self.fn, e)
+                data = {}
+        if data and all(str(data[region][0:n]) == hdr[region] for region, n in HEADER.items()):
+            self.data = data
+            print 'Snapshot cache hit: %s' % self.fn
+        else:
+            self.refresh()
+
+    def refresh(self):
+        '''Re-read all regions and save them'''
+        print 'Snapshot cache miss, reading flash / EEPROM'
+        self.data = dict((region, bytearray(self._read(region, 0, n))) for region, n in REGIONS.items())
+        self.save()
+
+    def flush(self):
+        '''Save if written to'''
+        if self.dirty:
+            self.save()
+
+    def save(self):
+        if not os.path.exists(self.dir):
+            os.makedirs(self.dir)
+        j = dict((region, binascii.hexlify(self.data[region])) for region in REGIONS)
+        # Write then rename so a crash doesn't leave half a snapshot
+        tmp = self.fn + '.tmp'
+        json.dump(j, open(tmp, 'w'), sort_keys=True)
+        os.rename(tmp, self.fn)
+        self.dirty = False
+
+    def read(self, region, addr, n):
+        '''Cached bytes, None if not covered'''
+        data = self.data.get(region)
+        if data is None or addr < 0 or addr + n > len(data):
+            return None
+        return str(data[addr:addr + n])
+
+    def written(self, region, addr, buff):
+        '''Host wrote buff at addr, update the copy'''
+        data = self.data.get(region)
+        if data is None:
+            return
+        if addr + len(buff) > len(data):
+            # Past what we keep (ex: EEPROM wraparound), don't guess
+            self.invalidate()
+            return
+        data[addr:addr + len(buff)] = buff
+        self.dirty = True
+
+    def invalidate(self):
+        '''Forget everything, next load() re-reads'''
+        self.data = {}
+        self.dirty = False
+        if self.fn and os.path.exists(self.fn):
+            os.remove(self.fn)
@@ -0,0 +1,153 @@
+'''
+Background sensor state monitor
+
+One thread per device samples state (and less often error) and publishes transitions
+(see sensor_sm.py) to subscribers and waiters
+so capture code doesn't need its own polling loops:
+    gxs.mon_start()
+    gxs.mon.subscribe(lambda old, new, t: ...)
+    gxs.mon.wait_state(STATE_READY, timeout=30)
+
+Sampling uses the same prediction as TrigWait: slow while idle,
+fast only around when STATE_READY is expected
+Samples take the GXS700 lock so they queue behind operations (_init, readout, batched()...)
+instead of landing in the middle of them
+'''
+
+import threading
+import time
+import traceback
+from collections import deque
+from deadline import Timeout
+from sensor_sm import STATE_IDLE, STATE_READY, state_str
+
+class StateMonitor(threading.Thread):
+    def __init__(self, gxs, trig_wait=None, history=256):
+        threading.Thread.__init__(self, name='gxs700 state monitor')
+        self.daemon = True
+        self.gxs = gxs
+        # Polling cadence and state timing, see gxs700.TrigWait
+        self.tw = trig_wait or gxs.trig_wait
+
+        self.cond = threading.Condition()
+        # Last sample and when we entered it
+        self.state = None
+        self.tstate = None
+        # When the sensor left idle, None while idle
+        self.tbusy = None
+        # Last non-zero error code, until clear_error()
+        self.error = 0
+        # Non-zero error samples, lets waiters only fail on errors seen while they wait
+        self.errors = 0
+        # Samples taken, lets waiters tell a fresh sample from a stale one
+        self.samples = 0
+        # Exception that killed the thread
+        self.exc = None
+        # (t, old, new)
+        self.transitions = deque(maxlen=history)
+        self.subscribers = []
+        self.running = True
+
+    def subscribe(self, cb):
+        '''cb(old, new, t) on every transition, called from the monitor thread'''
+        self.subscribers.append(cb)
+
+    def unsubscribe(self, cb):
+        self.subscribers.remove(cb)
+
+    def stop(self):
+        self.running = False
+        self.join()
+
+    def clear_error(self):
+        with self.cond:
+            self.error = 0
+
+    def run(self):
+        terr = 0
+        try:
+            while self.running:
+                # Not state() / error(): they return stale values while an operation is running
+                state = self.gxs._state_sample()
+                now = time.time()
+                if now - terr >= self.tw.err_poll:
+                    terr = now
+                    e = self.gxs._error_sample()
+                else:
+                    e = 0
+
+                with self.cond:
+                    old = self.state
+                    if state != old:
+                        self.state = state
+                        self.tstate = now
+                        self.transitions.append((now, old, state))
+                        if state == STATE_IDLE:
+                            self.tbusy = None
+                        elif self.tbusy is None:
+                            self.tbusy = now
+                    if e:
+                        self.error = e
+                        self.errors += 1
+                    self.samples += 1
+                    self.cond.notify_all()
+                if state != old:
+                    for cb in list(self.subscribers):
+                        try:
+                            cb(old, state, now)
+                        except Exception:
+                            # A bad subscriber shouldn't stop sampling for every waiter
+                            print 'WARNING: state monitor subscriber failed'
+                            traceback.print_exc()
+
+                tready = self.tw.predict(state, self.tstate)
+                if state == STATE_READY or tready is None:
+                    time.sleep(self.tw.idle_poll)
+                else:
+                    time.sleep(max(self.tw.fast_poll, min(self.tw.idle_poll * 10, tready - self.tw.margin - now)))
+        except Exception as e:
+            with self.cond:
+                self.exc = e
+                self.cond.notify_all()
+            raise
+
+    def wait_state(self, states, timeout=None, deadline=None, busy_timeout=None):
+        '''
+        Block until a sample shows one of states (int or tuple)
+        deadline: optional Deadline, checked while waiting
+        busy_timeout: give up if the sensor has been out of idle this long (during this wait) without getting there
+        Returns (state, time entered)
+        '''
+        if isinstance(states, int):
+            states = (states,)
+        tstart = time.time()
+        tend = None if timeout is None else tstart + timeout
+        with self.cond:
+            # Don't trust a sample taken before we were called
+            samples = self.samples
+            # Nor an error from before: the baseline poll only failed on the error it saw
+            errors = self.errors
+            while True:
+                if deadline is not None:
+                    deadline.check('State wait')
+                if self.exc:
+                    raise Exception('State monitor died: %s' % (self.exc,))
+                if self.errors != errors:
+                    raise Exception('Unexpected error %s' % (self.error,))
+                if self.samples != samples and self.state in states:
+                    return self.state, self.tstate
+                if busy_timeout is not None and self.tbusy is not None \
+                        and time.time() - max(self.tbusy, tstart) > busy_timeout:
+                    raise Timeout('Timed out waiting for state %s, stuck in state %s' % (
+                            ', '.join(state_str(s) for s in states), state_str(self.state)))
+                # Condition.wait() without timeout can't be interrupted
+                wait = 1.0
+                if tend is not None:
+                    remain = tend - time.time()
+                    if remain <= 0:
+                        raise Timeout('Timed out waiting for state %s' % (', '.join(state_str(s) for s in states),))
+                    wait = min(wait, remain)
+                if deadline is not None:
+                    # Notice cancellation reasonably quickly
+                    wait = min(wait, 0.1)
+                self.cond.wait(wait)
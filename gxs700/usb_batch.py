@@ -0,0 +1,162 @@
+'''
+Pipelined control transfers
+
+Setup sequences (FPGA tables, firmware loads, capture re-arm) are long runs of
+vendor writes whose results we don't look at.
+Instead of a full round trip per write, queue them as async control transfers
+with a bounded number in flight.
+EP0 completes transfers in the order they were submitted so ordering is preserved
+
+ControlBatch has the same controlWrite / controlRead signature as a device handle
+so it can be dropped in where a dev is expected (like USBDbg in capture_lib.py)
+Reads that nothing queued depends on (ex: memory dumps) can be pipelined too with controlReadAsync()
+
+Completions may be handled on another thread (ex: multi.EventThread) while the owner keeps queueing
+so queue state is only touched with self.lock held
+Read callbacks are called from whatever thread handles the event, without the lock
+'''
+
+# https://github.com/vpelletier/python-libusb1
+# Python-ish (classes, exceptions, ...) wrapper around libusb1.py . See docstrings (pydoc recommended) for usage.
+import usb1
+# Bare ctype wrapper, inspired from library C header file.
+import libusb1
+import threading
+
+class BatchError(Exception):
+    def __init__(self, index, status, req):
+        Exception.__init__(self, 'Control transfer %d (req 0x%02X, value 0x%04X, index 0x%04X) failed with status %d' % (
+                index, req[1], req[2], req[3], status))
+        # Position of the failed transfer in submission order
+        self.index = index
+        self.status = status
+        self.req = req
+
+class ControlBatch:
+    def __init__(self, usbcontext, dev, depth=8, timeout=1000):
+        self.usbcontext = usbcontext
+        self.dev = dev
+        # Max number of transfers in flight
+        self.depth = depth
+        self.timeout = timeout
+
+        # Not yet submitted: (n, (request_type, request, value, index, data or read length), timeout, callback, short_ok)
+        self.pending = []
+        self.inflight = 0
+        # Number of transfers queued so far
+        self.n = 0
+        # First failure as BatchError
+        self.failed = None
+        # Transfers to reuse
+        self.free = []
+        self.trans_l = []
+        # Covers pending, inflight, n, failed, free and trans_l
+        self.lock = threading.RLock()
+
+    def _queue(self, req, timeout, callback, short_ok=False):
+        with self.lock:
+            self.pending.append((self.n, req, timeout, callback, short_ok))
+            self.n += 1
+            self._pump()
+
+    def controlWrite(self, request_type, request, value, index, data, timeout=None):
+        '''Queue a write.  Errors are reported by flush()'''
+        self._queue((request_type, request, value, index, data), timeout, None)
+        return len(data)
+
+    def controlReadAsync(self, request_type, request, value, index, length, callback, timeout=None, short_ok=False):
+        '''
+        Queue a read, callback(data) is called when it completes
+        Short reads count as failures and are reported by flush()
+        unless short_ok, then callback gets what was returned like controlRead()
+        '''
+        self._queue((request_type, request, value, index, length), timeout, callback, short_ok)
+
+    def controlRead(self, request_type, request, value, index, length, timeout=0):
+        '''Reads depend on everything before them so flush then read synchronously'''
+        self.flush()
+        return self.dev.controlRead(request_type, request, value, index, length, timeout=timeout)
+
+    def getTransfer(self):
+        return self.dev.getTransfer()
+
+    def _get_transfer(self):
+        if self.free:
+            return self.free.pop()
+        trans = self.dev.getTransfer()
+        self.trans_l.append(trans)
+        return trans
+
+    def _pump(self):
+        # Pop and submit under the lock so transfers go out in queue order
+        # whichever thread gets here first
+        with self.lock:
+            while self.pending and self.inflight < self.depth and self.failed is None:
+                n, req, timeout, callback, short_ok = self.pending.pop(0)
+                if timeout is None:
+                    timeout = self.timeout
+                trans = self._get_transfer()
+                request_type, request, value, index, data = req
+                trans.setControl(request_type, request, value, index, data,
+                        callback=self._cb, user_data=(n, req, callback, short_ok), timeout=timeout)
+                trans.submit()
+                self.inflight += 1
+
+    def _cb(self, trans):
+        n, req, callback, short_ok = trans.getUserData()
+        status = trans.getStatus()
+        if callback:
+            want = req[4]
+        else:
+            want = len(req[4])
+        if short_ok:
+            want = min(want, trans.getActualLength())
+        data = None
+        with self.lock:
+            self.inflight -= 1
+            if status != libusb1.LIBUSB_TRANSFER_COMPLETED or trans.getActualLength() != want:
+                # Keep the earliest one, later ones are likely fallout
+                if self.failed is None or n < self.failed.index:
+                    self.failed = BatchError(n, status, req)
+            elif callback:
+                data = str(trans.getBuffer()[:want])
+            self.free.append(trans)
+        if data is not None:
+            callback(data)
+        self._pump()
+
+    def _wait(self):
+        while self.inflight:
+            self.usbcontext.handleEventsTimeout(tv=0.1)
+
+    def flush(self):
+        '''Wait for everything queued to complete, raising BatchError on the first failure'''
+        while True:
+            self._pump()
+            if not self.inflight:
+                break
+            self._wait()
+        with self.lock:
+            failed = self.failed
+            if failed:
+                # Don't send anything that was queued after the failure
+                del self.pending[:]
+                self.failed = None
+        if failed:
+            raise failed
+
+    def abort(self):
+        '''Drop anything not yet submitted and wait for in flight transfers'''
+        with self.lock:
+            del self.pending[:]
+        self._wait()
+        with self.lock:
+            self.failed = None
+
+    def close(self):
+        self.abort()
+        with self.lock:
+            for trans in self.trans_l:
+                trans.close()
+            self.trans_l = []
+            self.free = []
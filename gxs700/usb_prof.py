@@ -0,0 +1,181 @@
+'''
+Per request USB latency profiling
+
+Wraps a device handle the same way USBDbg in capture_lib.py does:
+    dev = usb_prof.USBProf(open_dev(usbcontext))
+    gxs = gxs700.GXS700(usbcontext, dev)
+
+Everything goes to 0xB0 so stats are keyed by (bmRequestType, bRequest, wValue)
+for 0xB0 (wValue is the actual command: 0x20 state, 0x23 w/h, 0x40 image counter...)
+and (bmRequestType, bRequest) otherwise (ex: 0xA0 where wValue is a RAM address)
+Async transfers (bulk frame reads, ControlBatch) are timed from submit to callback
+
+Bookkeeping is a dict lookup and a few adds per transfer so its fine to leave on
+Async callbacks may run on another thread (multi.EventThread) so stats are updated under a lock
+'''
+
+import atexit
+import csv
+import sys
+import threading
+import time
+
+# Latency histogram buckets are powers of 2 microseconds
+# bucket n: [2**(n-1), 2**n) us, bucket 0: < 1 us
+HIST_BUCKETS = 32
+
+class ReqStats:
+    def __init__(self, lock):
+        # USBProf.lock, shared by every request's stats
+        self.lock = lock
+        self.count = 0
+        self.bytes = 0
+        self.errors = 0
+        # Seconds
+        self.total = 0.0
+        self.max = 0.0
+        self.hist = [0] * HIST_BUCKETS
+
+    def add(self, dt, n):
+        with self.lock:
+            self.count += 1
+            self.bytes += n
+            self.total += dt
+            if dt > self.max:
+                self.max = dt
+            self.hist[min(int(dt * 1e6).bit_length(), HIST_BUCKETS - 1)] += 1
+
+    def error(self):
+        with self.lock:
+            self.errors += 1
+
+    def percentile(self, p):
+        '''Upper bound in seconds of the bucket holding the p (0 to 1) percentile'''
+        want = p * self.count
+        seen = 0
+        for i, n in enumerate(self.hist):
+            seen += n
+            if n and seen >= want:
+                return (1 << i) / 1e6
+        return 0.0
+
+def key_str(k):
+    if k[0] == 'bulk':
+        return 'bulk 0x%02X' % k[1]
+    if k[2] is None:
+        return '%02X %02X' % (k[0], k[1])
+    return '%02X %02X/%02X' % k
+
+class USBProf:
+    def __init__(self, dev, report_at_exit=True, csv_fn=None):
+        self.dev = dev
+        self.stats = {}
+        # Guards stats and every ReqStats in it
+        self.lock = threading.Lock()
+        self.tstart = time.time()
+        if report_at_exit or csv_fn:
+            atexit.register(self._exit, report_at_exit, csv_fn)
+
+    def __getattr__(self, name):
+        # Anything we don't profile (close(), claimInterface(), ...)
+        return getattr(self.dev, name)
+
+    def _stat_key(self, k):
+        with self.lock:
+            ret = self.stats.get(k)
+            if ret is None:
+                ret = self.stats[k] = ReqStats(self.lock)
+            return ret
+
+    def _stat(self, request_type, request, value):
+        if request == 0xB0:
+            return self._stat_key((request_type, request, value))
+        return self._stat_key((request_type, request, None))
+
+    def controlWrite(self, request_type, request, value, index, data, timeout=0):
+        stat = self._stat(request_type, request, value)
+        t = time.time()
+        try:
+            ret = self.dev.controlWrite(request_type, request, value, index, data, timeout=timeout)
+        except:
+            stat.error()
+            raise
+        stat.add(time.time() - t, len(data))
+        return ret
+
+    def controlRead(self, request_type, request, value, index, length, timeout=0):
+        stat = self._stat(request_type, request, value)
+        t = time.time()
+        try:
+            ret = self.dev.controlRead(request_type, request, value, index, length, timeout=timeout)
+        except:
+            stat.error()
+            raise
+        stat.add(time.time() - t, len(ret))
+        return ret
+
+    def getTransfer(self, *args, **kwargs):
+        return ProfTransfer(self, self.dev.getTransfer(*args, **kwargs))
+
+    def report(self, f=sys.stdout):
+        '''Print stats sorted by total time spent'''
+        f.write('USB profile over %0.1f sec\n' % (time.time() - self.tstart,))
+        f.write('%-14s %8s %10s %6s %10s %9s %9s %9s %9s\n' % (
+                'request', 'count', 'bytes', 'errors', 'total ms', 'mean us', 'p50 us', 'p99 us', 'max us'))
+        with self.lock:
+            for k, s in sorted(self.stats.items(), key=lambda ks: ks[1].total, reverse=True):
+                f.write('%-14s %8d %10d %6d %10.1f %9.0f %9.0f %9.0f %9.0f\n' % (
+                        key_str(k), s.count, s.bytes, s.errors, s.total * 1e3,
+                        s.total / max(s.count, 1) * 1e6, s.percentile(0.5) * 1e6,
+                        s.percentile(0.99) * 1e6, s.max * 1e6))
+
+    def write_csv(self, fn):
+        '''One row per request, histogram buckets as trailing columns'''
+        w = csv.writer(open(fn, 'wb'))
+        w.writerow(['request', 'count', 'bytes', 'errors', 'total_s', 'max_s'] +
+                ['lt_%dus' % (1 << i,) for i in xrange(HIST_BUCKETS)])
+        with self.lock:
+            for k, s in sorted(self.stats.items(), key=lambda ks: ks[1].total, reverse=True):
+                w.writerow([key_str(k), s.count, s.bytes, s.errors, '%0.6f' % s.total, '%0.6f' % s.max] + s.hist)
+
+    def _exit(self, report, csv_fn):
+        if report:
+            self.report()
+        if csv_fn:
+            self.write_csv(csv_fn)
+
+class ProfTransfer:
+    '''Times async transfers from submit() to completion callback'''
+    def __init__(self, prof, trans):
+        self.prof = prof
+        self.trans = trans
+        self.stat = None
+        self.tsubmit = None
+
+    def __getattr__(self, name):
+        return getattr(self.trans, name)
+
+    def _wrap_cb(self, callback):
+        def cb(_trans):
+            # Actual length isn't meaningful for every transfer type, buffer length is close enough
+            if self.tsubmit is not None:
+                self.stat.add(time.time() - self.tsubmit, self.trans.getActualLength())
+                self.tsubmit = None
+            if callback:
+                # Hand back the wrapper so resubmits get timed too
+                callback(self)
+        return cb
+
+    def setControl(self, request_type, request, value, index, buffer_or_len, callback=None, user_data=None, timeout=0):
+        self.stat = self.prof._stat(request_type, request, value)
+        self.trans.setControl(request_type, request, value, index, buffer_or_len,
+                callback=self._wrap_cb(callback), user_data=user_data, timeout=timeout)
+
+    def setBulk(self, endpoint, buffer_or_len, callback=None, user_data=None, timeout=0):
+        self.stat = self.prof._stat_key(('bulk', endpoint))
+        self.trans.setBulk(endpoint, buffer_or_len,
+                callback=self._wrap_cb(callback), user_data=user_data, timeout=timeout)
+
+    def submit(self):
+        self.tsubmit = time.time()
+        self.trans.submit()
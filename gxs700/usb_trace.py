@@ -0,0 +1,355 @@
+'''
+In-process USB trace recording and replay
+
+Record everything GXS700 sends without usbmon:
+    dev = usb_trace.USBTrace(open_dev(usbcontext), 'run.gxt')
+    gxs = gxs700.GXS700(usbcontext, dev)
+
+File format: 8 byte header then append-only records
+    header: 'GXTR' + '<HH' version, reserved
+    record: REC_FMT + payload
+        kind: 'W' control write (payload: data written)
+              'R' control read (payload: data returned)
+              'B' bulk in (payload: data returned, omitted unless bulk_data)
+        t: seconds since trace was opened
+        request_type/request/value/index: control setup, bulk uses request_type for endpoint
+        length: bytes requested (R, B) or written (W)
+        status: 0 OK, else the transfer failed
+        plen: payload bytes that follow
+
+Replay against the real device or TraceSim (which answers from the trace)
+at recorded or maximum speed:
+    python usb_trace.py replay run.gxt --sim --max-speed
+'''
+
+# https://github.com/vpelletier/python-libusb1
+# Python-ish (classes, exceptions, ...) wrapper around libusb1.py . See docstrings (pydoc recommended) for usage.
+import usb1
+# Bare ctype wrapper, inspired from library C header file.
+import libusb1
+import argparse
+import atexit
+import binascii
+import os
+import struct
+import threading
+import time
+from collections import namedtuple
+
+MAGIC = 'GXTR'
+VERSION = 1
+HDR_FMT = '<4sHH'
+HDR_SZ = struct.calcsize(HDR_FMT)
+REC_FMT = '<cdBBHHIbI'
+REC_SZ = struct.calcsize(REC_FMT)
+
+Record = namedtuple('Record', ('kind', 't', 'request_type', 'request', 'value', 'index', 'length', 'status', 'payload'))
+
+class TraceWriter:
+    def __init__(self, fn):
+        # Times are relative to when the file was started, appending would restart them mid file
+        if os.path.exists(fn) and os.path.getsize(fn) != 0:
+            raise Exception('%s already has a trace, refusing to append' % fn)
+        self.f = open(fn, 'wb')
+        self.f.write(struct.pack(HDR_FMT, MAGIC, VERSION, 0))
+        self.tstart = time.time()
+        # Sync transfers and transfer callbacks (event / monitor threads) record concurrently
+        self.lock = threading.Lock()
+        atexit.register(self.close)
+
+    def write(self, kind, request_type, request, value, index, length, status, payload=''):
+        with self.lock:
+            self.f.write(struct.pack(REC_FMT, kind, time.time() - self.tstart,
+                    request_type, request, value, index, length, status, len(payload)))
+            if payload:
+                self.f.write(payload)
+
+    def close(self):
+        with self.lock:
+            if not self.f.closed:
+                self.f.close()
+
+def read_trace(fn):
+    '''Yield Record's from a trace file'''
+    f = open(fn, 'rb')
+    magic, version, _reserved = struct.unpack(HDR_FMT, f.read(HDR_SZ))
+    if magic != MAGIC:
+        raise Exception('%s: not a trace file' % fn)
+    if version != VERSION:
+        raise Exception('%s: unsupported trace version %d' % (fn, version))
+    while True:
+        buff = f.read(REC_SZ)
+        if not buff:
+            break
+        if len(buff) != REC_SZ:
+            # Writer died mid record
+            print 'WARNING: truncated trace'
+            break
+        fields = struct.unpack(REC_FMT, buff)
+        payload = f.read(fields[-1])
+        yield Record(*(fields[:-1] + (payload,)))
+
+class USBTrace:
+    '''Device handle wrapper recording every transfer'''
+    def __init__(self, dev, fn, bulk_data=False):
+        self.dev = dev
+        self.w = TraceWriter(fn)
+        # Frames are 5 MB, only keep their contents if asked
+        self.bulk_data = bulk_data
+
+    def __getattr__(self, name):
+        return getattr(self.dev, name)
+
+    def controlWrite(self, request_type, request, value, index, data, timeout=0):
+        try:
+            ret = self.dev.controlWrite(request_type, request, value, index, data, timeout=timeout)
+        except:
+            self.w.write('W', request_type, request, value, index, len(data), -1, data)
+            raise
+        self.w.write('W', request_type, request, value, index, len(data), 0, data)
+        return ret
+
+    def controlRead(self, request_type, request, value, index, length, timeout=0):
+        try:
+            ret = self.dev.controlRead(request_type, request, value, index, length, timeout=timeout)
+        except:
+            self.w.write('R', request_type, request, value, index, length, -1)
+            raise
+        self.w.write('R', request_type, request, value, index, length, 0, ret)
+        return ret
+
+    def getTransfer(self, *args, **kwargs):
+        return TraceTransfer(self, self.dev.getTransfer(*args, **kwargs))
+
+class TraceTransfer:
+    '''Records async bulk transfers as they complete'''
+    def __init__(self, trace, trans):
+        self.trace = trace
+        self.trans = trans
+        self.endpoint = None
+        self.length = 0
+
+    def __getattr__(self, name):
+        return getattr(self.trans, name)
+
+    def setBulk(self, endpoint, buffer_or_len, callback=None, user_data=None, timeout=0):
+        self.endpoint = endpoint
+        self.length = buffer_or_len if isinstance(buffer_or_len, int) else len(buffer_or_len)
+        def cb(_trans):
+            status = self.trans.getStatus()
+            if status == libusb1.LIBUSB_TRANSFER_COMPLETED:
+                buff = self.trans.getBuffer()[:self.trans.getActualLength()]
+                self.trace.w.write('B', endpoint, 0, 0, 0, self.length, 0,
+                        buff if self.trace.bulk_data else '')
+            elif status != libusb1.LIBUSB_TRANSFER_CANCELLED:
+                self.trace.w.write('B', endpoint, 0, 0, 0, self.length, status)
+            if callback:
+                callback(self)
+        self.trans.setBulk(endpoint, buffer_or_len, callback=cb, user_data=user_data, timeout=timeout)
+
+    def setControl(self, request_type, request, value, index, buffer_or_len, callback=None, user_data=None, timeout=0):
+        '''Async control transfers, ex: from ControlBatch'''
+        def cb(_trans):
+            status = self.trans.getStatus()
+            if status == libusb1.LIBUSB_TRANSFER_COMPLETED:
+                status = 0
+            if status != libusb1.LIBUSB_TRANSFER_CANCELLED:
+                if request_type & 0x80:
+                    buff = self.trans.getBuffer()[:self.trans.getActualLength()] if status == 0 else ''
+                    self.trace.w.write('R', request_type, request, value, index, buffer_or_len, status, buff)
+                else:
+                    self.trace.w.write('W', request_type, request, value, index, len(buffer_or_len), status, buffer_or_len)
+            if callback:
+                callback(self)
+        self.trans.setControl(request_type, request, value, index, buffer_or_len,
+                callback=cb, user_data=user_data, timeout=timeout)
+
+class TraceSim:
+    '''
+    Simulated device answering reads from a trace
+    Reads return the next recorded response for the same (type, request, value, index),
+    repeating the last one once they run out
+    Also acts as its own USB context so it can be passed to GXS700:
+        sim = TraceSim('run.gxt')
+        gxs = gxs700.GXS700(sim, sim)
+    '''
+    def __init__(self, fn):
+        # (request_type, request, value, index) => [payload, ...]
+        self.reads = {}
+        self.bulk = []
+        for rec in read_trace(fn):
+            if rec.status:
+                continue
+            if rec.kind == 'R':
+                self.reads.setdefault((rec.request_type, rec.request, rec.value, rec.index), []).append(rec.payload)
+            elif rec.kind == 'B':
+                self.bulk.append(rec.payload or ('\x00' * rec.length))
+        self.submitted = []
+
+    def controlWrite(self, request_type, request, value, index, data, timeout=0):
+        return len(data)
+
+    def controlRead(self, request_type, request, value, index, length, timeout=0):
+        q = self.reads.get((request_type, request, value, index))
+        if not q:
+            raise usb1.USBErrorPipe()
+        if len(q) > 1:
+            return q.pop(0)[:length]
+        return q[0][:length]
+
+    def bulkRead(self, endpoint, length, timeout=0):
+        if not self.bulk:
+            raise usb1.USBErrorTimeout()
+        return self.bulk.pop(0)[:length]
+
+    def getTransfer(self, *args, **kwargs):
+        return SimTransfer(self)
+
+    def handleEventsTimeout(self, tv=0):
+        pending = self.submitted
+        self.submitted = []
+        for trans in pending:
+            trans.complete()
+
+    def close(self):
+        pass
+
+class SimTransfer:
+    def __init__(self, sim):
+        self.sim = sim
+        self.status = libusb1.LIBUSB_TRANSFER_COMPLETED
+        self.buff = ''
+
+    def setBulk(self, endpoint, buffer_or_len, callback=None, user_data=None, timeout=0):
+        self.endpoint = endpoint
+        self.length = buffer_or_len if isinstance(buffer_or_len, int) else len(buffer_or_len)
+        self.callback = callback
+        self.user_data = user_data
+        self.control = None
+
+    def setControl(self, request_type, request, value, index, buffer_or_len, callback=None, user_data=None, timeout=0):
+        self.control = (request_type, request, value, index, buffer_or_len)
+        self.callback = callback
+        self.user_data = user_data
+
+    def submit(self):
+        self.status = libusb1.LIBUSB_TRANSFER_COMPLETED
+        self.sim.submitted.append(self)
+
+    def cancel(self):
+        if self in self.sim.submitted:
+            self.status = libusb1.LIBUSB_TRANSFER_CANCELLED
+
+    def complete(self):
+        if self.status == libusb1.LIBUSB_TRANSFER_COMPLETED:
+            try:
+                if self.control is None:
+                    self.buff = self.sim.bulkRead(self.endpoint, self.length)
+                else:
+                    request_type, request, value, index, buffer_or_len = self.control
+                    if request_type & 0x80:
+                        self.buff = self.sim.controlRead(request_type, request, value, index, buffer_or_len)
+                    else:
+                        self.buff = buffer_or_len
+                        self.sim.controlWrite(request_type, request, value, index, buffer_or_len)
+            except usb1.USBError:
+                self.status = libusb1.LIBUSB_TRANSFER_TIMED_OUT
+                self.buff = ''
+        if self.callback:
+            self.callback(self)
+
+    def getStatus(self):
+        return self.status
+
+    def getBuffer(self):
+        return self.buff
+
+    def getActualLength(self):
+        return len(self.buff)
+
+    def getUserData(self):
+        return self.user_data
+
+    def isSubmitted(self):
+        return self in self.sim.submitted
+
+    def close(self):
+        pass
+
+def replay(fn, dev, realtime=True, check=True, verbose=False):
+    '''
+    Re-issue a trace against dev
+    realtime: keep the recorded spacing between transfers, otherwise go as fast as possible
+    check: compare read data against the recording
+    Transfers recorded as failed are expected to fail again, they're a mismatch if they go through
+    Returns (transfers, mismatches, seconds)
+    '''
+    n = 0
+    mismatches = 0
+    tstart = time.time()
+    for rec in read_trace(fn):
+        if realtime:
+            dt = tstart + rec.t - time.time()
+            if dt > 0:
+                time.sleep(dt)
+        if verbose:
+            print '%0.6f %s %02X %02X %04X %04X %d' % (rec.t, rec.kind, rec.request_type, rec.request, rec.value, rec.index, rec.length)
+        try:
+            if rec.kind == 'W':
+                dev.controlWrite(rec.request_type, rec.request, rec.value, rec.index, rec.payload, timeout=1000)
+                buff = None
+            elif rec.kind == 'R':
+                buff = dev.controlRead(rec.request_type, rec.request, rec.value, rec.index, rec.length, timeout=1000)
+            elif rec.kind == 'B':
+                buff = dev.bulkRead(rec.request_type, rec.length, timeout=1000)
+            else:
+                raise Exception('Unknown record type %r' % (rec.kind,))
+        except usb1.USBError:
+            if not rec.status:
+                raise
+            # Failed when recorded too (stall, timeout...)
+            n += 1
+            continue
+        n += 1
+
+        if rec.status:
+            if check:
+                mismatches += 1
+                print 'Mismatch at %0.6f: %s %02X %02X %04X %04X recorded status %d, now OK' % (
+                        rec.t, rec.kind, rec.request_type, rec.request, rec.value, rec.index, rec.status)
+        elif rec.kind == 'R':
+            if check and buff != rec.payload:
+                mismatches += 1
+                print 'Mismatch at %0.6f: %02X %02X %04X %04X' % (rec.t, rec.request_type, rec.request, rec.value, rec.index)
+                print '  Expected: %s' % binascii.hexlify(rec.payload)
+                print '  Actual:   %s' % binascii.hexlify(buff)
+        elif rec.kind == 'B':
+            if check and rec.payload and buff != rec.payload:
+                mismatches += 1
+                print 'Mismatch at %0.6f: bulk 0x%02X' % (rec.t, rec.request_type)
+    return n, mismatches, time.time() - tstart
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Dump or replay a USB trace')
+    parser.add_argument('--verbose', '-v', action='store_true', help='verbose')
+    parser.add_argument('--sim', action='store_true', help='replay against a simulator built from the trace')
+    parser.add_argument('--max-speed', action='store_true', help="don't keep recorded timing")
+    parser.add_argument('--no-check', action='store_true', help="don't compare read data")
+    parser.add_argument('action', choices=('dump', 'replay'))
+    parser.add_argument('fn', help='trace file')
+    args = parser.parse_args()
+
+    if args.action == 'dump':
+        for rec in read_trace(args.fn):
+            print '%0.6f %s %02X %02X %04X %04X len %d status %d: %s' % (
+                    rec.t, rec.kind, rec.request_type, rec.request, rec.value, rec.index,
+                    rec.length, rec.status, binascii.hexlify(rec.payload[:32]))
+    else:
+        if args.sim:
+            dev = TraceSim(args.fn)
+        else:
+            from util import open_dev
+            dev = open_dev(usb1.USBContext())
+        n, mismatches, dt = replay(args.fn, dev, realtime=not args.max_speed,
+                check=not args.no_check, verbose=args.verbose)
+        print 'Replayed %d transfers in %0.3f sec, %d mismatches' % (n, dt, mismatches)
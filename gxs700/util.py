@@ -4,36 +4,47 @@ import usb1
 # Bare ctype wrapper, inspired from library C header file.
 import libusb1
 import sys
-import load_firmware
-
-pidvid2name = {
-        #(0x5328, 0x2009): 'Dexis Platinum (pre-enumeration)'
-        # note: load_firmware.py loads the gendex firmware
-        (0x5328, 0x2030): 'Gendex GXS700 (post enumeration)',
-        # some sort of auto-load mode I activated by accident
-        # no fxload required
-        #(0x5328, 0x2010): 'temp',
-        #(0x5328, 0x202F): 'Gendex GXS700 (pre-enumeration)'
-        }
+import discovery
+import firmware
+
+# Post enumeration (vid, pid) => name, from firmware.REGISTRY
+# some sort of auto-load mode I activated by accident
+# no fxload required
+#(0x5328, 0x2010): 'temp',
+pidvid2name = firmware.post_pidvid2name()
+
+def find_devices(usbcontext=None, busaddrs=None):
+    '''
+    Return all post enumeration devices
+    busaddrs: if given, only devices whose (bus, address) is in it
+    '''
+    # Kept up to date by hotplug events instead of walking the device list every call
+    ret = []
+    for udev in discovery.get(usbcontext).devices(pidvid2name.keys()):
+        if busaddrs is not None and (udev.getBusNumber(), udev.getDeviceAddress()) not in busaddrs:
+            continue
+        ret.append(udev)
+    return ret
 
 def check_device(usbcontext=None):
-    if usbcontext is None:
-        usbcontext = usb1.USBContext()
-    
-    for udev in usbcontext.getDeviceList(skip_on_error=True):
-        vid = udev.getVendorID()
-        pid = udev.getProductID()
-        if (vid, pid) in pidvid2name.keys():
-            print
-            print
-            print 'Found device'
-            print 'Bus %03i Device %03i: ID %04x:%04x' % (
-                udev.getBusNumber(),
-                udev.getDeviceAddress(),
-                vid,
-                pid)
-            return udev
-    return None
+    udevs = find_devices(usbcontext)
+    if not udevs:
+        return None
+    udev = udevs[0]
+    print
+    print
+    print 'Found device'
+    print 'Bus %03i Device %03i: ID %04x:%04x' % (
+        udev.getBusNumber(),
+        udev.getDeviceAddress(),
+        udev.getVendorID(),
+        udev.getProductID())
+    return udev
+
+def parse_busaddr(s):
+    '''"bus:address" (lsusb numbering) => (bus, address)'''
+    bus, addr = s.split(':')
+    return (int(bus, 10), int(addr, 10))
 
 def open_dev(usbcontext=None):
     '''
@@ -44,7 +55,7 @@ def open_dev(usbcontext=None):
         usbcontext = usb1.USBContext()
     
     print 'Checking if firmware load is needed'
-    if load_firmware.load_all(wait=True):
+    if firmware.load_all(wait=True):
         pass
     else:
         print 'Firmware load not needed'
@@ -57,6 +68,39 @@ def open_dev(usbcontext=None):
     dev = udev.open()
     return dev
 
+def open_devs(usbcontext=None, busaddrs=None):
+    '''
+    Return [(udev, dev)] for every device (or those in busaddrs) with the firmware loaded
+    '''
+    
+    if usbcontext is None:
+        usbcontext = usb1.USBContext()
+    
+    print 'Checking if firmware load is needed'
+    if not firmware.load_all(wait=True):
+        print 'Firmware load not needed'
+    
+    print 'Scanning for devices...'
+    ret = []
+    for udev in find_devices(usbcontext, busaddrs):
+        print 'Bus %03i Device %03i: ID %04x:%04x' % (
+            udev.getBusNumber(),
+            udev.getDeviceAddress(),
+            udev.getVendorID(),
+            udev.getProductID())
+        ret.append((udev, udev.open()))
+    if not ret:
+        raise Exception("Failed to find a device")
+    return ret
+
+def nulls(s, offset):
+    '''String at offset up to the first NUL'''
+    end = s.find('\x00', offset)
+    if end < 0:
+        return s[offset:]
+    else:
+        return s[offset:end]
+
 def hexdumps(*args, **kwargs):
     '''Hexdump by returning a string'''
     buff = StringIO.StringIO()